@@ -19,6 +19,7 @@
         "security/portal_employee_security.xml",
         "data/portal_data.xml",
         "data/attendance_cron.xml",  # Auto-checkout cron job
+        "data/dashboard_snapshot_cron.xml",  # Stale dashboard snapshot refresh
         # "data/expense_categories.xml",  # Default expense categories
         "views/menu.xml",
         "views/portal_layout.xml",
@@ -1,8 +1,48 @@
 # controllers/access_helpers.py
 from odoo import http
 from odoo.http import request
+import time
 import werkzeug
 
+# Seconds the current employee (and its portal access flags) stay cached in
+# the session before being re-read, so access changes apply within a minute.
+EMPLOYEE_SESSION_TTL = 60
+_EMPLOYEE_CACHE_KEY = 'ess_current_employee'
+
+
+def _get_employee_info():
+    """
+    Return ``{'uid', 'id', 'access': {field: bool}, 'ts'}`` for the current
+    user's employee. Resolved at most once per request (memoized on the
+    cursor) and reused from the session for EMPLOYEE_SESSION_TTL seconds.
+    """
+    cache = request.env.cr.cache
+    info = cache.get(_EMPLOYEE_CACHE_KEY)
+    if info and info['uid'] == request.env.uid:
+        return info
+
+    info = request.session.get(_EMPLOYEE_CACHE_KEY)
+    if not info or info.get('uid') != request.env.uid or time.time() - info.get('ts', 0) > EMPLOYEE_SESSION_TTL:
+        Employee = request.env['hr.employee'].sudo()
+        employee = Employee.search([('user_id', '=', request.env.uid)], limit=1)
+        access_fields = [name for name in Employee._fields if name.startswith('portal_access_')]
+        info = {
+            'uid': request.env.uid,
+            'id': employee.id,
+            'access': {name: bool(employee[name]) for name in access_fields} if employee else {},
+            'ts': time.time(),
+        }
+        request.session[_EMPLOYEE_CACHE_KEY] = info
+
+    cache[_EMPLOYEE_CACHE_KEY] = info
+    return info
+
+
+def get_current_employee():
+    """Return the current user's employee (sudo), or an empty recordset."""
+    employee_id = _get_employee_info()['id']
+    return request.env['hr.employee'].sudo().browse(employee_id or ())
+
 
 def check_portal_access(feature_name):
     """
@@ -21,12 +61,8 @@ def check_portal_access(feature_name):
             if request.env.user.has_group('base.group_user'):
                 return func(*args, **kwargs)
             
-            # Get the employee record for the current user
-            employee = request.env['hr.employee'].sudo().search([('user_id', '=', request.env.uid)], limit=1)
-            
-            # Check if employee has access to the feature
-            access_field = f'portal_access_{feature_name}'
-            if not employee or not hasattr(employee, access_field) or not getattr(employee, access_field):
+            # Check if the current employee has access to the feature
+            if not _get_employee_info()['access'].get(f'portal_access_{feature_name}'):
                 # No access - redirect to main portal page with warning
                 return request.redirect('/my?access_error=1')
             
@@ -52,12 +88,5 @@ def has_feature_access(feature_name):
     if request.env.user.has_group('base.group_user'):
         return True
         
-    # Get the employee record for the current user
-    employee = request.env['hr.employee'].sudo().search([('user_id', '=', request.env.uid)], limit=1)
-    
-    # Check if employee has access to the feature
-    access_field = f'portal_access_{feature_name}'
-    if not employee or not hasattr(employee, access_field) or not getattr(employee, access_field):
-        return False
-    
-    return True
+    # Check if the current employee has access to the feature
+    return bool(_get_employee_info()['access'].get(f'portal_access_{feature_name}'))
@@ -1,7 +1,11 @@
 # controllers/main.py
 from odoo import http, fields
-from odoo.http import request
-from .access_helpers import check_portal_access, has_feature_access
+from odoo.exceptions import UserError
+from odoo.http import content_disposition, request
+from .access_helpers import check_portal_access, get_current_employee, has_feature_access
+from urllib.parse import quote_plus
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound
+from collections import defaultdict
 import html
 import json
 import logging
@@ -10,6 +14,12 @@ import base64
 # Set up logger
 _logger = logging.getLogger(__name__)
 
+# Upload limits (bytes)
+TICKET_ATTACHMENT_MAX_SIZE = 50 * 1024 * 1024
+EMPLOYEE_DOCUMENT_MAX_SIZE = 10 * 1024 * 1024
+EMPLOYEE_PHOTO_MAX_SIZE = 5 * 1024 * 1024
+CRM_NOTE_ATTACHMENT_MAX_SIZE = 50 * 1024 * 1024
+
 # Constants for model names and URLs
 CRM_TAG_MODEL = 'crm.tag'
 CRM_REDIRECT_URL = '/my/employee/crm'
@@ -128,11 +138,11 @@ def _process_partner_field(field_value, field_name='partner_id'):
 
 class PortalEmployee(http.Controller):
     def _get_employee(self):
-        return request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        return get_current_employee()
 
     @http.route(MY_EMPLOYEE_URL, type='http', auth='user', website=True)
     def portal_employee_profile(self, **kw):
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         return request.render('employee_self_service_portal.portal_employee_profile_personal', {
             'employee': employee,
             'section': 'personal',
@@ -140,7 +150,7 @@ class PortalEmployee(http.Controller):
 
     @http.route(MY_EMPLOYEE_URL + '/attendance/checkin', type='http', auth='user', methods=['POST'], website=True)
     def check_in(self, **post):
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.redirect(MY_EMPLOYEE_URL + '?error=employee_not_found')
 
@@ -233,7 +243,7 @@ class PortalEmployee(http.Controller):
                 csrf=False)
     def quick_check_in(self, **post):
         """Quick check-in from dashboard"""
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.make_response(json.dumps({'status': 'error', 'message': 'Employee not found'}),
                                          headers={'Content-Type': 'application/json'})
@@ -298,7 +308,7 @@ class PortalEmployee(http.Controller):
 
     @http.route(MY_EMPLOYEE_URL + '/attendance/checkout', type='http', auth='user', methods=['POST'], website=True)
     def check_out(self, **post):
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.redirect(MY_EMPLOYEE_URL + '?error=employee_not_found')
 
@@ -396,7 +406,7 @@ class PortalEmployee(http.Controller):
                 website=True, csrf=False)
     def quick_check_out(self, **post):
         """Quick check-out from dashboard"""
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.make_response(json.dumps({'status': 'error', 'message': 'Employee not found'}),
                                          headers={'Content-Type': 'application/json'})
@@ -490,7 +500,7 @@ class PortalEmployee(http.Controller):
         user_timezone = get_user_timezone()
         user_pytz = pytz.timezone(user_timezone)
 
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
 
         # Get current time in user's timezone
         utc_now = datetime.now(pytz.UTC)
@@ -573,167 +583,67 @@ class PortalEmployee(http.Controller):
         })
 
     def _get_attendance_analytics(self, employee, month, year):
-        """Calculate comprehensive attendance analytics with timezone awareness"""
-        from datetime import datetime, timedelta, time
+        """Attendance analytics of one month, read from the daily attendance rollup"""
+        from datetime import date
         from calendar import monthrange
-        from collections import defaultdict
-        import pytz
-
-        # Get user's timezone
-        user_timezone = get_user_timezone()
-        user_pytz = pytz.timezone(user_timezone)
-
-        # Date range for the selected month in user's timezone
-        start_date = datetime(year, month, 1, tzinfo=user_pytz)
-        last_day = monthrange(year, month)[1]
-        end_date = datetime(year, month, last_day, 23, 59, 59, tzinfo=user_pytz)
-
-        # Convert to UTC for database query
-        start_date_utc = start_date.astimezone(pytz.UTC)
-        end_date_utc = end_date.astimezone(pytz.UTC)
-
-        # Get all attendance records for the month
-        attendances = request.env[HR_ATTENDANCE_MODEL].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('check_in', '>=', start_date_utc),
-            ('check_in', '<=', end_date_utc)
-        ])
-
-        # Group attendances by day for accurate day counting (using local timezone)
-        attendance_by_day = defaultdict(list)
-        for att in attendances:
-            # Convert check_in time to user's timezone for day grouping
-            check_in_local = fields.Datetime.context_timestamp(request.env.user, att.check_in)
-            day_key = check_in_local.strftime('%Y-%m-%d')
-            attendance_by_day[day_key].append(att)
-
-        # Calculate metrics
-        total_days = len(attendance_by_day)  # Unique days with attendance
-
-        # Calculate total hours per day and then sum them up
-        total_hours = 0
-        for day, day_attendances in attendance_by_day.items():
-            day_hours = sum(att.worked_hours for att in day_attendances if att.worked_hours)
-            total_hours += day_hours
-
-        avg_hours = total_hours / total_days if total_days > 0 else 0
-
-        # Calculate late arrivals by day - only count one late arrival per day
-        # Define late threshold (9:30 AM)
-        late_threshold = time(9, 30)
-        late_arrivals = 0
-
-        for day, day_attendances in attendance_by_day.items():
-            # Sort by check-in time to get the first check-in of the day
-            day_attendances.sort(key=lambda x: x.check_in)
-            # Convert check-in time to user's timezone
-            first_check_in = fields.Datetime.context_timestamp(request.env.user, day_attendances[0].check_in)
-            # Check if first check-in of the day was late
-            if first_check_in.time() > late_threshold:
-                late_arrivals += 1
-
-        # Working days in month (excluding weekends)
-        working_days = 0
-        current_date = start_date.date()
-        while current_date <= end_date.date():
-            if current_date.weekday() < 5:  # Monday=0, Sunday=6
-                working_days += 1
-            current_date += timedelta(days=1)
-
-        # Attendance percentage
-        attendance_percentage = (total_days / working_days * 100) if working_days > 0 else 0
-
-        # Early departures (before 5:30 PM) - count only days with early departure
-        early_threshold = time(17, 30)
-        early_departures = 0
-
-        for day, day_attendances in attendance_by_day.items():
-            # Check if any attendance records for the day had an early departure
-            early_departure = False
-            for att in day_attendances:
-                if att.check_out:
-                    # Convert check-out time to user's timezone
-                    check_out_local = fields.Datetime.context_timestamp(request.env.user, att.check_out)
-                    if check_out_local.time() < early_threshold:
-                        early_departure = True
-                        break
-            if early_departure:
-                early_departures += 1
-
-        # Overtime (more than 8.5 hours per day)
-        overtime_days = 0
-        for day, day_attendances in attendance_by_day.items():
-            day_hours = sum(att.worked_hours for att in day_attendances if att.worked_hours)
-            if day_hours > 8.5:
-                overtime_days += 1
-
-        # This week's data
-        # Get current time in user's timezone
-        utc_now = datetime.now(pytz.UTC)
-        local_now = utc_now.astimezone(user_pytz)
-
-        # Calculate week start in user's timezone
-        week_start = local_now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=local_now.weekday())
-        week_start_utc = week_start.astimezone(pytz.UTC)
 
-        week_attendances = request.env[HR_ATTENDANCE_MODEL].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('check_in', '>=', week_start_utc),
-            ('check_in', '<=', utc_now)
-        ])
+        month_start = date(year, month, 1)
+        month_end = date(year, month, monthrange(year, month)[1])
+        analytics = request.env['hr.attendance.daily'].sudo()._get_range_analytics(
+            employee.id, month_start, month_end
+        )
+        return self._format_month_analytics(analytics['months'][0], self._get_this_week_hours(employee))
 
-        # Group week attendances by day for consistent calculation
-        week_attendance_by_day = defaultdict(list)
-        for att in week_attendances:
-            # Convert check_in time to user's timezone for day grouping
-            check_in_local = fields.Datetime.context_timestamp(request.env.user, att.check_in)
-            day_key = check_in_local.strftime('%Y-%m-%d')
-            week_attendance_by_day[day_key].append(att)
+    def _get_this_week_hours(self, employee):
+        """Hours worked from Monday to today in user's timezone"""
+        from datetime import datetime, timedelta
+        import pytz
 
-        # Calculate total hours per day and then sum them up
-        this_week_hours = 0
-        for day, day_attendances in week_attendance_by_day.items():
-            day_hours = sum(att.worked_hours for att in day_attendances if att.worked_hours)
-            this_week_hours += day_hours
+        today_local = datetime.now(pytz.UTC).astimezone(pytz.timezone(get_user_timezone())).date()
+        week_start = today_local - timedelta(days=today_local.weekday())
+        return request.env['hr.attendance.daily'].sudo()._get_period_stats(employee.id, week_start, today_local)['hours']
 
+    def _format_month_analytics(self, month, this_week_hours):
+        """Shape one month of hr.attendance.daily._get_range_analytics for the attendance templates"""
         return {
-            'total_days': total_days,
-            'total_hours': round(total_hours, 2),
-            'avg_hours': round(avg_hours, 2),
-            'working_days': working_days,
-            'attendance_percentage': round(attendance_percentage, 1),
-            'late_arrivals': late_arrivals,
-            'early_departures': early_departures,
-            'overtime_days': overtime_days,
+            'total_days': month['days'],  # Unique days with attendance
+            'total_hours': round(month['hours'], 2),
+            'avg_hours': round(month['avg_hours'], 2),
+            'working_days': month['working_days'],
+            'attendance_percentage': round(month['attendance_percentage'], 1),
+            'late_arrivals': month['late_days'],
+            'early_departures': month['early_days'],
+            'overtime_days': month['overtime_days'],
             'this_week_hours': round(this_week_hours, 2),
-            'month_name': datetime(year, month, 1).strftime('%B %Y')
+            'month_name': month['date_start'].strftime('%B %Y')
         }
 
     @http.route(MY_EMPLOYEE_URL + '/attendance/analytics', type='http', auth='user', website=True)
     def portal_attendance_analytics(self, **kwargs):
         """Dedicated analytics page for attendance"""
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.redirect(MY_EMPLOYEE_URL)
 
         from datetime import datetime
+        from calendar import monthrange
+        from dateutil.relativedelta import relativedelta
         import pytz
 
         # Get user's timezone
         user_timezone = get_user_timezone()
         user_pytz = pytz.timezone(user_timezone)
 
-        # Get current time in user's timezone
-        utc_now = datetime.now(pytz.UTC)
-        local_now = utc_now.astimezone(user_pytz)
+        # Current month and the 3 before it, with this week, in one query
+        today_local = datetime.now(pytz.UTC).astimezone(user_pytz).date()
+        date_from = today_local.replace(day=1) - relativedelta(months=3)
+        date_to = today_local.replace(day=monthrange(today_local.year, today_local.month)[1])
+        analytics = request.env['hr.attendance.daily'].sudo()._get_range_analytics(employee.id, date_from, date_to)
 
-        # Get analytics for current month and last 3 months
-        analytics_months = []
-        for i in range(4):
-            from datetime import timedelta
-            month_date = local_now.replace(day=1) - timedelta(days=i * 30)
-            month_analytics = self._get_attendance_analytics(employee, month_date.month, month_date.year)
-            analytics_months.append(month_analytics)
+        this_week = next(week for week in analytics['weeks'] if week['date_start'] <= today_local <= week['date_end'])
+        analytics_months = [
+            self._format_month_analytics(month, this_week['hours']) for month in reversed(analytics['months'])
+        ]
 
         return request.render('employee_self_service_portal.portal_attendance_analytics', {
             'employee': employee,
@@ -748,135 +658,116 @@ class PortalEmployee(http.Controller):
                 '%A') if dt else '',
         })
 
-    @http.route(MY_EMPLOYEE_URL + '/attendance/export', type='http', auth='user', website=True)
-    def portal_attendance_export(self, **kwargs):
-        """Export attendance data to Excel"""
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+    @http.route(MY_EMPLOYEE_URL + '/attendance/analytics/data', type='http', auth='user', methods=['GET'])
+    @check_portal_access('attendance')
+    def portal_attendance_analytics_data(self, date_from=None, date_to=None, **kwargs):
+        """Per-month and per-week attendance aggregates for a local date range (default: year to date)"""
+        from datetime import datetime
+        import pytz
+
+        employee = self._get_employee()
         if not employee:
-            return request.redirect(MY_EMPLOYEE_URL)
+            return request.make_response(json.dumps({'status': 'error', 'message': 'Employee not found'}),
+                                         headers={'Content-Type': 'application/json'}, status=404)
 
+        today_local = datetime.now(pytz.UTC).astimezone(pytz.timezone(get_user_timezone())).date()
         try:
-            import io
-            import xlsxwriter
-            from datetime import datetime, timedelta, time
-
-            # Get date range (default: current month)
-            now = datetime.now()
-            start_date = kwargs.get('start_date')
-            end_date = kwargs.get('end_date')
-
-            if not start_date:
-                start_date = now.replace(day=1).strftime('%Y-%m-%d')
-            if not end_date:
-                from calendar import monthrange
-                last_day = monthrange(now.year, now.month)[1]
-                end_date = now.replace(day=last_day).strftime('%Y-%m-%d')
+            date_from = fields.Date.to_date(date_from) or today_local.replace(month=1, day=1)
+            date_to = fields.Date.to_date(date_to) or today_local
+            analytics = request.env['hr.attendance.daily'].sudo()._get_range_analytics(
+                employee.id, date_from, date_to
+            )
+        except (ValueError, UserError) as e:
+            return request.make_response(json.dumps({'status': 'error', 'message': str(e)}),
+                                         headers={'Content-Type': 'application/json'}, status=400)
+
+        return request.make_response(json.dumps({
+            'status': 'success',
+            'date_from': fields.Date.to_string(date_from),
+            'date_to': fields.Date.to_string(date_to),
+            'months': analytics['months'],
+            'weeks': analytics['weeks'],
+        }, default=fields.Date.to_string), headers={'Content-Type': 'application/json'})
+
+    def _parse_export_range(self, kwargs):
+        """Local ``(date_from, date_to)`` of an attendance export; defaults to the current month"""
+        from datetime import datetime
+        from calendar import monthrange
+        import pytz
 
-            # Get attendance data
-            attendances = request.env[HR_ATTENDANCE_MODEL].sudo().search([
-                ('employee_id', '=', employee.id),
-                ('check_in', '>=', start_date + ' 00:00:00'),
-                ('check_in', '<=', end_date + ' 23:59:59')
-            ], order='check_in desc')
-
-            # Create Excel file
-            output = io.BytesIO()
-            workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-            worksheet = workbook.add_worksheet('Attendance Report')
-
-            # Define formats
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
+        today_local = datetime.now(pytz.UTC).astimezone(pytz.timezone(get_user_timezone())).date()
+        date_from = fields.Date.to_date(kwargs.get('start_date')) or today_local.replace(day=1)
+        date_to = fields.Date.to_date(kwargs.get('end_date')) or today_local.replace(
+            day=monthrange(today_local.year, today_local.month)[1])
+        return date_from, date_to
 
-            date_format = workbook.add_format({'num_format': 'dd/mm/yyyy'})
-            time_format = workbook.add_format({'num_format': 'hh:mm AM/PM'})
-            hours_format = workbook.add_format({'num_format': '0.00'})
+    def _stream_attendance_export(self, employees, date_from, date_to, file_format, filename):
+        """Build the export in a temporary file and stream it back without loading it in memory"""
+        from werkzeug.wsgi import wrap_file
 
-            # Headers
-            headers = [
-                'Date', 'Day', 'Check-In Time', 'Check-In Location',
-                'Check-Out Time', 'Check-Out Location', 'Worked Hours', 'Status'
+        fileobj, mimetype, extension = request.env['hr.attendance.export'].sudo()._export(
+            employees, date_from, date_to, get_user_timezone(), file_format
+        )
+        fileobj.seek(0, 2)
+        size = fileobj.tell()
+        fileobj.seek(0)
+        response = request.make_response(
+            wrap_file(request.httprequest.environ, fileobj),
+            headers=[
+                ('Content-Type', mimetype),
+                ('Content-Length', str(size)),
+                ('Content-Disposition', content_disposition('{}.{}'.format(filename, extension))),
             ]
+        )
+        response.direct_passthrough = True
+        return response
 
-            for col, header in enumerate(headers):
-                worksheet.write(0, col, header, header_format)
-
-            # Data rows
-            for row, att in enumerate(attendances, 1):
-                check_in_date = att.check_in.date() if att.check_in else None
-                day_name = att.check_in.strftime('%A') if att.check_in else ''
-                check_in_time = att.check_in.time() if att.check_in else None
-                check_out_time = att.check_out.time() if att.check_out else None
-
-                # Determine status
-                status = 'Complete' if att.check_out else 'Active'
-                if att.check_in and att.check_in.time() > time(9, 30):
-                    status += ' (Late)'
-                if att.check_out and att.check_out.time() < time(17, 30):
-                    status += ' (Early)'
-
-                worksheet.write(row, 0, check_in_date, date_format)
-                worksheet.write(row, 1, day_name)
-                worksheet.write(row, 2, check_in_time, time_format)
-                worksheet.write(row, 3, att.check_in_location or '')
-                worksheet.write(row, 4, check_out_time, time_format)
-                worksheet.write(row, 5, att.check_out_location or '')
-                worksheet.write(row, 6, att.worked_hours or 0, hours_format)
-                worksheet.write(row, 7, status)
-
-            # Summary section
-            summary_row = len(attendances) + 3
-            worksheet.write(summary_row, 0, 'SUMMARY', header_format)
-            worksheet.write(summary_row + 1, 0, 'Total Days:')
-            worksheet.write(summary_row + 1, 1, len(attendances))
-            worksheet.write(summary_row + 2, 0, 'Total Hours:')
-            worksheet.write(summary_row + 2, 1, sum(att.worked_hours for att in attendances if att.worked_hours),
-                            hours_format)
-            worksheet.write(summary_row + 3, 0, 'Average Hours/Day:')
-            avg_hours = sum(att.worked_hours for att in attendances if att.worked_hours) / len(
-                attendances) if attendances else 0
-            worksheet.write(summary_row + 3, 1, avg_hours, hours_format)
-
-            # Auto-adjust column widths
-            worksheet.set_column('A:A', 12)  # Date
-            worksheet.set_column('B:B', 10)  # Day
-            worksheet.set_column('C:C', 15)  # Check-in time
-            worksheet.set_column('D:D', 30)  # Check-in location
-            worksheet.set_column('E:E', 15)  # Check-out time
-            worksheet.set_column('F:F', 30)  # Check-out location
-            worksheet.set_column('G:G', 12)  # Worked hours
-            worksheet.set_column('H:H', 15)  # Status
-
-            workbook.close()
-            output.seek(0)
-
-            # Generate filename
-            filename = "attendance_report_{}_{}_to_{}.xlsx".format(
-                employee.name, start_date, end_date
-            ).replace(' ', '_').replace('/', '-')
+    @http.route(MY_EMPLOYEE_URL + '/attendance/export', type='http', auth='user', website=True)
+    def portal_attendance_export(self, **kwargs):
+        """Export attendance data to Excel (``file_format=csv`` for CSV)"""
+        employee = self._get_employee()
+        if not employee:
+            return request.redirect(MY_EMPLOYEE_URL)
 
-            # Return file
-            return request.make_response(
-                output.getvalue(),
-                headers=[
-                    ('Content-Type', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
-                    ('Content-Disposition', 'attachment; filename="{}"'.format(filename))
-                ]
+        try:
+            date_from, date_to = self._parse_export_range(kwargs)
+            filename = "attendance_report_{}_{}_to_{}".format(
+                employee.name, date_from, date_to
+            ).replace(' ', '_').replace('/', '-')
+            return self._stream_attendance_export(
+                employee, date_from, date_to, kwargs.get('file_format', 'xlsx'), filename
             )
-
         except Exception as e:
-            import logging
-            _logger = logging.getLogger(__name__)
             _logger.error("Attendance export failed: %s", e)
             return request.redirect(MY_EMPLOYEE_URL + '/attendance?error=export_failed')
 
+    @http.route('/hr/attendance/export', type='http', auth='user', methods=['GET'])
+    def hr_attendance_export(self, employee_ids='', **kwargs):
+        """
+        HR export of several employees' attendances in one file, with an
+        employee column. ``employee_ids`` is a comma-separated id list.
+        """
+        if not request.env.user.has_group('hr_attendance.group_hr_attendance_manager'):
+            raise Forbidden()
+
+        try:
+            ids = [int(employee_id) for employee_id in employee_ids.split(',') if employee_id.strip()]
+            date_from, date_to = self._parse_export_range(kwargs)
+        except ValueError:
+            raise BadRequest()
+        # Employees the HR user may read, in their allowed companies
+        employees = request.env[HR_EMPLOYEE_MODEL].search([('id', 'in', ids)])
+        if not employees:
+            raise NotFound()
+
+        filename = "attendance_report_{}_to_{}".format(date_from, date_to)
+        return self._stream_attendance_export(
+            employees, date_from, date_to, kwargs.get('file_format', 'xlsx'), filename
+        )
+
     @http.route(MY_EMPLOYEE_URL + '/edit', type='http', auth='user', website=True, methods=['GET', 'POST'])
     def portal_employee_edit(self, **post):
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.redirect(MY_EMPLOYEE_URL)
         if http.request.httprequest.method == 'POST':
@@ -944,57 +835,112 @@ class PortalEmployee(http.Controller):
         }
         return request.render('employee_self_service_portal.portal_ess_ticket_form', values)
 
-    @http.route(['/my/tickets', '/my/tickets/page/<int:page>'], type='http', auth='user', website=True)
-    def portal_my_tickets(self, page=1, sortby=None, filterby=None, **kw):
-        """Display all IT tickets for the current portal user"""
-
-        employee = self._get_employee()
-        if not employee:
-            return request.redirect('/my/ess')
+    # Listing filters; ``states`` is used to read the cached per-employee counts
+    TICKET_FILTERS = {
+        'all': {'label': 'All', 'states': None},
+        'pending': {'label': 'Pending Approval', 'states': ['manager_approval', 'it_approval']},
+        'active': {'label': 'Active', 'states': ['assigned', 'in_progress']},
+        'done': {'label': 'Completed', 'states': ['done']},
+        'rejected': {'label': 'Rejected', 'states': ['rejected']},
+    }
+    TICKET_SORTINGS = {
+        'date': {'label': 'Newest First'},
+        'name': {'label': 'Ticket Number'},
+        'state': {'label': 'Status'},
+    }
+
+    def _get_ticket_page(self, employee, sortby, filterby, after, search=None):
+        """
+        Return one keyset page of the employee's tickets plus the filter
+        counts. ``search`` narrows both to a full-text match.
+        """
+        if sortby not in self.TICKET_SORTINGS:
+            sortby = 'date'
+        if filterby not in self.TICKET_FILTERS:
+            filterby = 'all'
 
-        # Base domain - tickets created by this employee
         domain = [('employee_id', '=', employee.id)]
+        if search:
+            domain.append(('search_text', 'ilike', search))
+        states = self.TICKET_FILTERS[filterby]['states']
 
-        # Sorting options
-        searchbar_sortings = {
-            'date': {'label': 'Newest First', 'order': 'create_date desc'},
-            'name': {'label': 'Ticket Number', 'order': 'name'},
-            'state': {'label': 'Status', 'order': 'state'},
-        }
+        Ticket = request.env['it.ticket'].sudo()
+        tickets, next_cursor = Ticket._portal_ticket_page(
+            domain + ([('state', 'in', states)] if states else []), sortby=sortby, after=after
+        )
 
-        # Filter options
-        searchbar_filters = {
-            'all': {'label': 'All', 'domain': []},
-            'pending': {'label': 'Pending Approval', 'domain': [('state', 'in', ['manager_approval', 'it_approval'])]},
-            'active': {'label': 'Active', 'domain': [('state', 'in', ['assigned', 'in_progress'])]},
-            'done': {'label': 'Completed', 'domain': [('state', '=', 'done')]},
-            'rejected': {'label': 'Rejected', 'domain': [('state', '=', 'rejected')]},
+        if search:
+            # Search results are few; count them directly instead of the cached counters
+            state_counts = defaultdict(int, Ticket._read_group(domain, ['state'], ['__count']))
+        else:
+            state_counts = request.env['it.ticket.employee.count'].sudo()._get_counts(employee.id)
+        filter_counts = {
+            key: sum(state_counts[state] for state in flt['states']) if flt['states']
+            else sum(state_counts.values())
+            for key, flt in self.TICKET_FILTERS.items()
         }
+        return tickets, next_cursor, sortby, filterby, filter_counts
 
-        # Default sort and filter
-        if not sortby:
-            sortby = 'date'
-        if not filterby:
-            filterby = 'all'
+    @http.route(['/my/tickets', '/my/tickets/page/<int:page>'], type='http', auth='user', website=True)
+    def portal_my_tickets(self, page=1, sortby=None, filterby=None, after=None, search=None, **kw):
+        """Display the current portal user's IT tickets, one keyset page at a time"""
 
-        order = searchbar_sortings[sortby]['order']
-        domain += searchbar_filters[filterby]['domain']
+        employee = self._get_employee()
+        if not employee:
+            return request.redirect('/my/ess')
 
-        # Get tickets
-        tickets = request.env['it.ticket'].sudo().search(domain, order=order)
+        search = (search or '').strip()
+        tickets, next_cursor, sortby, filterby, filter_counts = self._get_ticket_page(
+            employee, sortby, filterby, after, search
+        )
 
         values = {
             'tickets': tickets,
+            'next_cursor': next_cursor,
+            'is_first_page': not after,
+            'filter_counts': filter_counts,
             'page_name': 'tickets',
-            'searchbar_sortings': searchbar_sortings,
-            'searchbar_filters': searchbar_filters,
+            'searchbar_sortings': self.TICKET_SORTINGS,
+            'searchbar_filters': self.TICKET_FILTERS,
             'sortby': sortby,
             'filterby': filterby,
+            'search': search,
             'employee': employee,
         }
 
         return request.render('employee_self_service_portal.portal_my_tickets', values)
 
+    @http.route('/my/tickets/json', type='http', auth='user', methods=['GET'])
+    def portal_my_tickets_json(self, sortby=None, filterby=None, after=None, search=None, **kw):
+        """JSON variant of /my/tickets for infinite scroll: pass back ``next_cursor`` as ``after``"""
+
+        employee = self._get_employee()
+        if not employee:
+            return request.make_response(json.dumps({'status': 'error', 'message': 'Employee not found'}),
+                                         headers={'Content-Type': 'application/json'}, status=404)
+
+        tickets, next_cursor, sortby, filterby, filter_counts = self._get_ticket_page(
+            employee, sortby, filterby, after, (search or '').strip()
+        )
+        state_labels = dict(request.env['it.ticket']._fields['state'].selection)
+
+        return request.make_response(json.dumps({
+            'status': 'success',
+            'tickets': [{
+                'id': ticket.id,
+                'name': ticket.name,
+                'subject': ticket.subject,
+                'state': ticket.state,
+                'state_label': state_labels.get(ticket.state),
+                'ticket_type': ticket.ticket_type_id.name or '',
+                'priority': ticket.priority,
+                'create_date': fields.Datetime.to_string(ticket.create_date),
+                'url': '/my/tickets/%s' % ticket.id,
+            } for ticket in tickets],
+            'next_cursor': next_cursor,
+            'count': filter_counts[filterby],
+        }), headers={'Content-Type': 'application/json'})
+
     @http.route(['/my/tickets/<int:ticket_id>'], type='http', auth='user', website=True)
     def portal_my_ticket_detail(self, ticket_id, **kw):
         """Display single ticket details"""
@@ -1029,6 +975,33 @@ class PortalEmployee(http.Controller):
 
         return request.render('employee_self_service_portal.portal_my_ticket_detail', values)
 
+    @http.route('/my/ess/tickets/similar', type='http', auth='user', methods=['GET'])
+    def portal_ess_ticket_similar(self, subject=None, description=None, **kw):
+        """Open tickets of the employee or their department similar to the one being typed"""
+        employee = self._get_employee()
+        if not employee or not subject or len(subject.strip()) < 3:
+            return request.make_response(json.dumps({'status': 'success', 'tickets': []}),
+                                         headers={'Content-Type': 'application/json'})
+
+        Ticket = request.env['it.ticket'].sudo()
+        similar = Ticket._find_similar_tickets(
+            subject.strip(),
+            description,
+            employee_id=employee.id,
+            department_id=employee.department_id.id,
+        )
+        state_labels = dict(Ticket._fields['state'].selection)
+        return request.make_response(json.dumps({
+            'status': 'success',
+            'tickets': [{
+                'name': ticket.name,
+                'subject': ticket.subject,
+                'state_label': state_labels.get(ticket.state),
+                # Department tickets of colleagues are listed but not linked
+                'url': '/my/tickets/%s' % ticket.id if ticket.employee_id == employee else False,
+            } for ticket in similar],
+        }), headers={'Content-Type': 'application/json'})
+
     @http.route('/my/ess/tickets/submit', type='http', auth='user', website=True, methods=['POST'], csrf=True)
     def portal_ess_ticket_submit(self, **post):
         """Submit new IT ticket from ESS dashboard"""
@@ -1072,21 +1045,20 @@ class PortalEmployee(http.Controller):
             # ====================================================
             attachment = request.httprequest.files.get('attachment')
             if attachment and attachment.filename:
-                attachment_content = attachment.read()
-
-                request.env['ir.attachment'].sudo().create({
-                    'name': attachment.filename,
-                    'type': 'binary',
-                    'datas': base64.b64encode(attachment_content),
+                request.env['ir.attachment'].sudo()._create_from_upload(attachment, {
                     'res_model': 'it.ticket',
                     'res_id': ticket.id,
-                    'mimetype': attachment.mimetype,
-                })
+                }, max_size=TICKET_ATTACHMENT_MAX_SIZE)
                 _logger.info("Attachment %s added to Ticket %s", attachment.filename, ticket.name)
             # ====================================================
+            ticket._detect_similar_tickets()
             _logger.info("IT Ticket %s created from ESS portal by %s", ticket.name, employee.name)
             return request.redirect('/my/ess?ticket_success=1')
 
+        except UserError as e:
+            _logger.warning("ESS ticket attachment rejected: %s", e)
+            request.env.cr.rollback()
+            return request.redirect('/my/ess/tickets/new?error=1&error_msg=' + quote_plus(str(e)))
         except Exception as e:
             _logger.error("Error creating IT ticket from ESS portal: %s", e)
             request.env.cr.rollback()
@@ -1105,7 +1077,7 @@ class PortalEmployee(http.Controller):
         """Common method to render dashboard with enhanced data"""
         import pytz
 
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
 
         # Get dashboard statistics
         dashboard_data = {}
@@ -1141,16 +1113,23 @@ class PortalEmployee(http.Controller):
 
     def _get_enhanced_dashboard_data(self, employee):
         """Get comprehensive dashboard data for enhanced view"""
-        from datetime import date, datetime, timedelta
+        from datetime import datetime, timedelta
+        import pytz
 
         # Basic employee data
         dashboard_data = {'employee': employee}
 
-        # Payslips data with enhanced analytics
-        payslips = request.env['hr.payslip'].sudo().search([
-            ('employee_id', '=', employee.id)
-        ])
-        payslips_count = len(payslips)
+        # Today in the user's timezone
+        user_timezone = get_user_timezone()
+        user_pytz = pytz.timezone(user_timezone)
+        today_local = datetime.now(pytz.UTC).astimezone(user_pytz).date()
+
+        # Every tile is aggregated in the database and cached per employee
+        aggregates = request.env['ess.dashboard.snapshot'].sudo()._get_dashboard_aggregates(
+            employee, request.env.user, user_timezone, today_local
+        )
+        crm_analytics = aggregates['crm']
+        expense_stats = aggregates['expenses']
 
         # Latest payslip
         latest_payslip = request.env['hr.payslip'].sudo().search([
@@ -1158,150 +1137,49 @@ class PortalEmployee(http.Controller):
             ('state', 'in', ['done', 'paid'])
         ], order='date_from desc', limit=1)
 
-        # Enhanced attendance data - get ALL attendance records for today using user's timezone
-        import pytz
-
-        # Get user's timezone
-        user_timezone = get_user_timezone()
-        user_pytz = pytz.timezone(user_timezone)
-
-        # Get current time in user's timezone
-        utc_now = datetime.now(pytz.UTC)
-        local_now = utc_now.astimezone(user_pytz)
-        today_local = local_now.date()
-
-        # Calculate today start and end in user's local timezone, then convert to UTC for database query
-        local_day_start = datetime.combine(today_local, datetime.min.time()).replace(tzinfo=user_pytz)
-        local_day_end = datetime.combine(today_local, datetime.max.time()).replace(tzinfo=user_pytz)
-
-        # Convert to UTC for database query
-        utc_day_start = local_day_start.astimezone(pytz.UTC)
-        utc_day_end = local_day_end.astimezone(pytz.UTC)
-
+        # Today's attendance records (a handful at most), shown individually
+        local_day_start = user_pytz.localize(datetime.combine(today_local, datetime.min.time()))
+        local_day_end = user_pytz.localize(datetime.combine(today_local, datetime.max.time()))
         today_attendances = request.env[HR_ATTENDANCE_MODEL].sudo().search([
             ('employee_id', '=', employee.id),
-            ('check_in', '>=', utc_day_start),
-            ('check_in', '<=', utc_day_end)
-        ])
-
-        # Weekly attendance summary in user's timezone
-        week_start_local = today_local - timedelta(days=today_local.weekday())
-        week_end_local = week_start_local + timedelta(days=6)
-
-        # Convert to datetime with timezone
-        week_start_dt = datetime.combine(week_start_local, datetime.min.time()).replace(tzinfo=user_pytz)
-        week_end_dt = datetime.combine(week_end_local, datetime.max.time()).replace(tzinfo=user_pytz)
-
-        # Convert to UTC for database query
-        utc_week_start = week_start_dt.astimezone(pytz.UTC)
-        utc_week_end = week_end_dt.astimezone(pytz.UTC)
-
-        week_attendance = request.env[HR_ATTENDANCE_MODEL].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('check_in', '>=', utc_week_start),
-            ('check_in', '<=', utc_week_end)
-        ])
-
-        # Calculate weekly hours using the day grouping approach for consistency
-        from collections import defaultdict
-        week_attendance_by_day = defaultdict(list)
-        for att in week_attendance:
-            day_key = att.check_in.strftime('%Y-%m-%d')
-            week_attendance_by_day[day_key].append(att)
-
-        # Calculate total hours per day and then sum them up
-        weekly_hours = 0
-        for day, day_attendances in week_attendance_by_day.items():
-            day_hours = sum(att.worked_hours for att in day_attendances if att.worked_hours)
-            weekly_hours += day_hours
-
-        # Enhanced CRM data
-        user = request.env.user
-        crm_leads = request.env[CRM_LEAD_MODEL].sudo().search([('user_id', '=', user.id)])
-        crm_leads_count = len(crm_leads)
-
-        # CRM analytics
-        new_leads = crm_leads.filtered(lambda l: l.stage_id.name in ['New', 'Qualification'] if l.stage_id else False)
-        won_leads = crm_leads.filtered(lambda l: l.stage_id.name == 'Won' if l.stage_id else False)
-        total_revenue = sum(crm_leads.mapped('expected_revenue'))
-
-        # Enhanced Expense statistics
-        today_dt = datetime.now().date()
-        first_day_month = today_dt.replace(day=1)
-
-        current_month_expenses = request.env['hr.expense'].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('date', '>=', first_day_month),
-            ('date', '<=', today_dt)
-        ])
-
-        # Year-to-date expenses
-        year_start = today_dt.replace(month=1, day=1)
-        ytd_expenses = request.env['hr.expense'].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('date', '>=', year_start),
-            ('date', '<=', today_dt)
+            ('check_in', '>=', local_day_start.astimezone(pytz.UTC).replace(tzinfo=None)),
+            ('check_in', '<=', local_day_end.astimezone(pytz.UTC).replace(tzinfo=None))
         ])
 
-        expenses_count = len(current_month_expenses)
-        current_month_total = sum(current_month_expenses.mapped('total_amount'))
-        ytd_total = sum(ytd_expenses.mapped('total_amount'))
-
-        # Expense breakdown by status
-        submitted_expenses = current_month_expenses.filtered(lambda x: x.sheet_id and x.sheet_id.state == 'submit')
-        approved_expenses = current_month_expenses.filtered(lambda x: x.sheet_id and x.sheet_id.state == 'approve')
-        draft_expenses = current_month_expenses.filtered(lambda x: not x.sheet_id or x.sheet_id.state == 'draft')
-
-        expense_stats = {
-            'total_count': expenses_count,
-            'total_amount': current_month_total,
-            'ytd_total': ytd_total,
-            'submitted_count': len(submitted_expenses),
-            'submitted_amount': sum(submitted_expenses.mapped('total_amount')),
-            'approved_count': len(approved_expenses),
-            'approved_amount': sum(approved_expenses.mapped('total_amount')),
-            'draft_count': len(draft_expenses),
-            'draft_amount': sum(draft_expenses.mapped('total_amount')),
-            'pending_count': len(submitted_expenses),
-        }
-
         # Recent activities (for enhanced dashboard)
         recent_activities = []
 
         # Add recent attendance - show the most recent attendance for the activity feed
         if today_attendances:
-            # Get most recent attendance record
-            most_recent = today_attendances[0] if len(today_attendances) > 0 else None
-
-            if most_recent:
-                recent_activities.append({
-                    'type': 'attendance',
-                    'title': 'Checked In' if not most_recent.check_out else 'Completed Work Day',
-                    'description': "At {}".format(most_recent.check_in.strftime(
-                        '%I:%M %p')) if not most_recent.check_out else "Worked {:.2f} hours".format(
-                        most_recent.worked_hours),
-                    'time': most_recent.check_in,
-                    'icon': 'clock-o',
-                    'color': 'primary'
-                })
+            most_recent = today_attendances[0]
+            recent_activities.append({
+                'type': 'attendance',
+                'title': 'Checked In' if not most_recent.check_out else 'Completed Work Day',
+                'description': "At {}".format(most_recent.check_in.strftime(
+                    '%I:%M %p')) if not most_recent.check_out else "Worked {:.2f} hours".format(
+                    most_recent.worked_hours),
+                'time': most_recent.check_in,
+                'icon': 'clock-o',
+                'color': 'primary'
+            })
 
         # Add recent CRM activities
-        if crm_leads_count > 0:
+        if crm_analytics['total_leads'] > 0:
             recent_activities.append({
                 'type': 'crm',
                 'title': 'CRM Active',
-                'description': "{} leads to manage".format(crm_leads_count),
+                'description': "{} leads to manage".format(crm_analytics['total_leads']),
                 'time': datetime.now(),
                 'icon': 'briefcase',
                 'color': 'info'
             })
 
         # Add recent expenses
-        if current_month_expenses:
+        if expense_stats['total_count']:
             recent_activities.append({
                 'type': 'expense',
                 'title': 'Expense Updates',
-                'description': "{} expenses this month".format(len(current_month_expenses)),
+                'description': "{} expenses this month".format(expense_stats['total_count']),
                 'time': datetime.now(),
                 'icon': 'money',
                 'color': 'warning'
@@ -1310,27 +1188,26 @@ class PortalEmployee(http.Controller):
         # Sort activities by time
         recent_activities.sort(key=lambda x: x['time'], reverse=True)
 
+        # Attendance rate: days attended over working days (Mon-Fri) so far this month
+        first_day_local = today_local.replace(day=1)
+        working_days = sum(
+            1 for offset in range((today_local - first_day_local).days + 1)
+            if (first_day_local + timedelta(days=offset)).weekday() < 5
+        )
+
         # Performance metrics (for enhanced dashboard)
         performance_metrics = {
-            'attendance_rate': self._calculate_attendance_rate(employee, today_local),
-            'crm_conversion_rate': (len(won_leads) / crm_leads_count * 100) if crm_leads_count > 0 else 0,
-            'expense_avg_amount': current_month_total / expenses_count if expenses_count > 0 else 0,
-            'weekly_hours': weekly_hours,
+            'attendance_rate': (aggregates['attended_days'] / working_days * 100) if working_days > 0 else 0,
+            'crm_conversion_rate': crm_analytics['conversion_rate'],
+            'expense_avg_amount': expense_stats['total_amount'] / expense_stats['total_count']
+            if expense_stats['total_count'] > 0 else 0,
+            'weekly_hours': aggregates['weekly_hours'],
             'monthly_targets': self._get_monthly_targets(employee),
         }
 
         # IT Tickets data for dashboard
-        it_tickets_count = 0
-        it_tickets_pending = 0
         it_tickets_recent = None
         try:
-            it_tickets_count = request.env['it.ticket'].search_count([
-                ('employee_id', '=', employee.id)
-            ])
-            it_tickets_pending = request.env['it.ticket'].search_count([
-                ('employee_id', '=', employee.id),
-                ('state', 'in', ['draft', 'manager_approval', 'it_approval'])
-            ])
             it_tickets_recent = request.env['it.ticket'].search([
                 ('employee_id', '=', employee.id)
             ], order='create_date desc', limit=3)
@@ -1338,73 +1215,23 @@ class PortalEmployee(http.Controller):
             pass
 
         dashboard_data.update({
-            'payslips_count': payslips_count,
+            'payslips_count': aggregates['payslips_count'],
             'latest_payslip': latest_payslip,
             'today_attendances': today_attendances,
-            'weekly_hours': weekly_hours,
-            'crm_leads_count': crm_leads_count,
-            'crm_analytics': {
-                'total_leads': crm_leads_count,
-                'new_leads': len(new_leads),
-                'won_leads': len(won_leads),
-                'total_revenue': total_revenue,
-                'conversion_rate': (len(won_leads) / crm_leads_count * 100) if crm_leads_count > 0 else 0
-            },
-            'expenses_count': expenses_count,
+            'weekly_hours': aggregates['weekly_hours'],
+            'crm_leads_count': crm_analytics['total_leads'],
+            'crm_analytics': crm_analytics,
+            'expenses_count': expense_stats['total_count'],
             'expense_stats': expense_stats,
             'recent_activities': recent_activities[:5],  # Top 5 recent activities
             'performance_metrics': performance_metrics,
-            'it_tickets_count': it_tickets_count,
-            'it_tickets_pending': it_tickets_pending,
+            'it_tickets_count': aggregates['it_tickets_count'],
+            'it_tickets_pending': aggregates['it_tickets_pending'],
             'it_tickets_recent': it_tickets_recent,
         })
 
         return dashboard_data
 
-    def _calculate_attendance_rate(self, employee, today_local):
-        """Calculate monthly attendance rate using timezone-aware dates"""
-        from datetime import datetime, timedelta
-        import pytz
-
-        # Get user's timezone
-        user_timezone = get_user_timezone()
-        user_pytz = pytz.timezone(user_timezone)
-
-        # Get first day of current month in user's timezone
-        first_day_local = today_local.replace(day=1)
-
-        # Count working days (excluding weekends)
-        working_days = 0
-        current_date = first_day_local
-        while current_date <= today_local:
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                working_days += 1
-            current_date += timedelta(days=1)
-
-        # Convert dates to datetime with timezone
-        first_day_dt = datetime.combine(first_day_local, datetime.min.time()).replace(tzinfo=user_pytz)
-        today_dt = datetime.combine(today_local, datetime.max.time()).replace(tzinfo=user_pytz)
-
-        # Convert to UTC for database query
-        utc_first_day = first_day_dt.astimezone(pytz.UTC)
-        utc_today = today_dt.astimezone(pytz.UTC)
-
-        # Count actual attendance days
-        attendance_records = request.env[HR_ATTENDANCE_MODEL].sudo().search([
-            ('employee_id', '=', employee.id),
-            ('check_in', '>=', utc_first_day),
-            ('check_in', '<=', utc_today)
-        ])
-
-        # Get unique days using user's timezone for accurate day counting
-        attended_days = set()
-        for att in attendance_records:
-            # Convert each check-in time to user's timezone to get the local date
-            local_date = fields.Datetime.context_timestamp(request.env.user, att.check_in).date()
-            attended_days.add(local_date)
-
-        return (len(attended_days) / working_days * 100) if working_days > 0 else 0
-
     def _get_monthly_targets(self, employee):
         """Get monthly targets for the employee (placeholder)"""
         return {
@@ -1515,29 +1342,25 @@ class PortalEmployee(http.Controller):
                     'error': 'No photo file provided'
                 })
 
-            # Validate file type
-            allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif']
-            if photo_file.content_type not in allowed_types:
+            # Read at most one byte past the limit: the image field needs the
+            # whole picture in memory to resize it, but never more than 5MB.
+            photo_content = photo_file.stream.read(EMPLOYEE_PHOTO_MAX_SIZE + 1)
+            if len(photo_content) > EMPLOYEE_PHOTO_MAX_SIZE:
                 return request.make_json_response({
                     'success': False,
-                    'error': 'Invalid file type. Please upload JPG, PNG, or GIF only.'
+                    'error': 'File too large. Maximum size is 5MB.'
                 })
 
-            # Validate file size (5MB max)
-            max_size = 5 * 1024 * 1024  # 5MB
-            photo_file.seek(0, 2)  # Seek to end
-            file_size = photo_file.tell()
-            photo_file.seek(0)  # Seek back to beginning
-
-            if file_size > max_size:
+            # Validate file type from its content, not the client header
+            allowed_types = ['image/jpeg', 'image/png', 'image/gif']
+            mimetype = request.env['ir.attachment']._sniff_upload_mimetype(photo_content, photo_file.filename)
+            if mimetype not in allowed_types:
                 return request.make_json_response({
                     'success': False,
-                    'error': 'File too large. Maximum size is 5MB.'
+                    'error': 'Invalid file type. Please upload JPG, PNG, or GIF only.'
                 })
 
-            # Read and encode image
-            import base64
-            photo_data = base64.b64encode(photo_file.read())
+            photo_data = base64.b64encode(photo_content)
 
             # Update employee image
             employee.sudo().write({
@@ -1610,31 +1433,13 @@ class PortalEmployee(http.Controller):
     def _save_employee_document(self, employee, file, doc_type):
         """Save individual document file"""
         try:
-            import base64
-
-            # Validate file size (10MB max)
-            max_size = 10 * 1024 * 1024
-            file.seek(0, 2)
-            file_size = file.tell()
-            file.seek(0)
-
-            if file_size > max_size:
-                return
-
-            # Read file data
-            file_data = base64.b64encode(file.read())
-
-            # Create attachment
-            attachment = request.env['ir.attachment'].sudo().create({
+            # Streamed to the filestore, 10MB max
+            return request.env['ir.attachment'].sudo()._create_from_upload(file, {
                 'name': "{} - {}".format(doc_type, file.filename),
-                'datas': file_data,
                 'res_model': 'hr.employee',
                 'res_id': employee.id,
                 'public': False,
-                'type': 'binary',
-            })
-
-            return attachment
+            }, max_size=EMPLOYEE_DOCUMENT_MAX_SIZE)
 
         except Exception as e:
             _logger.error("Error saving document %s: %s", file.filename, str(e))
@@ -2275,27 +2080,18 @@ class PortalEmployee(http.Controller):
         # Allow log note with or without text, as long as there are files or a note
         if lead and (note or files) and lead.user_id.id == user.id:
             msg = lead.message_post(body=note or '', message_type='comment', author_id=user.partner_id.id)
-            import base64
             attachment_ids = []
             for file in files:
                 try:
-                    file.seek(0)
-                except Exception:
-                    pass
-                file_content = file.read()
-                if file_content:
-                    if isinstance(file_content, str):
-                        file_content = file_content.encode('utf-8')
-                    encoded_content = base64.b64encode(file_content).decode('utf-8')
-                    attachment = request.env['ir.attachment'].sudo().create({
-                        'name': file.filename,
-                        'datas': encoded_content,
+                    attachment = request.env['ir.attachment'].sudo()._create_from_upload(file, {
                         'res_model': 'crm.lead',
                         'res_id': lead.id,
-                        'mimetype': file.mimetype,
-                        'type': 'binary',
                         'public': True,
-                    })
+                    }, max_size=CRM_NOTE_ATTACHMENT_MAX_SIZE)
+                except UserError as e:
+                    _logger.warning('ESS Portal: Skipped attachment %s: %s', file.filename, e)
+                    continue
+                if attachment:
                     attachment_ids.append(attachment.id)
                     _logger.info('ESS Portal: Created attachment id=%s name=%s res_model=%s res_id=%s', attachment.id,
                                  attachment.name, attachment.res_model, attachment.res_id)
@@ -2605,7 +2401,7 @@ class PortalEmployee(http.Controller):
         errors = []
 
         # Get employee for company-specific validations
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         currency_symbol = employee.company_id.currency_id.symbol or '$'
 
         # Required field validation
@@ -2644,7 +2440,7 @@ class PortalEmployee(http.Controller):
         # Duplicate expense detection
         if post.get('date') and post.get('total_amount') and post.get('category_id'):
             try:
-                employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+                employee = self._get_employee()
                 existing_expense = request.env['hr.expense'].sudo().search([
                     ('employee_id', '=', employee.id),
                     ('date', '=', post.get('date')),
@@ -2775,7 +2571,7 @@ class PortalEmployee(http.Controller):
         import logging
         _logger = logging.getLogger(__name__)
 
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
         if not employee:
             return request.redirect(MY_EMPLOYEE_URL)
 
@@ -2836,7 +2632,7 @@ class PortalEmployee(http.Controller):
 
         try:
             payslip = request.env['hr.payslip'].sudo().browse(payslip_id)
-            employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+            employee = self._get_employee()
 
             # Security check - only allow access to own payslips
             if not payslip.exists() or not employee or payslip.employee_id.id != employee.id:
@@ -3140,7 +2936,7 @@ class PortalEmployee(http.Controller):
     def portal_payslip_view(self, payslip_id, **kwargs):
         """View payslip details"""
         payslip = request.env['hr.payslip'].sudo().browse(payslip_id)
-        employee = request.env[HR_EMPLOYEE_MODEL].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+        employee = self._get_employee()
 
         # Security check - only allow access to own payslips
         if not payslip or not employee or payslip.employee_id.id != employee.id:
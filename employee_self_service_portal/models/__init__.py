@@ -1,5 +1,10 @@
+from . import dashboard_snapshot
 from . import employee
 from . import attendance
+from . import attendance_daily
+from . import attendance_export
 from . import crm_lead
 from . import payslip
-from . import hr_expense
\ No newline at end of file
+from . import hr_expense
+from . import ir_attachment
+from . import it_ticket
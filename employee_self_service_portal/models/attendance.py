@@ -5,7 +5,11 @@ import logging
 _logger = logging.getLogger(__name__)
 
 class HrAttendance(models.Model):
-    _inherit = 'hr.attendance'
+    _name = 'hr.attendance'
+    _inherit = ['hr.attendance', 'ess.dashboard.source.mixin']
+    _ess_dashboard_fields = ('employee_id', 'check_in', 'check_out', 'worked_hours')
+    # Fields rolled up into hr.attendance.daily
+    _daily_rollup_fields = ('employee_id', 'check_in', 'check_out', 'worked_hours')
 
     check_in_location = fields.Char("Check-In Location")
     check_out_location = fields.Char("Check-Out Location")
@@ -100,6 +104,39 @@ class HrAttendance(models.Model):
             else:
                 attendance.attendance_status = 'complete'
                 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._refresh_daily_rollup()
+        return records
+
+    def write(self, vals):
+        if self.env.context.get('skip_attendance_daily') \
+                or not any(name in vals for name in self._daily_rollup_fields):
+            return super().write(vals)
+        keys = self.env['hr.attendance.daily'].sudo()._get_day_keys(self.ids)
+        res = super().write(vals)
+        self._refresh_daily_rollup(keys)
+        return res
+
+    def unlink(self):
+        keys = self.env['hr.attendance.daily'].sudo()._get_day_keys(self.ids)
+        res = super().unlink()
+        self.env['hr.attendance.daily'].sudo()._refresh_days(keys)
+        return res
+
+    def _refresh_daily_rollup(self, extra_keys=()):
+        """
+        Recompute the daily rollup rows of these attendances (plus
+        ``extra_keys``, e.g. their days before a write). Skipped under the
+        ``skip_attendance_daily`` context key by batch jobs that refresh
+        the rollup once at the end.
+        """
+        if self.env.context.get('skip_attendance_daily'):
+            return
+        Daily = self.env['hr.attendance.daily'].sudo()
+        Daily._refresh_days(list(extra_keys) + Daily._get_day_keys(self.ids))
+
     @api.model
     def auto_checkout_employees(self):
         """
@@ -123,9 +160,9 @@ class HrAttendance(models.Model):
             _logger.info("No active attendance records found for auto-checkout")
             return
         
-        # Auto-checkout these records
+        # Auto-checkout these records; the daily rollup is refreshed once at the end
         count = 0
-        for attendance in active_attendances:
+        for attendance in active_attendances.with_context(skip_attendance_daily=True):
             # Calculate default checkout time (end of work day, 6:00 PM on the same day as check-in)
             checkout_datetime = attendance.check_in.replace(hour=18, minute=0, second=0)
             
@@ -143,5 +180,6 @@ class HrAttendance(models.Model):
                 _logger.info(f"Auto checkout for employee {attendance.employee_id.name} (ID: {attendance.employee_id.id})")
             except Exception as e:
                 _logger.error(f"Failed to auto-checkout attendance {attendance.id}: {e}")
-        
+
+        active_attendances.with_context(skip_attendance_daily=False)._refresh_daily_rollup()
         _logger.info(f"Auto-checkout completed: {count} records processed")
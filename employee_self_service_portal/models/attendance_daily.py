@@ -0,0 +1,264 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from dateutil.relativedelta import relativedelta
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Local time thresholds of the daily flags
+LATE_ARRIVAL_TIME = '09:30'
+EARLY_DEPARTURE_TIME = '17:30'
+# Worked hours above which a day counts as overtime
+OVERTIME_DAY_HOURS = 8.5
+
+# Longest range accepted by _get_range_analytics, in days
+MAX_ANALYTICS_RANGE_DAYS = 3 * 366
+
+# Per-attendance local day, in the employee's timezone
+_ATTENDANCE_DAY_SQL = """
+    SELECT a.employee_id,
+           (a.check_in AT TIME ZONE 'UTC' AT TIME ZONE coalesce(r.tz, 'UTC'))::date
+      FROM hr_attendance a
+      JOIN hr_employee e ON e.id = a.employee_id
+      JOIN resource_resource r ON r.id = e.resource_id
+"""
+
+
+def count_working_days(date_from, date_to):
+    """Number of Monday-Friday days between ``date_from`` and ``date_to``, inclusive."""
+    days = (date_to - date_from).days + 1
+    if days <= 0:
+        return 0
+    full_weeks, remainder = divmod(days, 7)
+    # Each full week has five working days; only the last partial week is walked
+    start = date_from.weekday()
+    return full_weeks * 5 + sum(1 for offset in range(remainder) if (start + offset) % 7 < 5)
+
+
+class HrAttendanceDaily(models.Model):
+    """
+    One row per employee and local day with attendances, rolled up from
+    hr.attendance in the employee's timezone.
+
+    Rows are rewritten in SQL by _refresh_days whenever an attendance of
+    that day is created, changed or deleted, so analytics read a month as
+    a range scan over at most 31 rows.
+    """
+    _name = 'hr.attendance.daily'
+    _description = 'Daily Attendance Summary'
+    _order = 'date desc, employee_id'
+    _rec_name = 'date'
+    _log_access = False
+
+    employee_id = fields.Many2one('hr.employee', required=True, readonly=True, ondelete='cascade')
+    date = fields.Date(required=True, readonly=True)
+    first_check_in = fields.Datetime(readonly=True)
+    last_check_out = fields.Datetime(readonly=True)
+    worked_hours = fields.Float(readonly=True)
+    attendance_count = fields.Integer(readonly=True)
+    is_open = fields.Boolean(readonly=True, help="An attendance of the day has no check-out yet.")
+    is_late_arrival = fields.Boolean(readonly=True)
+    is_early_departure = fields.Boolean(readonly=True)
+    is_overtime = fields.Boolean(readonly=True)
+
+    _employee_date_unique = models.Constraint(
+        'unique (employee_id, date)',
+        'Only one daily attendance summary per employee and day.'
+    )
+
+    def init(self):
+        super().init()
+        # First fill on install, or on upgrade from a version without rollup
+        self.env.cr.execute("SELECT 1 FROM hr_attendance_daily LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._rebuild_days()
+
+    @api.model
+    def _flush_employee_tz(self):
+        """Flush the employee timezone (resource_resource.tz) read by the rollup queries."""
+        self.env['hr.employee'].flush_model(['resource_id'])
+        self.env['resource.resource'].flush_model(['tz'])
+
+    @api.model
+    def _get_day_keys(self, attendance_ids):
+        """Return the ``(employee_id, local date)`` pairs of the given attendances."""
+        if not attendance_ids:
+            return []
+        self.env['hr.attendance'].flush_model(['employee_id', 'check_in'])
+        self._flush_employee_tz()
+        self.env.cr.execute(_ATTENDANCE_DAY_SQL + " WHERE a.id = ANY(%s)", (list(attendance_ids),))
+        return self.env.cr.fetchall()
+
+    @api.model
+    def _refresh_days(self, keys):
+        """
+        Recompute the rows of the given ``(employee_id, date)`` pairs from
+        hr_attendance in one statement; days left without attendances are
+        deleted.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+        self.env['hr.attendance'].flush_model(['employee_id', 'check_in', 'check_out', 'worked_hours'])
+        self._flush_employee_tz()
+        self.env.cr.execute("""
+            WITH keys AS (
+                SELECT k.employee_id, k.date, coalesce(r.tz, 'UTC') AS tz
+                  FROM unnest(%(employee_ids)s::int[], %(dates)s::date[]) AS k(employee_id, date)
+                  JOIN hr_employee e ON e.id = k.employee_id
+                  JOIN resource_resource r ON r.id = e.resource_id
+            ),
+            days AS (
+                SELECT k.employee_id,
+                       k.date,
+                       min(a.check_in) AS first_check_in,
+                       max(a.check_out) AS last_check_out,
+                       coalesce(sum(a.worked_hours), 0) AS worked_hours,
+                       count(*) AS attendance_count,
+                       bool_or(a.check_out IS NULL) AS is_open,
+                       (min(a.check_in) AT TIME ZONE 'UTC' AT TIME ZONE k.tz)::time > %(late)s::time
+                           AS is_late_arrival,
+                       coalesce(bool_or((a.check_out AT TIME ZONE 'UTC' AT TIME ZONE k.tz)::time < %(early)s::time),
+                                false) AS is_early_departure,
+                       coalesce(sum(a.worked_hours), 0) > %(overtime)s AS is_overtime
+                  FROM keys k
+                  JOIN hr_attendance a
+                    ON a.employee_id = k.employee_id
+                   AND a.check_in >= (k.date::timestamp AT TIME ZONE k.tz) AT TIME ZONE 'UTC'
+                   AND a.check_in < ((k.date + 1)::timestamp AT TIME ZONE k.tz) AT TIME ZONE 'UTC'
+              GROUP BY k.employee_id, k.date, k.tz
+            ),
+            emptied AS (
+                DELETE FROM hr_attendance_daily d
+                 USING keys k
+                 WHERE d.employee_id = k.employee_id
+                   AND d.date = k.date
+                   AND NOT EXISTS (SELECT 1 FROM days WHERE days.employee_id = k.employee_id AND days.date = k.date)
+            )
+            INSERT INTO hr_attendance_daily
+                   (employee_id, date, first_check_in, last_check_out, worked_hours, attendance_count,
+                    is_open, is_late_arrival, is_early_departure, is_overtime)
+            SELECT employee_id, date, first_check_in, last_check_out, worked_hours, attendance_count,
+                   is_open, is_late_arrival, is_early_departure, is_overtime
+              FROM days
+            ON CONFLICT (employee_id, date) DO UPDATE
+               SET first_check_in = EXCLUDED.first_check_in,
+                   last_check_out = EXCLUDED.last_check_out,
+                   worked_hours = EXCLUDED.worked_hours,
+                   attendance_count = EXCLUDED.attendance_count,
+                   is_open = EXCLUDED.is_open,
+                   is_late_arrival = EXCLUDED.is_late_arrival,
+                   is_early_departure = EXCLUDED.is_early_departure,
+                   is_overtime = EXCLUDED.is_overtime
+        """, {
+            'employee_ids': [employee_id for employee_id, _date in keys],
+            'dates': [date for _employee_id, date in keys],
+            'late': LATE_ARRIVAL_TIME,
+            'early': EARLY_DEPARTURE_TIME,
+            'overtime': OVERTIME_DAY_HOURS,
+        })
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild_days(self, employee_ids=None):
+        """Recompute every day of ``employee_ids`` (all employees when None), e.g. after a timezone change."""
+        self.env['hr.attendance'].flush_model(['employee_id', 'check_in'])
+        self._flush_employee_tz()
+        if employee_ids is None:
+            self.env.cr.execute("DELETE FROM hr_attendance_daily")
+            self.env.cr.execute(_ATTENDANCE_DAY_SQL + " GROUP BY 1, 2")
+        else:
+            self.env.cr.execute("DELETE FROM hr_attendance_daily WHERE employee_id = ANY(%s)", (list(employee_ids),))
+            self.env.cr.execute(_ATTENDANCE_DAY_SQL + " WHERE a.employee_id = ANY(%s) GROUP BY 1, 2",
+                                (list(employee_ids),))
+        keys = self.env.cr.fetchall()
+        self._refresh_days(keys)
+        _logger.info("Daily attendance summaries rebuilt: %s", len(keys))
+
+    @api.model
+    def _get_period_stats(self, employee_id, date_from, date_to):
+        """
+        Return the attendance figures of ``employee_id`` between the local
+        dates ``date_from`` and ``date_to`` (inclusive): attended ``days``,
+        ``hours``, and the ``late_days``, ``early_days`` and
+        ``overtime_days`` counts.
+        """
+        self.env.cr.execute("""
+            SELECT count(*),
+                   coalesce(sum(worked_hours), 0),
+                   count(*) FILTER (WHERE is_late_arrival),
+                   count(*) FILTER (WHERE is_early_departure),
+                   count(*) FILTER (WHERE is_overtime)
+              FROM hr_attendance_daily
+             WHERE employee_id = %s
+               AND date BETWEEN %s AND %s
+        """, (employee_id, date_from, date_to))
+        days, hours, late_days, early_days, overtime_days = self.env.cr.fetchone()
+        return {
+            'days': days,
+            'hours': hours,
+            'late_days': late_days,
+            'early_days': early_days,
+            'overtime_days': overtime_days,
+        }
+
+    @api.model
+    def _get_range_analytics(self, employee_id, date_from, date_to):
+        """
+        Return ``{'months': [...], 'weeks': [...]}`` for ``employee_id``
+        between the local dates ``date_from`` and ``date_to``, aggregated
+        per calendar month and per ISO week in one grouping-sets query.
+
+        Every period overlapping the range is listed, oldest first, even
+        without attendances; each is a dict with ``date_start`` and
+        ``date_end`` (clipped to the range), ``days``, ``hours``,
+        ``avg_hours``, ``late_days``, ``early_days``, ``overtime_days``,
+        ``working_days`` and ``attendance_percentage``.
+        """
+        if date_from > date_to:
+            raise UserError(_("The start date must be before the end date."))
+        if (date_to - date_from).days >= MAX_ANALYTICS_RANGE_DAYS:
+            raise UserError(_("Attendance analytics cover at most %s days.", MAX_ANALYTICS_RANGE_DAYS))
+
+        self.env.cr.execute("""
+            SELECT GROUPING(date_trunc('month', date::timestamp)) = 0 AS is_month,
+                   coalesce(date_trunc('month', date::timestamp), date_trunc('week', date::timestamp))::date,
+                   count(*),
+                   coalesce(sum(worked_hours), 0),
+                   count(*) FILTER (WHERE is_late_arrival),
+                   count(*) FILTER (WHERE is_early_departure),
+                   count(*) FILTER (WHERE is_overtime)
+              FROM hr_attendance_daily
+             WHERE employee_id = %s
+               AND date BETWEEN %s AND %s
+          GROUP BY GROUPING SETS ((date_trunc('month', date::timestamp)), (date_trunc('week', date::timestamp)))
+        """, (employee_id, date_from, date_to))
+        stats = {(is_month, start): rest for is_month, start, *rest in self.env.cr.fetchall()}
+
+        def periods(is_month, start, step):
+            result = []
+            while start <= date_to:
+                end = start + step - timedelta(days=1)
+                days, hours, late_days, early_days, overtime_days = stats.get((is_month, start), (0, 0.0, 0, 0, 0))
+                period_start, period_end = max(start, date_from), min(end, date_to)
+                working_days = count_working_days(period_start, period_end)
+                result.append({
+                    'date_start': period_start,
+                    'date_end': period_end,
+                    'days': days,
+                    'hours': hours,
+                    'avg_hours': hours / days if days else 0.0,
+                    'late_days': late_days,
+                    'early_days': early_days,
+                    'overtime_days': overtime_days,
+                    'working_days': working_days,
+                    'attendance_percentage': days / working_days * 100 if working_days else 0.0,
+                })
+                start += step
+            return result
+
+        return {
+            'months': periods(True, date_from.replace(day=1), relativedelta(months=1)),
+            'weeks': periods(False, date_from - timedelta(days=date_from.weekday()), relativedelta(weeks=1)),
+        }
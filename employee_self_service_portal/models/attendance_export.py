@@ -0,0 +1,207 @@
+from odoo import models, api, _
+from odoo.exceptions import UserError
+from contextlib import closing
+from datetime import time
+import csv
+import io
+import logging
+import tempfile
+
+from .attendance_daily import EARLY_DEPARTURE_TIME, LATE_ARRIVAL_TIME
+
+_logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the export's server-side cursor
+EXPORT_FETCH_SIZE = 2000
+# Export formats → (mimetype, file extension)
+EXPORT_FORMATS = {
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'csv': ('text/csv', 'csv'),
+}
+EXPORT_HEADERS = [
+    'Date', 'Day', 'Check-In Time', 'Check-In Location',
+    'Check-Out Time', 'Check-Out Location', 'Worked Hours', 'Status'
+]
+# Column widths of the XLSX export, employee column first
+EXPORT_COLUMN_WIDTHS = [25, 12, 10, 15, 30, 15, 30, 12, 15]
+
+
+class HrAttendanceExport(models.AbstractModel):
+    """
+    Attendance export pipeline shared by the portal (one employee) and HR
+    (many employees): rows are read through a server-side cursor and
+    written in one pass to a temporary file, which the caller streams.
+    """
+    _name = 'hr.attendance.export'
+    _description = 'Attendance Export'
+
+    @api.model
+    def _iter_rows(self, employee_ids, date_from, date_to, tz_name):
+        """
+        Yield ``(employee, check_in, check_in_location, check_out,
+        check_out_location, worked_hours)`` for the attendances of
+        ``employee_ids`` whose local check-in day lies between ``date_from``
+        and ``date_to``; check-in and check-out are local to ``tz_name``.
+        Rows are fetched EXPORT_FETCH_SIZE at a time.
+        """
+        self.env['hr.attendance'].flush_model([
+            'employee_id', 'check_in', 'check_out', 'check_in_location', 'check_out_location', 'worked_hours',
+        ])
+        cr = self.env.cr
+        cr.execute("""
+            DECLARE hr_attendance_export NO SCROLL CURSOR FOR
+             SELECT e.name,
+                    a.check_in AT TIME ZONE 'UTC' AT TIME ZONE %(tz)s,
+                    a.check_in_location,
+                    a.check_out AT TIME ZONE 'UTC' AT TIME ZONE %(tz)s,
+                    a.check_out_location,
+                    a.worked_hours
+               FROM hr_attendance a
+               JOIN hr_employee e ON e.id = a.employee_id
+              WHERE a.employee_id = ANY(%(employee_ids)s)
+                AND a.check_in >= (%(date_from)s::date::timestamp AT TIME ZONE %(tz)s) AT TIME ZONE 'UTC'
+                AND a.check_in < ((%(date_to)s::date + 1)::timestamp AT TIME ZONE %(tz)s) AT TIME ZONE 'UTC'
+           ORDER BY e.name, a.employee_id, a.check_in DESC
+        """, {
+            'employee_ids': list(employee_ids),
+            'date_from': date_from,
+            'date_to': date_to,
+            'tz': tz_name,
+        })
+        try:
+            while True:
+                cr.execute("FETCH %s FROM hr_attendance_export", (EXPORT_FETCH_SIZE,))
+                rows = cr.fetchall()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cr.execute("CLOSE hr_attendance_export")
+
+    @api.model
+    def _get_status(self, check_in, check_out):
+        status = 'Complete' if check_out else 'Active'
+        if check_in and check_in.time() > time.fromisoformat(LATE_ARRIVAL_TIME):
+            status += ' (Late)'
+        if check_out and check_out.time() < time.fromisoformat(EARLY_DEPARTURE_TIME):
+            status += ' (Early)'
+        return status
+
+    @api.model
+    def _write_xlsx(self, fileobj, rows, with_employee):
+        """Write ``rows`` and the summary to ``fileobj`` in xlsxwriter's constant_memory mode."""
+        try:
+            import xlsxwriter
+        except ImportError:
+            raise UserError(_("The xlsxwriter library is required for XLSX exports."))
+
+        workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Attendance Report')
+
+        header_format = workbook.add_format({
+            'bold': True,
+            'bg_color': '#4472C4',
+            'font_color': 'white',
+            'border': 1
+        })
+        date_format = workbook.add_format({'num_format': 'dd/mm/yyyy'})
+        time_format = workbook.add_format({'num_format': 'hh:mm AM/PM'})
+        hours_format = workbook.add_format({'num_format': '0.00'})
+
+        offset = 1 if with_employee else 0
+        widths = EXPORT_COLUMN_WIDTHS if with_employee else EXPORT_COLUMN_WIDTHS[1:]
+        for col, width in enumerate(widths):
+            worksheet.set_column(col, col, width)
+
+        headers = (['Employee'] if with_employee else []) + EXPORT_HEADERS
+        for col, header in enumerate(headers):
+            worksheet.write(0, col, header, header_format)
+
+        # Rows must be written in order in constant_memory mode; the summary is accumulated on the way
+        count = 0
+        total_hours = 0.0
+        for employee, check_in, in_location, check_out, out_location, worked_hours in rows:
+            count += 1
+            total_hours += worked_hours or 0.0
+            if with_employee:
+                worksheet.write(count, 0, employee)
+            worksheet.write_datetime(count, offset, check_in, date_format)
+            worksheet.write(count, offset + 1, check_in.strftime('%A'))
+            worksheet.write_datetime(count, offset + 2, check_in, time_format)
+            worksheet.write(count, offset + 3, in_location or '')
+            if check_out:
+                worksheet.write_datetime(count, offset + 4, check_out, time_format)
+            worksheet.write(count, offset + 5, out_location or '')
+            worksheet.write(count, offset + 6, worked_hours or 0, hours_format)
+            worksheet.write(count, offset + 7, self._get_status(check_in, check_out))
+
+        summary_row = count + 3
+        worksheet.write(summary_row, 0, 'SUMMARY', header_format)
+        worksheet.write(summary_row + 1, 0, 'Total Days:')
+        worksheet.write(summary_row + 1, 1, count)
+        worksheet.write(summary_row + 2, 0, 'Total Hours:')
+        worksheet.write(summary_row + 2, 1, total_hours, hours_format)
+        worksheet.write(summary_row + 3, 0, 'Average Hours/Day:')
+        worksheet.write(summary_row + 3, 1, total_hours / count if count else 0, hours_format)
+
+        workbook.close()
+        return count
+
+    @api.model
+    def _write_csv(self, fileobj, rows, with_employee):
+        """Write ``rows`` and the summary to the binary ``fileobj`` as UTF-8 CSV."""
+        stream = io.TextIOWrapper(fileobj, encoding='utf-8', newline='')
+        writer = csv.writer(stream)
+        writer.writerow((['Employee'] if with_employee else []) + EXPORT_HEADERS)
+
+        count = 0
+        total_hours = 0.0
+        for employee, check_in, in_location, check_out, out_location, worked_hours in rows:
+            count += 1
+            total_hours += worked_hours or 0.0
+            writer.writerow(([employee] if with_employee else []) + [
+                check_in.strftime('%d/%m/%Y'),
+                check_in.strftime('%A'),
+                check_in.strftime('%I:%M %p'),
+                in_location or '',
+                check_out.strftime('%I:%M %p') if check_out else '',
+                out_location or '',
+                '%.2f' % (worked_hours or 0),
+                self._get_status(check_in, check_out),
+            ])
+
+        writer.writerow([])
+        writer.writerow(['SUMMARY'])
+        writer.writerow(['Total Days:', count])
+        writer.writerow(['Total Hours:', '%.2f' % total_hours])
+        writer.writerow(['Average Hours/Day:', '%.2f' % (total_hours / count if count else 0)])
+        # Hand the underlying file back to the caller open
+        stream.flush()
+        stream.detach()
+        return count
+
+    @api.model
+    def _export(self, employees, date_from, date_to, tz_name, file_format='xlsx'):
+        """
+        Export the attendances of ``employees`` between the local dates
+        ``date_from`` and ``date_to`` into a temporary file.
+
+        Returns ``(fileobj, mimetype, extension)``; ``fileobj`` is rewound
+        and is deleted once closed by the caller.
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise UserError(_("Unsupported export format %s.", file_format))
+        mimetype, extension = EXPORT_FORMATS[file_format]
+        with_employee = len(employees) > 1
+
+        fileobj = tempfile.TemporaryFile()
+        try:
+            writer = self._write_xlsx if file_format == 'xlsx' else self._write_csv
+            with closing(self._iter_rows(employees.ids, date_from, date_to, tz_name)) as rows:
+                count = writer(fileobj, rows, with_employee)
+        except Exception:
+            fileobj.close()
+            raise
+        _logger.info("Attendance export: %s rows for %s employee(s) as %s", count, len(employees), file_format)
+        fileobj.seek(0)
+        return fileobj, mimetype, extension
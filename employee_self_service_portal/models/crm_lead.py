@@ -4,7 +4,16 @@ from odoo import models, fields, api
 
 
 class CrmLead(models.Model):
-    _inherit = 'crm.lead'
+    _name = 'crm.lead'
+    _inherit = ['crm.lead', 'ess.dashboard.source.mixin']
+    _ess_dashboard_fields = ('user_id', 'stage_id', 'expected_revenue', 'active')
+
+    def _ess_dashboard_employee_ids(self):
+        # Leads count on the dashboard of their salesperson's employee
+        user_ids = self.sudo().user_id.ids
+        if not user_ids:
+            return []
+        return self.env['hr.employee'].sudo().search([('user_id', 'in', user_ids)]).ids
 
     @api.onchange('partner_id')
     def _onchange_partner_id_point_of_contact_portal(self):
@@ -0,0 +1,193 @@
+from odoo import models, fields, api
+from odoo.tools import str2bool
+from datetime import datetime
+import json
+import logging
+import pytz
+
+_logger = logging.getLogger(__name__)
+
+# Stale snapshots recomputed per run of the refresh cron.
+SNAPSHOT_REFRESH_BATCH_SIZE = 200
+
+
+class EssDashboardSnapshot(models.Model):
+    """
+    Cached ESS dashboard tiles of one employee (see
+    hr.employee._get_ess_dashboard_aggregates).
+
+    ``version`` is bumped by the source models whenever a change may
+    affect the tiles; ``payload_version`` is the version the payload was
+    computed at, so a snapshot is stale while the two differ.
+    """
+    _name = 'ess.dashboard.snapshot'
+    _description = 'ESS Dashboard Snapshot'
+    _rec_name = 'employee_id'
+    _log_access = False
+
+    employee_id = fields.Many2one('hr.employee', required=True, readonly=True, ondelete='cascade')
+    user_id = fields.Many2one('res.users', readonly=True)
+    tz = fields.Char(readonly=True)
+    snapshot_date = fields.Date(readonly=True, help="Local day the payload was computed for.")
+    payload = fields.Json(readonly=True)
+    version = fields.Integer(readonly=True, default=0)
+    payload_version = fields.Integer(readonly=True, default=0)
+    computed_at = fields.Datetime(readonly=True)
+
+    _employee_unique = models.Constraint(
+        'unique (employee_id)',
+        'An employee can only have one dashboard snapshot.'
+    )
+
+    @api.model
+    def _is_stale_while_revalidate(self):
+        """Serve stale snapshots and refresh them by cron (employee_self_service_portal.dashboard_swr)."""
+        return str2bool(
+            self.env['ir.config_parameter'].sudo().get_param('employee_self_service_portal.dashboard_swr', 'False'),
+            default=False
+        )
+
+    @api.model
+    def _get_dashboard_aggregates(self, employee, user, tz_name, today_local):
+        """
+        Return the dashboard aggregates of ``employee``, read from its
+        snapshot when it is current.
+
+        A snapshot computed for another user, timezone or day is always
+        recomputed. One that was only invalidated is served as is in
+        stale-while-revalidate mode, and the refresh cron is triggered;
+        otherwise it is recomputed inline.
+        """
+        self.env.cr.execute("""
+            SELECT payload, version, payload_version, user_id, tz, snapshot_date
+              FROM ess_dashboard_snapshot
+             WHERE employee_id = %s
+        """, (employee.id,))
+        row = self.env.cr.fetchone()
+        version = 0
+        if row:
+            payload, version, payload_version, user_id, tz, snapshot_date = row
+            if user_id == user.id and tz == tz_name and snapshot_date == today_local:
+                if payload_version == version:
+                    return payload
+                if self._is_stale_while_revalidate():
+                    self._trigger_snapshot_refresh()
+                    return payload
+
+        return self._store_snapshot(employee, user, tz_name, today_local, version)
+
+    @api.model
+    def _store_snapshot(self, employee, user, tz_name, today_local, version):
+        """
+        Compute the aggregates of ``employee`` and upsert its snapshot as of
+        ``version``, the version read before computing: an invalidation
+        landing meanwhile leaves the snapshot stale rather than being lost.
+        """
+        payload = employee._get_ess_dashboard_aggregates(user, today_local)
+        self.env.cr.execute("""
+            INSERT INTO ess_dashboard_snapshot
+                   (employee_id, user_id, tz, snapshot_date, payload, version, payload_version, computed_at)
+            VALUES (%(employee_id)s, %(user_id)s, %(tz)s, %(date)s, %(payload)s, %(version)s, %(version)s, %(now)s)
+            ON CONFLICT (employee_id) DO UPDATE
+               SET user_id = EXCLUDED.user_id,
+                   tz = EXCLUDED.tz,
+                   snapshot_date = EXCLUDED.snapshot_date,
+                   payload = EXCLUDED.payload,
+                   payload_version = EXCLUDED.payload_version,
+                   computed_at = EXCLUDED.computed_at
+        """, {
+            'employee_id': employee.id,
+            'user_id': user.id,
+            'tz': tz_name,
+            'date': today_local,
+            'payload': json.dumps(payload),
+            'version': version,
+            'now': fields.Datetime.now(),
+        })
+        self.invalidate_model()
+        return payload
+
+    @api.model
+    def _invalidate_employees(self, employee_ids):
+        """Mark the snapshots of ``employee_ids`` stale with one UPDATE."""
+        employee_ids = [employee_id for employee_id in set(employee_ids) if employee_id]
+        if not employee_ids:
+            return
+        self.env.cr.execute("""
+            UPDATE ess_dashboard_snapshot
+               SET version = version + 1
+             WHERE employee_id = ANY(%s)
+        """, (employee_ids,))
+        if self.env.cr.rowcount:
+            self.invalidate_model(['version'])
+
+    @api.model
+    def _trigger_snapshot_refresh(self):
+        cron = self.env.ref('employee_self_service_portal.ir_cron_refresh_dashboard_snapshots',
+                            raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    @api.model
+    def _refresh_stale_snapshots(self):
+        """Recompute up to SNAPSHOT_REFRESH_BATCH_SIZE stale snapshots for their own day; re-trigger if more remain."""
+        self.env.cr.execute("""
+            SELECT id
+              FROM ess_dashboard_snapshot
+             WHERE payload_version < version
+          ORDER BY id
+             LIMIT %s
+        """, (SNAPSHOT_REFRESH_BATCH_SIZE + 1,))
+        snapshot_ids = [row[0] for row in self.env.cr.fetchall()]
+        snapshots = self.sudo().browse(snapshot_ids[:SNAPSHOT_REFRESH_BATCH_SIZE])
+
+        now_utc = datetime.now(pytz.UTC)
+        for snapshot in snapshots:
+            if not snapshot.user_id or snapshot.user_id != snapshot.employee_id.user_id:
+                # The next page view recomputes it for the current user
+                continue
+            tz_name = snapshot.tz or 'UTC'
+            today_local = now_utc.astimezone(pytz.timezone(tz_name)).date()
+            self._store_snapshot(snapshot.employee_id, snapshot.user_id, tz_name, today_local, snapshot.version)
+
+        _logger.info("Dashboard snapshots refreshed: %s", len(snapshots))
+        if len(snapshot_ids) > SNAPSHOT_REFRESH_BATCH_SIZE:
+            self._trigger_snapshot_refresh()
+
+
+class EssDashboardSourceMixin(models.AbstractModel):
+    """
+    Invalidates the dashboard snapshots of the employees whose records are
+    created, deleted or changed on one of ``_ess_dashboard_fields``.
+    """
+    _name = 'ess.dashboard.source.mixin'
+    _description = 'ESS Dashboard Source'
+
+    # Fields whose changes affect the dashboard tiles
+    _ess_dashboard_fields = ('employee_id',)
+
+    def _ess_dashboard_employee_ids(self):
+        return self.sudo().employee_id.ids
+
+    def _invalidate_ess_dashboard(self, employee_ids):
+        self.env['ess.dashboard.snapshot'].sudo()._invalidate_employees(employee_ids)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._invalidate_ess_dashboard(records._ess_dashboard_employee_ids())
+        return records
+
+    def write(self, vals):
+        if not any(name in vals for name in self._ess_dashboard_fields):
+            return super().write(vals)
+        employee_ids = self._ess_dashboard_employee_ids()
+        res = super().write(vals)
+        self._invalidate_ess_dashboard(employee_ids + self._ess_dashboard_employee_ids())
+        return res
+
+    def unlink(self):
+        employee_ids = self._ess_dashboard_employee_ids()
+        res = super().unlink()
+        self._invalidate_ess_dashboard(employee_ids)
+        return res
@@ -1,9 +1,17 @@
 from odoo import models, fields, api
+from odoo.exceptions import AccessError
+from datetime import timedelta
+
+# CRM stage names counted as new and won leads on the ESS dashboard.
+ESS_NEW_LEAD_STAGES = ('New', 'Qualification')
+ESS_WON_LEAD_STAGE = 'Won'
+# Ticket states counted as pending on the ESS dashboard.
+ESS_PENDING_TICKET_STATES = ('draft', 'manager_approval', 'it_approval')
 
 class HREmployee(models.Model):
     _inherit = 'hr.employee'
 
-    user_id = fields.Many2one('res.users', string="Portal User", help="Portal user linked to this employee")
+    user_id = fields.Many2one('res.users', string="Portal User", help="Portal user linked to this employee", index=True)
     portal_access_crm = fields.Boolean("Portal Access CRM", default=False, help="Allow access to CRM functionality in portal")
     portal_access_attendance = fields.Boolean("Portal Access Attendance", default=True, help="Allow access to attendance functionality in portal")
     # portal_access_expenses = fields.Boolean("Portal Access Expenses", default=False, help="Allow access to expenses functionality in portal")
@@ -31,6 +39,12 @@ class HREmployee(models.Model):
         
         if any(field in vals for field in portal_fields):
             self._update_portal_access_groups()
+
+        # Attendance days are local to the employee's timezone; the rebuild
+        # bypasses the hr.attendance hooks, so the dashboard is invalidated here
+        if 'tz' in vals:
+            self.env['hr.attendance.daily'].sudo()._rebuild_days(self.ids)
+            self.env['ess.dashboard.snapshot'].sudo()._invalidate_employees(self.ids)
         
         return res
     
@@ -83,6 +97,10 @@ class HREmployee(models.Model):
                         DELETE FROM res_groups_users_rel
                         WHERE gid = %s AND uid = %s
                     """, (group.id, user.id))
+
+        # Group rows were changed behind the ORM: drop cached memberships
+        self.env['res.users'].invalidate_model(['group_ids'])
+        self.env['it.group.resolver']._invalidate_group_cache()
     
     x_experience = fields.Text("Experience")
     x_skills = fields.Char("Skills")
@@ -98,3 +116,113 @@ class HREmployee(models.Model):
     x_passport_issue = fields.Date("Passport Issue Date")
     x_passport_expiry = fields.Date("Passport Expiry Date")
     employee_id = fields.Char("Employee ID")
+
+    def _get_ess_dashboard_aggregates(self, user, today_local):
+        """
+        Return the ESS dashboard tiles of the employee as plain scalars.
+
+        Every source is reduced in the database (one grouped read or SQL
+        aggregate per model), so the cost of a page view does not grow with
+        the employee's history. ``today_local`` is today in the user's
+        timezone; attendance figures come from hr.attendance.daily, whose
+        days follow the employee's timezone. Tickets are counted with
+        ``user``'s access rights.
+        """
+        self.ensure_one()
+        month_start = today_local.replace(day=1)
+        week_start = today_local - timedelta(days=today_local.weekday())
+        year_start = today_local.replace(month=1, day=1)
+
+        payslips_count = self.env['hr.payslip'].sudo().search_count([('employee_id', '=', self.id)])
+
+        # Hours this week and days attended this month, from the daily rollup
+        self.env.cr.execute("""
+            SELECT coalesce(sum(worked_hours) FILTER (WHERE date >= %(week_start)s), 0),
+                   count(*) FILTER (WHERE date >= %(month_start)s)
+              FROM hr_attendance_daily
+             WHERE employee_id = %(employee_id)s
+               AND date >= least(%(week_start)s, %(month_start)s)
+               AND date <= %(today)s
+        """, {
+            'employee_id': self.id,
+            'week_start': week_start,
+            'month_start': month_start,
+            'today': today_local,
+        })
+        weekly_hours, attended_days = self.env.cr.fetchone()
+
+        # Leads per stage; only the few stages involved are read by name
+        lead_groups = self.env['crm.lead'].sudo()._read_group(
+            [('user_id', '=', user.id)], ['stage_id'], ['__count', 'expected_revenue:sum']
+        )
+        crm = {'total_leads': 0, 'new_leads': 0, 'won_leads': 0, 'total_revenue': 0.0}
+        for stage, count, revenue in lead_groups:
+            crm['total_leads'] += count
+            crm['total_revenue'] += revenue or 0.0
+            if stage.name in ESS_NEW_LEAD_STAGES:
+                crm['new_leads'] += count
+            elif stage.name == ESS_WON_LEAD_STAGE:
+                crm['won_leads'] += count
+        crm['conversion_rate'] = crm['won_leads'] / crm['total_leads'] * 100 if crm['total_leads'] else 0
+
+        # This month's expenses by state, plus the year-to-date total
+        self.env['hr.expense'].flush_model(['employee_id', 'date', 'total_amount', 'state'])
+        self.env.cr.execute("""
+            SELECT count(*) FILTER (WHERE this_month),
+                   coalesce(sum(amount) FILTER (WHERE this_month), 0),
+                   coalesce(sum(amount), 0),
+                   count(*) FILTER (WHERE this_month AND state = 'submitted'),
+                   coalesce(sum(amount) FILTER (WHERE this_month AND state = 'submitted'), 0),
+                   count(*) FILTER (WHERE this_month AND state = 'approved'),
+                   coalesce(sum(amount) FILTER (WHERE this_month AND state = 'approved'), 0),
+                   count(*) FILTER (WHERE this_month AND state = 'draft'),
+                   coalesce(sum(amount) FILTER (WHERE this_month AND state = 'draft'), 0)
+              FROM (SELECT total_amount AS amount,
+                           state,
+                           date >= %(month_start)s AS this_month
+                      FROM hr_expense
+                     WHERE employee_id = %(employee_id)s
+                       AND date >= %(year_start)s
+                       AND date <= %(today)s) expense
+        """, {
+            'employee_id': self.id,
+            'month_start': month_start,
+            'year_start': year_start,
+            'today': today_local,
+        })
+        (total_count, total_amount, ytd_total, submitted_count, submitted_amount,
+         approved_count, approved_amount, draft_count, draft_amount) = self.env.cr.fetchone()
+        total_amount, ytd_total, submitted_amount, approved_amount, draft_amount = map(
+            float, (total_amount, ytd_total, submitted_amount, approved_amount, draft_amount)
+        )
+
+        tickets_count = tickets_pending = 0
+        try:
+            ticket_groups = self.env['it.ticket'].with_user(user)._read_group(
+                [('employee_id', '=', self.id)], ['state'], ['__count']
+            )
+            tickets_count = sum(count for _state, count in ticket_groups)
+            tickets_pending = sum(count for state, count in ticket_groups if state in ESS_PENDING_TICKET_STATES)
+        except AccessError:
+            pass
+
+        return {
+            'payslips_count': payslips_count,
+            'weekly_hours': weekly_hours,
+            'attended_days': attended_days,
+            'crm': crm,
+            'expenses': {
+                'total_count': total_count,
+                'total_amount': total_amount,
+                'ytd_total': ytd_total,
+                'submitted_count': submitted_count,
+                'submitted_amount': submitted_amount,
+                'approved_count': approved_count,
+                'approved_amount': approved_amount,
+                'draft_count': draft_count,
+                'draft_amount': draft_amount,
+                'pending_count': submitted_count,
+            },
+            'it_tickets_count': tickets_count,
+            'it_tickets_pending': tickets_pending,
+        }
@@ -4,7 +4,10 @@ from odoo import api, models, fields, _
 from odoo.exceptions import UserError, ValidationError
 
 class HrExpense(models.Model):
-    _inherit = 'hr.expense'
+    _name = 'hr.expense'
+    _inherit = ['hr.expense', 'ess.dashboard.source.mixin']
+    _ess_dashboard_fields = ('employee_id', 'date', 'total_amount', 'total_amount_currency',
+                             'state', 'approval_state', 'account_move_id')
     
 @api.model
 def create(self, vals):
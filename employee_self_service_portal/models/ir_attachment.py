@@ -0,0 +1,113 @@
+import hashlib
+import logging
+import mimetypes
+import os
+import tempfile
+
+from odoo import models, api, _
+from odoo.exceptions import UserError
+from odoo.tools.mimetypes import guess_mimetype
+
+_logger = logging.getLogger(__name__)
+
+# Uploads are copied to the filestore in chunks of this size.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Default upper bound for a single portal upload.
+UPLOAD_MAX_SIZE = 50 * 1024 * 1024
+
+
+class IrAttachment(models.Model):
+    _inherit = 'ir.attachment'
+
+    @api.model
+    def _create_from_upload(self, upload, vals, max_size=UPLOAD_MAX_SIZE, allowed_mimetypes=None):
+        """
+        Create an attachment from a werkzeug ``FileStorage`` without loading
+        it in memory.
+
+        The upload is streamed in UPLOAD_CHUNK_SIZE chunks into a temporary
+        file inside the filestore while its sha1 and size are computed, then
+        renamed to its content-addressed path. Identical content already in
+        the filestore is reused, so each distinct file is stored once. The
+        mimetype is sniffed from the first chunk, not taken from the client.
+
+        Raises UserError when the upload is empty, exceeds ``max_size`` or
+        its sniffed mimetype is not in ``allowed_mimetypes``.
+        """
+        stream = upload.stream
+        try:
+            stream.seek(0)
+        except (AttributeError, OSError):
+            pass
+
+        first_chunk = stream.read(UPLOAD_CHUNK_SIZE)
+        if not first_chunk:
+            raise UserError(_("The uploaded file %s is empty.", upload.filename))
+
+        mimetype = self._sniff_upload_mimetype(first_chunk, upload.filename)
+        if allowed_mimetypes and mimetype not in allowed_mimetypes:
+            raise UserError(_("File type %s is not allowed.", mimetype))
+
+        vals = dict(vals, mimetype=mimetype, type='binary')
+        vals.setdefault('name', upload.filename)
+
+        if self._storage() != 'file':
+            # Database storage keeps the content in a column anyway; read it
+            # once as raw bytes (no base64 copy), still bounded by max_size.
+            raw = first_chunk + stream.read(max_size + 1 - len(first_chunk))
+            if len(raw) > max_size:
+                raise UserError(_("File %s exceeds the maximum size.", upload.filename))
+            return self.create(dict(vals, raw=raw))
+
+        sha = hashlib.sha1()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(prefix='upload-', dir=self._filestore())
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                chunk = first_chunk
+                while chunk:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise UserError(_("File %s exceeds the maximum size.", upload.filename))
+                    sha.update(chunk)
+                    tmp.write(chunk)
+                    chunk = stream.read(UPLOAD_CHUNK_SIZE)
+
+            checksum = sha.hexdigest()
+            fname = checksum[:2] + '/' + checksum
+            full_path = self._full_path(fname)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if os.path.isfile(full_path):
+                if os.path.getsize(full_path) != size:
+                    raise UserError(_("The attachment collides with an existing file."))
+                _logger.info("Upload %s deduplicated against %s", upload.filename, fname)
+            else:
+                os.replace(tmp_path, full_path)
+                self._mark_for_gc(fname)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+        return self.create(dict(
+            vals,
+            store_fname=fname,
+            checksum=checksum,
+            file_size=size,
+        ))
+
+    @api.model
+    def _sniff_upload_mimetype(self, head, filename):
+        """Guess the mimetype from the first bytes, falling back on the filename."""
+        mimetype = guess_mimetype(head, default='application/octet-stream')
+        if mimetype in ('application/octet-stream', 'application/zip'):
+            # Office documents are zip containers; their exact type needs the
+            # whole archive, so trust the extension for those.
+            by_name = mimetypes.guess_type(filename or '')[0]
+            if by_name:
+                mimetype = by_name
+        # Same rule as ir.attachment._check_contents: markup uploaded from the
+        # portal must never be served back as active content.
+        if 'ht' in mimetype or 'svg' in mimetype or 'javascript' in mimetype \
+                or ('xml' in mimetype and 'openxmlformats' not in mimetype):
+            mimetype = 'text/plain'
+        return mimetype
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models
+
+
+class ITTicket(models.Model):
+    _name = 'it.ticket'
+    _inherit = ['it.ticket', 'ess.dashboard.source.mixin']
+    _ess_dashboard_fields = ('employee_id', 'state')
@@ -3,7 +3,9 @@ from odoo import models, fields, api
 
 
 class HrPayslip(models.Model):
-    _inherit = 'hr.payslip'
+    _name = 'hr.payslip'
+    _inherit = ['hr.payslip', 'ess.dashboard.source.mixin']
+    _ess_dashboard_fields = ('employee_id', 'state')
 
     @api.model
     def get_portal_payslips_count(self, employee_id):
@@ -0,0 +1,2 @@
+from . import test_attendance_daily
+from . import test_dashboard_aggregates
@@ -0,0 +1,32 @@
+from odoo.tests import TransactionCase, tagged
+from datetime import date, datetime
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceDaily(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env['hr.employee'].create({'name': 'Rollup Employee', 'tz': 'UTC'})
+
+    def _daily_dates(self):
+        return self.env['hr.attendance.daily'].search([('employee_id', '=', self.employee.id)]).mapped('date')
+
+    def test_timezone_change_rebuilds_days(self):
+        """A late-evening UTC attendance moves to the next local day once the employee is UTC+4."""
+        self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': datetime(2024, 3, 4, 21, 0),
+            'check_out': datetime(2024, 3, 4, 23, 0),
+        })
+        self.assertEqual(self._daily_dates(), [date(2024, 3, 4)])
+        Snapshot = self.env['ess.dashboard.snapshot']
+        Snapshot._get_dashboard_aggregates(self.employee, self.env.user, 'UTC', date(2024, 3, 5))
+        snapshot = Snapshot.search([('employee_id', '=', self.employee.id)])
+        self.assertEqual(snapshot.version, snapshot.payload_version)
+
+        self.employee.write({'tz': 'Asia/Dubai'})
+        self.assertEqual(self._daily_dates(), [date(2024, 3, 5)])
+        # The dashboard figures were bucketed in the old timezone
+        self.assertGreater(snapshot.version, snapshot.payload_version)
@@ -0,0 +1,140 @@
+from odoo.tests import TransactionCase, new_test_user, tagged
+from dateutil.relativedelta import relativedelta
+from datetime import date, datetime, time, timedelta
+
+# Upper bound of the queries issued by _get_ess_dashboard_aggregates
+DASHBOARD_MAX_QUERIES = 12
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardAggregates(TransactionCase):
+    """
+    The dashboard tiles of an employee with five years of history, checked
+    against hand-computed values and against the query count of an
+    employee without history.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # A Wednesday; the week started on Monday 2025-06-16
+        cls.today = date(2025, 6, 18)
+        cls.user = new_test_user(cls.env, 'ess_dashboard_user', 'base.group_user')
+        cls.employee = cls.env['hr.employee'].create({
+            'name': 'Long Tenured Employee',
+            'user_id': cls.user.id,
+            'tz': 'UTC',
+        })
+        cls.newcomer_user = new_test_user(cls.env, 'ess_dashboard_newcomer', 'base.group_user')
+        cls.newcomer = cls.env['hr.employee'].create({
+            'name': 'Newcomer',
+            'user_id': cls.newcomer_user.id,
+            'tz': 'UTC',
+        })
+        first_day = cls.today - relativedelta(years=5)
+        months = [first_day.replace(day=1) + relativedelta(months=index) for index in range(60)]
+
+        # One payslip per month
+        cls.env['hr.payslip'].create([{
+            'name': 'Payslip %s' % month.strftime('%Y-%m'),
+            'employee_id': cls.employee.id,
+            'date_from': month,
+            'date_to': month + relativedelta(months=1, days=-1),
+        } for month in months])
+
+        # One 8 hour attendance (08:00-16:00 UTC) per working day up to today
+        days = [first_day + timedelta(days=offset) for offset in range((cls.today - first_day).days + 1)]
+        cls.env['hr.attendance'].create([{
+            'employee_id': cls.employee.id,
+            'check_in': datetime.combine(day, time(8, 0)),
+            'check_out': datetime.combine(day, time(16, 0)),
+        } for day in days if day.weekday() < 5])
+
+        # One approved expense of 100 per past month, then this month's expenses
+        history = [month for month in months if month < cls.today.replace(day=1)]
+        cls.env['hr.expense'].create([{
+            'name': 'Monthly expense',
+            'employee_id': cls.employee.id,
+            'date': month.replace(day=5),
+            'total_amount_currency': 100.0,
+            'approval_state': 'approved',
+        } for month in history] + [{
+            'name': name,
+            'employee_id': cls.employee.id,
+            'date': expense_date,
+            'total_amount_currency': amount,
+            'approval_state': approval_state,
+        } for name, expense_date, amount, approval_state in [
+            ('Draft expense', date(2025, 6, 3), 10.0, False),
+            ('Submitted expense', date(2025, 6, 10), 20.0, 'submitted'),
+            ('Approved expense', date(2025, 6, 17), 30.0, 'approved'),
+            ('Future expense', date(2025, 6, 25), 1000.0, 'approved'),
+        ]])
+
+        # 100 leads: 40 new, 10 won, 50 in progress; 100 of expected revenue each
+        Stage = cls.env['crm.stage']
+        stages = {'new': Stage.create({'name': 'New'}), 'won': Stage.create({'name': 'Won'}),
+                  'open': Stage.create({'name': 'Proposition'})}
+        cls.env['crm.lead'].create([{
+            'name': 'Lead %s' % index,
+            'type': 'opportunity',
+            'user_id': cls.user.id,
+            'stage_id': stages[key].id,
+            'expected_revenue': 100.0,
+        } for index, key in enumerate(['new'] * 40 + ['won'] * 10 + ['open'] * 50)])
+
+        # Three tickets, one of them done
+        tickets = cls.env['it.ticket'].create([{
+            'employee_id': cls.employee.id,
+            'ticket_type_id': cls.env.ref('ticketing_it.type_software').id,
+            'subject': 'Dashboard ticket %s' % index,
+            'description': '<p>Dashboard ticket</p>',
+        } for index in range(3)])
+        tickets[0].write({'state': 'done'})
+
+    def _count_queries(self, func):
+        self.env.flush_all()
+        self.env.invalidate_all()
+        count = self.cr.sql_log_count
+        func()
+        self.env.flush_all()
+        return self.cr.sql_log_count - count
+
+    def test_dashboard_tiles(self):
+        tiles = self.employee._get_ess_dashboard_aggregates(self.user, self.today)
+
+        self.assertEqual(tiles['payslips_count'], 60)
+        self.assertAlmostEqual(tiles['weekly_hours'], 24.0)
+        self.assertEqual(tiles['attended_days'], 13)
+        self.assertEqual(tiles['crm'], {
+            'total_leads': 100,
+            'new_leads': 40,
+            'won_leads': 10,
+            'total_revenue': 10000.0,
+            'conversion_rate': 10.0,
+        })
+        self.assertEqual(tiles['expenses'], {
+            'total_count': 3,
+            'total_amount': 60.0,
+            'ytd_total': 560.0,
+            'submitted_count': 1,
+            'submitted_amount': 20.0,
+            'approved_count': 1,
+            'approved_amount': 30.0,
+            'draft_count': 1,
+            'draft_amount': 10.0,
+            'pending_count': 1,
+        })
+        self.assertEqual(tiles['it_tickets_count'], 3)
+        self.assertEqual(tiles['it_tickets_pending'], 2)
+
+    def test_dashboard_query_count(self):
+        """Five years of history cost no more queries than none, within a fixed bound."""
+        newcomer_queries = self._count_queries(
+            lambda: self.newcomer._get_ess_dashboard_aggregates(self.newcomer_user, self.today)
+        )
+        self.assertLessEqual(newcomer_queries, DASHBOARD_MAX_QUERIES)
+
+        self.env.invalidate_all()
+        with self.assertQueryCount(newcomer_queries):
+            self.employee._get_ess_dashboard_aggregates(self.user, self.today)
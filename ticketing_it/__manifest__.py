@@ -1,6 +1,6 @@
 {
     'name': 'IT Support Ticketing System',
-    'version': '19.0.1.0.0',
+    'version': '19.0.1.5.0',
     'category': 'Services/Helpdesk',
     'summary': 'IT Support Tickets with Two-Level Approval',
     'author': 'Your Company',
@@ -26,6 +26,8 @@
         'views/reporting_by_category.xml',
         'views/reporting_open_tickets.xml',
         'views/reporting_solved_tickets.xml',
+        'views/reporting_state_log.xml',
+        'views/reporting_perf_sample.xml',
         'views/ticket_workflow_config_view.xml',
         'views/it_dashboard.xml',
         'data/scheduled_actions.xml',
@@ -34,6 +36,7 @@
         'wizards/approve_wizard.xml',
         'wizards/it_reminder_config_wizard.xml',
         'wizards/duration_config_wizard.xml',
+        'wizards/assignment_config_wizard.xml',
     ],
     'installable': True,
     'application': True,
@@ -1,2 +1,3 @@
 # from . import portal
-from . import main
\ No newline at end of file
+from . import main
+from . import api
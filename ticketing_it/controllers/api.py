@@ -0,0 +1,193 @@
+from odoo import http, fields
+from odoo.http import request
+from odoo.exceptions import AccessError, UserError, ValidationError
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Fields an API client may set when creating tickets
+TICKET_API_FIELDS = (
+    'employee_id',
+    'ticket_type_id',
+    'priority',
+    'subject',
+    'description',
+    'required_date',
+)
+MAX_BATCH_SIZE = 10000
+SEARCH_PAGE_SIZE = 80
+MAX_SEARCH_PAGE_SIZE = 500
+
+
+class ITTicketApi(http.Controller):
+
+    def _json_response(self, data, status=200):
+        return request.make_response(
+            json.dumps(data, indent=2),
+            headers=[('Content-Type', 'application/json')],
+            status=status
+        )
+
+    @http.route('/api/it/tickets/batch', type='http', auth='user', methods=['POST'], csrf=False)
+    def create_tickets_batch(self, **kwargs):
+        """
+        Create many tickets in one call.
+
+        Body: {"tickets": [{"employee_id": .., "ticket_type_id": .., ...}, ...]}
+        All tickets go through a single create() so sequence numbers, workflow
+        levels and ticket types are resolved once for the whole batch.
+        """
+        try:
+            payload = json.loads(request.httprequest.data or "{}")
+        except ValueError:
+            return self._json_response({'success': False, 'error': 'Invalid JSON body'}, 400)
+
+        tickets = payload.get('tickets') if isinstance(payload, dict) else None
+        if not isinstance(tickets, list) or not tickets:
+            return self._json_response({'success': False, 'error': 'tickets must be a non-empty list'}, 400)
+        if len(tickets) > MAX_BATCH_SIZE:
+            return self._json_response({
+                'success': False,
+                'error': 'At most %s tickets per request' % MAX_BATCH_SIZE,
+            }, 400)
+        if not all(isinstance(ticket, dict) for ticket in tickets):
+            return self._json_response({'success': False, 'error': 'Each ticket must be an object'}, 400)
+
+        vals_list = [
+            {key: ticket[key] for key in TICKET_API_FIELDS if key in ticket}
+            for ticket in tickets
+        ]
+
+        try:
+            records = request.env['it.ticket'].create(vals_list)
+        except (AccessError, UserError, ValidationError, ValueError) as e:
+            request.env.cr.rollback()
+            _logger.warning("Batch ticket creation rejected: %s", e)
+            return self._json_response({'success': False, 'error': str(e)}, 400)
+
+        _logger.info("Created %s tickets through the batch API", len(records))
+        return self._json_response({
+            'success': True,
+            'count': len(records),
+            'tickets': [{'id': rec.id, 'name': rec.name} for rec in records],
+        })
+
+    @http.route('/api/it/tickets/search', type='http', auth='user', methods=['GET'])
+    def search_tickets(self, q=None, limit=SEARCH_PAGE_SIZE, offset=0, **kwargs):
+        """
+        Ranked full-text search over subject, description, rejection reason
+        and chatter comments, restricted to the tickets the user can read.
+        ``q`` accepts web search syntax: "exact phrase", or, -excluded.
+        """
+        if not q or not q.strip():
+            return self._json_response({'success': False, 'error': 'q is required'}, 400)
+        try:
+            limit = min(max(int(limit), 1), MAX_SEARCH_PAGE_SIZE)
+            offset = max(int(offset), 0)
+        except ValueError:
+            return self._json_response({'success': False, 'error': 'limit and offset must be integers'}, 400)
+
+        tickets = request.env['it.ticket']._search_full_text(q, limit=limit, offset=offset)
+        return self._json_response({
+            'success': True,
+            'count': len(tickets),
+            'tickets': [{
+                'id': ticket.id,
+                'name': ticket.name,
+                'subject': ticket.subject,
+                'state': ticket.state,
+            } for ticket in tickets],
+        })
+
+    def _get_decision_tickets(self):
+        """Parse ``{"ticket_ids": [...], ...}`` from the body; return (payload, tickets) or an error response."""
+        try:
+            payload = json.loads(request.httprequest.data or "{}")
+        except ValueError:
+            return None, self._json_response({'success': False, 'error': 'Invalid JSON body'}, 400)
+
+        ticket_ids = payload.get('ticket_ids') if isinstance(payload, dict) else None
+        if not isinstance(ticket_ids, list) or not ticket_ids \
+                or not all(isinstance(ticket_id, int) for ticket_id in ticket_ids):
+            return None, self._json_response({'success': False, 'error': 'ticket_ids must be a non-empty list of ids'}, 400)
+        if len(ticket_ids) > MAX_BATCH_SIZE:
+            return None, self._json_response({
+                'success': False,
+                'error': 'At most %s tickets per request' % MAX_BATCH_SIZE,
+            }, 400)
+
+        # Approvers may lack read access on the tickets (see the reject
+        # wizard); do_approve/do_reject check the current user explicitly.
+        tickets = request.env['it.ticket'].sudo().browse(ticket_ids).exists()
+        if len(tickets) != len(set(ticket_ids)):
+            return None, self._json_response({'success': False, 'error': 'Unknown ticket ids'}, 404)
+        return payload, tickets
+
+    @http.route('/api/it/tickets/approve', type='http', auth='user', methods=['POST'], csrf=False)
+    def approve_tickets(self, **kwargs):
+        """Body: {"ticket_ids": [..], "comment": ".."}; all tickets are approved or none."""
+        payload, tickets = self._get_decision_tickets()
+        if payload is None:
+            return tickets
+        try:
+            tickets.do_approve(payload.get('comment'))
+        except AccessError as e:
+            request.env.cr.rollback()
+            return self._json_response({'success': False, 'error': str(e)}, 403)
+        except (UserError, ValidationError) as e:
+            # Workflow errors: wrong state, no IT team member to assign
+            request.env.cr.rollback()
+            return self._json_response({'success': False, 'error': str(e)}, 409)
+        return self._json_response({'success': True, 'count': len(tickets)})
+
+    @http.route('/api/it/tickets/reject', type='http', auth='user', methods=['POST'], csrf=False)
+    def reject_tickets(self, **kwargs):
+        """Body: {"ticket_ids": [..], "reason": ".."}; all tickets are rejected or none."""
+        payload, tickets = self._get_decision_tickets()
+        if payload is None:
+            return tickets
+        reason = payload.get('reason')
+        if not isinstance(reason, str) or not reason.strip():
+            return self._json_response({'success': False, 'error': 'reason is required'}, 400)
+        try:
+            tickets.do_reject(reason)
+        except AccessError as e:
+            request.env.cr.rollback()
+            return self._json_response({'success': False, 'error': str(e)}, 403)
+        except (UserError, ValidationError) as e:
+            # Workflow errors: wrong state, no IT team member to assign
+            request.env.cr.rollback()
+            return self._json_response({'success': False, 'error': str(e)}, 409)
+        return self._json_response({'success': True, 'count': len(tickets)})
+
+    @http.route('/api/it/tickets/stats/dwell', type='http', auth='user', methods=['GET'])
+    def dwell_time_stats(self, group_by='ticket_type', date_from=None, date_to=None, **kwargs):
+        """Per-state dwell time percentiles (hours), grouped by ``ticket_type`` or ``assignee``."""
+        try:
+            date_from = fields.Datetime.to_datetime(date_from or None)
+            date_to = fields.Datetime.to_datetime(date_to or None)
+        except ValueError:
+            return self._json_response({'success': False, 'error': 'date_from and date_to must be dates'}, 400)
+        try:
+            stats = request.env['it.ticket.state.log'].get_dwell_time_stats(
+                group_by=group_by, date_from=date_from, date_to=date_to
+            )
+        except AccessError:
+            return self._json_response({'success': False, 'error': 'Access denied'}, 403)
+        except UserError as e:
+            return self._json_response({'success': False, 'error': str(e)}, 400)
+        return self._json_response({'success': True, 'group_by': group_by, 'stats': stats})
+
+    @http.route('/api/it/tickets/stats/perf', type='http', auth='user', methods=['GET'])
+    def perf_stats(self, since=None, **kwargs):
+        """Per-operation duration percentiles (ms), query counts and mail time of the ticketing hot paths."""
+        try:
+            since = fields.Datetime.to_datetime(since or None)
+        except ValueError:
+            return self._json_response({'success': False, 'error': 'since must be a date'}, 400)
+        try:
+            stats = request.env['it.ticket.perf.sample'].get_operation_stats(since=since)
+        except AccessError:
+            return self._json_response({'success': False, 'error': 'Access denied'}, 403)
+        return self._json_response({'success': True, 'stats': stats})
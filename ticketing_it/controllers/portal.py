@@ -12,13 +12,21 @@ _logger = logging.getLogger(__name__)
 
 class PortalITTicket(CustomerPortal):
 
+    def _get_employee(self):
+        """Current user's employee, looked up once per request."""
+        cache = request.env.cr.cache
+        key = ('ticketing_it.portal_employee', request.env.uid)
+        if key not in cache:
+            cache[key] = request.env['hr.employee'].sudo().search([
+                ('user_id', '=', request.env.uid)
+            ], limit=1).id
+        return request.env['hr.employee'].sudo().browse(cache[key] or ())
+
     def _prepare_home_portal_values(self, counters):
         """Add ticket count to portal homepage"""
         values = super()._prepare_home_portal_values(counters)
 
-        employee = request.env['hr.employee'].sudo().search([
-            ('user_id', '=', request.env.user.id)
-        ], limit=1)
+        employee = self._get_employee()
 
         if employee:
             ticket_count = request.env['it.ticket'].search_count([
@@ -33,9 +41,7 @@ class PortalITTicket(CustomerPortal):
     @http.route(['/my/tickets', '/my/tickets/page/<int:page>'], type='http', auth="user", website=True)
     def portal_my_tickets(self, page=1, sortby=None, **kw):
         """List all tickets for current portal user"""
-        employee = request.env['hr.employee'].sudo().search([
-            ('user_id', '=', request.env.user.id)
-        ], limit=1)
+        employee = self._get_employee()
 
         if not employee:
             return request.render("ticketing_it.portal_no_employee")
@@ -72,9 +78,7 @@ class PortalITTicket(CustomerPortal):
         try:
             ticket = request.env['it.ticket'].browse(ticket_id)
 
-            employee = request.env['hr.employee'].sudo().search([
-                ('user_id', '=', request.env.user.id)
-            ], limit=1)
+            employee = self._get_employee()
 
             if not employee or ticket.employee_id != employee:
                 return request.render("website.403")
@@ -91,9 +95,7 @@ class PortalITTicket(CustomerPortal):
     @http.route(['/my/tickets/new'], type='http', auth="user", website=True)
     def portal_create_ticket(self, **kw):
         """Show create ticket form"""
-        employee = request.env['hr.employee'].sudo().search([
-            ('user_id', '=', request.env.user.id)
-        ], limit=1)
+        employee = self._get_employee()
 
         if not employee:
             return request.render("ticketing_it.portal_no_employee")
@@ -117,9 +119,7 @@ class PortalITTicket(CustomerPortal):
     @http.route(['/my/tickets/submit'], type='http', auth="user", website=True, methods=['POST'], csrf=True)
     def portal_submit_ticket(self, **post):
         """Submit new ticket"""
-        employee = request.env['hr.employee'].sudo().search([
-            ('user_id', '=', request.env.user.id)
-        ], limit=1)
+        employee = self._get_employee()
 
         if not employee:
             return request.redirect('/my')
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """
+    The social media expiry cron now drains every unprocessed ticket whose
+    access_finish_date is in the past instead of looking at a one-minute
+    window. Expiries that the previous cron already handled must not be
+    notified again, so flag them as processed.
+    """
+    if not version:
+        return
+
+    cr.execute("""
+        UPDATE it_ticket
+           SET access_expiry_processed = TRUE
+         WHERE access_finish_date <= (now() AT TIME ZONE 'UTC')
+           AND access_expiry_processed IS NOT TRUE
+    """)
+    _logger.info("Marked %s past social media expiries as processed", cr.rowcount)
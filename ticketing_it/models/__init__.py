@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 
+from . import it_group_resolver
+from . import it_ticket_assignment
+from . import it_ticket_employee_count
 from . import it_ticket
+from . import it_ticket_sla
+from . import it_ticket_search
+from . import it_ticket_duplicate
+from . import it_ticket_state_log
+from . import it_ticket_perf_sample
 from . import hr_employee
 from . import it_ticket_reports
+from . import res_partner
 from . import res_users
+from . import mail_mail
 from . import bypass_error
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from odoo import models, api
+from odoo.tools import frozendict, ormcache
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Changes on these res.users fields can alter who counts as IT staff
+USER_GROUP_FIELDS = {'group_ids', 'active', 'share'}
+# Groups whose members are cached by it.group.resolver
+IT_GROUP_XMLIDS = ('ticketing_it.group_it_manager', 'ticketing_it.group_it_team')
+
+
+class ITGroupResolver(models.AbstractModel):
+    _name = 'it.group.resolver'
+    _description = 'IT Group Membership Resolver'
+
+    # =========================================================
+    # CACHED GROUP MEMBERSHIP
+    # =========================================================
+
+    @api.model
+    @ormcache()
+    def _get_group_user_ids(self):
+        """
+        Return ``{'it_manager': (ids...), 'it_team': (ids...)}``.
+        Cached per registry; see ``_invalidate_group_cache`` for the hooks
+        that clear it when group membership may have changed.
+        """
+        result = {'it_manager': (), 'it_team': ()}
+
+        it_manager_group = self.env.ref('ticketing_it.group_it_manager', raise_if_not_found=False)
+        if it_manager_group:
+            self.env['res.users'].flush_model(['active', 'share', 'group_ids'])
+            # Direct SQL — bypasses the broken domain search entirely
+            self.env.cr.execute("""
+                SELECT ru.id
+                FROM res_users ru
+                JOIN res_groups_users_rel rel ON rel.uid = ru.id
+                WHERE rel.gid = %s
+                  AND ru.active = true
+                  AND ru.share = false
+                ORDER BY ru.id
+            """, (it_manager_group.id,))
+            result['it_manager'] = tuple(row[0] for row in self.env.cr.fetchall())
+        else:
+            _logger.error(
+                "IT Manager group 'ticketing_it.group_it_manager' not found. "
+                "Check security/security.xml in your module."
+            )
+
+        it_team_group = self.env.ref('ticketing_it.group_it_team', raise_if_not_found=False)
+        if it_team_group:
+            result['it_team'] = tuple(it_team_group.sudo().user_ids.ids)
+
+        _logger.info(
+            "IT group membership loaded: %s manager(s), %s team member(s)",
+            len(result['it_manager']), len(result['it_team'])
+        )
+        return frozendict(result)
+
+    @api.model
+    def _invalidate_group_cache(self):
+        """Drop the cached membership; call after any group change, ORM or SQL."""
+        self.env.registry.clear_cache()
+
+    @api.model
+    def _get_it_groups(self):
+        """The IT Manager and IT Team groups, when they exist."""
+        groups = self.env['res.groups']
+        for xmlid in IT_GROUP_XMLIDS:
+            group = self.env.ref(xmlid, raise_if_not_found=False)
+            if group:
+                groups |= group
+        return groups
+
+    @api.model
+    def _get_cached_user_ids(self):
+        """Ids of every user held in the membership cache."""
+        group_user_ids = self._get_group_user_ids()
+        return set(group_user_ids['it_manager']) | set(group_user_ids['it_team'])
+
+    # =========================================================
+    # PUBLIC HELPERS
+    # =========================================================
+
+    @api.model
+    def _get_it_manager(self):
+        """First active internal IT Manager (lowest id), or an empty recordset."""
+        manager_ids = self._get_group_user_ids()['it_manager']
+        return self.env['res.users'].sudo().browse(manager_ids[:1])
+
+    @api.model
+    def _get_it_manager_users(self):
+        """All active internal IT Managers."""
+        return self.env['res.users'].sudo().browse(self._get_group_user_ids()['it_manager'])
+
+    @api.model
+    def _get_it_team_users(self):
+        """All IT team members, in the group's default user order."""
+        return self.env['res.users'].sudo().browse(self._get_group_user_ids()['it_team'])
@@ -2,12 +2,51 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError, AccessError
+from odoo.tools import frozendict, html_escape, ormcache, str2bool
 from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
+import threading
+
+from .it_ticket_assignment import OPEN_STATES
+from .it_ticket_metrics import measure_mail, track_perf
 
 _logger = logging.getLogger(__name__)
 
+# Workflow applied to ticket types without a workflow configuration
+# (Line Manager → IT Manager → IT Support).
+DEFAULT_WORKFLOW_LEVEL = '2'
+# Number of approvers handled per committed reminder checkpoint.
+REMINDER_BATCH_SIZE = 100
+# Number of expired social media tickets drained per committed batch.
+EXPIRY_BATCH_SIZE = 200
+# Number of ticket ids covered by one duration recompute UPDATE.
+RECOMPUTE_CHUNK_SIZE = 50000
+
+# Tickets per page of the portal ticket listing.
+PORTAL_PAGE_SIZE = 20
+# Portal sort keys → (column, direction); ``id`` in the same direction is
+# appended as tie-breaker so every sort supports keyset pagination.
+PORTAL_SORT_COLUMNS = {
+    'date': ('create_date', 'desc'),
+    'name': ('name', 'asc'),
+    'state': ('state', 'asc'),
+}
+
+# Stored fields that are pure functions of the ticket dates; recomputed in
+# SQL by _recompute_processing_durations_sql().
+PROCESSING_DURATION_FIELDS = [
+    'manager_processing_time',
+    'it_processing_time',
+    'it_team_processing_time',
+    'total_resolution_time',
+    'resolution_time',
+    'manager_processing_days',
+    'it_processing_days',
+    'it_team_processing_days',
+    'month_solved',
+]
+
 
 class ITTicketType(models.Model):
     _name = 'it.ticket.type'
@@ -88,7 +127,7 @@ class ITTicket(models.Model):
         ('3', 'Urgent'),
     ], default='1', required=True, tracking=True, string='Priority')
 
-    subject = fields.Char(required=True, tracking=True, string='Subject')
+    subject = fields.Char(required=True, tracking=True, string='Subject', index='trigram')
     description = fields.Html(required=True, string='Description')
     required_date = fields.Date(string='Required By Date')
     user_id = fields.Many2one('res.users', string="Assigned To")
@@ -144,7 +183,7 @@ class ITTicket(models.Model):
     it_approval_date = fields.Datetime(readonly=True, string='IT Approval Date')
     done_date = fields.Datetime(readonly=True, string='Completion Date')
     month_solved = fields.Char(string="Month", compute='_compute_month_solved', store=True)
-    resolution_time = fields.Float(string="Resolution Time (hours)", compute='_compute_resolution_time', store=True)
+    resolution_time = fields.Float(string="Resolution Time (hours)", compute='_compute_processing_durations', store=True)
     last_reminder_sent = fields.Datetime(
         readonly=True,
         string='Last Reminder Sent'
@@ -158,6 +197,12 @@ class ITTicket(models.Model):
     access_start_date = fields.Date()
     access_end_date = fields.Date()
     access_finish_date = fields.Datetime()
+    access_expiry_processed = fields.Boolean(
+        string='Access Expiry Processed',
+        default=False,
+        copy=False,
+        readonly=True
+    )
     # ======================
     # REJECTION
     # ======================
@@ -174,12 +219,12 @@ class ITTicket(models.Model):
     )
     show_it_manager = fields.Boolean(
         string="Visible to IT Manager",
-        compute="_compute_show_to_it_manager",
+        compute="_compute_state_categories",
         store=True,  # <-- important!
     )
     show_it_teams = fields.Boolean(
         string="Visible to IT team",
-        compute="_compute_show_to_it_team",
+        compute="_compute_state_categories",
         store=True,  # <-- important!
     )
     is_line_manager = fields.Boolean(compute="_compute_user_roles")
@@ -194,22 +239,22 @@ class ITTicket(models.Model):
     # ======================
     manager_processing_time = fields.Float(
         string="Manager Processing Time (hours)",
-        compute='_compute_manager_processing_time',
+        compute='_compute_processing_durations',
         store=True
     )
     it_processing_time = fields.Float(
         string="IT Manager Processing Time (hours)",
-        compute='_compute_it_processing_time',
+        compute='_compute_processing_durations',
         store=True
     )
     it_team_processing_time = fields.Float(
         string="IT Team Processing Time (hours)",
-        compute='_compute_it_team_processing_time',
+        compute='_compute_processing_durations',
         store=True
     )
     total_resolution_time = fields.Float(
         string="Total Resolution Time (hours)",
-        compute='_compute_total_resolution_time',
+        compute='_compute_processing_durations',
         store=True
     )
     # ======================
@@ -218,34 +263,51 @@ class ITTicket(models.Model):
 
     manager_processing_days = fields.Float(
         string="Manager Processing (Days)",
-        compute="_compute_processing_days",
+        compute="_compute_processing_durations",
         store=True,
         aggregator="avg"
     )
 
     it_processing_days = fields.Float(
         string="IT Manager Processing (Days)",
-        compute="_compute_processing_days",
+        compute="_compute_processing_durations",
         store=True,
         aggregator="avg"
     )
 
     it_team_processing_days = fields.Float(
         string="IT Team Processing (Days)",
-        compute="_compute_processing_days",
+        compute="_compute_processing_durations",
         store=True,
         aggregator="avg"
     )
     status_category = fields.Selection(
         [('open', 'Open'), ('closed', 'Closed')],
         string='Status Category',
-        compute='_compute_status_category',
+        compute='_compute_state_categories',
         store=True
     )
-    open_count = fields.Integer(string="Open Count", compute="_compute_counts", store=True)
-    closed_count = fields.Integer(string="Closed Count", compute="_compute_counts", store=True)
+    open_count = fields.Integer(string="Open Count", compute="_compute_state_categories", store=True)
+    closed_count = fields.Integer(string="Closed Count", compute="_compute_state_categories", store=True)
     is_social_media = fields.Boolean(compute="_compute_is_social_media")
 
+    def init(self):
+        super().init()
+        # Keyset pagination of the portal listing (employee, create_date, id)
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS it_ticket_employee_create_date_idx
+                ON it_ticket (employee_id, create_date DESC, id DESC)
+        """)
+        # Partial index backing the social media expiry queue: only tickets
+        # whose access has not been processed yet are indexed, so the cron
+        # lookup stays constant regardless of how many tickets exist.
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS it_ticket_access_expiry_pending_idx
+                ON it_ticket (access_finish_date)
+             WHERE access_finish_date IS NOT NULL
+               AND access_expiry_processed IS NOT TRUE
+        """)
+
     # @api.depends('ticket_type_id')
     def _compute_is_social_media(self):
         social_media = self.env.ref('ticketing_it.type_social', raise_if_not_found=False)
@@ -255,206 +317,167 @@ class ITTicket(models.Model):
     @api.depends()
     def _compute_suggested_assignee(self):
 
-        it_team = self.env.ref('ticketing_it.group_it_team', raise_if_not_found=False)
-
-        first_user = False
-        if it_team and it_team.user_ids:
-            first_user = it_team.user_ids[0]
+        first_user = self.env['it.group.resolver']._get_it_team_users()[:1]
 
         for rec in self:
             if not rec.assigned_to_id and first_user:
                 rec.assigned_to_id = first_user
 
-    @api.depends('state')
-    def _compute_counts(self):
-        for rec in self:
-            rec.open_count = 1 if rec.status_category == 'open' else 0
-            rec.closed_count = 1 if rec.status_category == 'closed' else 0
+    def _is_debug_compute(self):
+        """
+        Per-record compute logging is only emitted when the
+        ``ticketing_it.debug_compute`` system parameter is enabled, so bulk
+        recomputes (module upgrades, imports) stay quiet and fast.
+        """
+        return str2bool(
+            self.env['ir.config_parameter'].sudo().get_param('ticketing_it.debug_compute', 'False'),
+            default=False
+        )
 
     @api.depends('state')
-    def _compute_status_category(self):
+    def _compute_state_categories(self):
+        """Compute every state-derived flag in a single pass over the recordset."""
+        debug = self._is_debug_compute()
         open_count = defaultdict(int)
         closed_count = defaultdict(int)
 
         for rec in self:
-            # Compute status
-            if rec.state in ['done', 'rejected']:
-                rec.status_category = 'closed'
-                closed_count[rec.ticket_type_id.code] += 1
-                _logger.info("rec.ticket_type_id.code: %s | closed_count[rec.ticket_type_id]: %s",
-                             rec.ticket_type_id.code, closed_count[rec.ticket_type_id.code])
-            else:
-                rec.status_category = 'open'
-                open_count[rec.ticket_type_id.code] += 1
-                _logger.info("rec.ticket_type_id.code: %s | open_count[rec.ticket_type_id]: %s",
-                             rec.ticket_type_id.code,
-                             open_count[rec.ticket_type_id.code])
-
-        # Log counts
-        _logger.info("===== Ticket Counts by Type =====")
-        _logger.info("Open Tickets:")
-        for ttype, count in open_count.items():
-            _logger.info("Type: %s | Count: %s", ttype, count)
-
-        _logger.info("Closed Tickets:")
-        for ttype, count in closed_count.items():
-            _logger.info("Type: %s | Count: %s", ttype, count)
+            is_closed = rec.state in ['done', 'rejected']
+            rec.status_category = 'closed' if is_closed else 'open'
+            rec.open_count = 0 if is_closed else 1
+            rec.closed_count = 1 if is_closed else 0
+            rec.show_it_manager = rec.state not in ['draft', 'manager_approval']
+            rec.show_it_teams = rec.state in ['assigned', 'done']
+
+            if debug:
+                counter = closed_count if is_closed else open_count
+                counter[rec.ticket_type_id.code] += 1
+                _logger.info(
+                    "Ticket ID: %s | State: %s | Category: %s | Visible to IT Manager: %s | Visible to IT team: %s",
+                    rec.id, rec.state, rec.status_category, rec.show_it_manager, rec.show_it_teams
+                )
 
+        if debug:
+            _logger.info("===== Ticket Counts by Type =====")
+            _logger.info("Open Tickets: %s", dict(open_count))
+            _logger.info("Closed Tickets: %s", dict(closed_count))
+
+    # ======================
+    # COMPUTE METHODS
+    # ======================
     @api.depends(
+        'create_date',
         'submitted_date',
         'manager_approval_date',
         'it_approval_date',
         'done_date'
     )
-    def _compute_processing_days(self):
-        for rec in self:
-
-            # Line Manager Days
-            if rec.submitted_date and rec.manager_approval_date:
-                delta = rec.manager_approval_date - rec.submitted_date
-                rec.manager_processing_days = delta.total_seconds() / 86400
-            else:
-                rec.manager_processing_days = 0
-
-            # IT Manager Days
-            if rec.manager_approval_date and rec.it_approval_date:
-                delta = rec.it_approval_date - rec.manager_approval_date
-                rec.it_processing_days = delta.total_seconds() / 86400
-            else:
-                rec.it_processing_days = 0
+    def _compute_processing_durations(self):
+        """
+        Compute every duration field (hours and days) in one pass.
+        All of them derive from the same date columns, which the ORM
+        prefetches once for the whole recordset.
+        """
+        debug = self._is_debug_compute()
 
-            # IT Team Days
-            if rec.it_approval_date and rec.done_date:
-                delta = rec.done_date - rec.it_approval_date
-                rec.it_team_processing_days = delta.total_seconds() / 86400
-            else:
-                rec.it_team_processing_days = 0
+        def seconds_between(start, end):
+            return (end - start).total_seconds() if start and end else 0
 
-    # ======================
-    # COMPUTE METHODS
-    # ======================
-    @api.depends('submitted_date', 'manager_approval_date')
-    def _compute_manager_processing_time(self):
         for rec in self:
-            if rec.submitted_date and rec.manager_approval_date:
-                delta = rec.manager_approval_date - rec.submitted_date
-                rec.manager_processing_time = delta.total_seconds() / 3600  # in hours
+            manager_seconds = seconds_between(rec.submitted_date, rec.manager_approval_date)
+            it_seconds = seconds_between(rec.manager_approval_date, rec.it_approval_date)
+            it_team_seconds = seconds_between(rec.it_approval_date, rec.done_date)
+
+            # Hours
+            rec.manager_processing_time = manager_seconds / 3600
+            rec.it_processing_time = it_seconds / 3600
+            rec.it_team_processing_time = it_team_seconds / 3600
+            rec.total_resolution_time = seconds_between(rec.submitted_date, rec.done_date) / 3600
+            rec.resolution_time = seconds_between(rec.create_date, rec.done_date) / 60
+
+            # Days (reporting)
+            rec.manager_processing_days = manager_seconds / 86400
+            rec.it_processing_days = it_seconds / 86400
+            rec.it_team_processing_days = it_team_seconds / 86400
+
+            if debug:
                 _logger.info(
-                    "manager_processing_time: %s", rec.manager_processing_time
+                    "Ticket ID: %s | manager_processing_time: %s | it_processing_time: %s | "
+                    "it_team_processing_time: %s | total_resolution_time: %s",
+                    rec.id, rec.manager_processing_time, rec.it_processing_time,
+                    rec.it_team_processing_time, rec.total_resolution_time
                 )
 
-            else:
-                rec.manager_processing_time = 0
+    @api.depends('employee_id')
+    def _compute_show_line_manager(self):
+        manager_emails = {
+            ticket.id: ticket.employee_id.parent_id.work_email
+            for ticket in self
+        }
+        users_by_email = self._get_users_by_email(manager_emails.values())
+        debug = self._is_debug_compute()
 
-    @api.depends('manager_approval_date', 'it_approval_date')
-    def _compute_it_processing_time(self):
-        for rec in self:
-            if rec.manager_approval_date and rec.it_approval_date:
-                delta = rec.it_approval_date - rec.manager_approval_date
-                rec.it_processing_time = delta.total_seconds() / 3600  # in hours
-                _logger.info(
-                    "it_manager_processing_time: %s", rec.it_processing_time
-                )
-            else:
-                rec.it_processing_time = 0
+        for ticket in self:
+            manager_email = manager_emails[ticket.id]
+            user_id = users_by_email.get(manager_email.lower()) if manager_email else False
 
-    @api.depends('it_approval_date', 'done_date', 'state')
-    def _compute_it_team_processing_time(self):
-        for rec in self:
-            # Only calculate if assigned/in_progress/done
-            if rec.it_approval_date and rec.done_date:
-                delta = rec.done_date - rec.it_approval_date
-                rec.it_team_processing_time = delta.total_seconds() / 3600
-                _logger.info(
-                    "it_team_processing_time: %s", rec.it_team_processing_time
-                )
-            else:
-                rec.it_team_processing_time = 0
+            # Only write when the resolution changed, so rendering a list
+            # does not issue one UPDATE per ticket.
+            if ticket.line_manager_user_id.id != (user_id or False):
+                ticket.line_manager_user_id = user_id
+            ticket.show_to_line_manager = bool(user_id) and user_id == self.env.uid
 
-    @api.depends('submitted_date', 'done_date')
-    def _compute_total_resolution_time(self):
-        for rec in self:
-            if rec.submitted_date and rec.done_date:
-                delta = rec.done_date - rec.submitted_date
-                rec.total_resolution_time = delta.total_seconds() / 3600
+            if debug:
                 _logger.info(
-                    "total_resolution_time: %s", rec.total_resolution_time
+                    "Ticket: %s | Line Manager Email: %s | User ID: %s",
+                    ticket.id, manager_email, user_id
                 )
-            else:
-                rec.total_resolution_time = 0
 
-    @api.depends('employee_id')
-    def _compute_show_line_manager(self):
-        for ticket in self:
-            _logger.info("Ticket: %s | Employee: %s", ticket.id,
-                         ticket.employee_id.name if ticket.employee_id else None)
-            if ticket.employee_id and ticket.employee_id.parent_id:
-                manager_email = ticket.employee_id.parent_id.work_email
-                _logger.info("Line Manager Email: %s", manager_email)
-                if manager_email:
-                    user = self.env['res.users'].search([('email', '=', manager_email)], limit=1)
-                    if user:
-                        _logger.info("Found user: %s | ID: %s", user.name, user.id)
-                        ticket.line_manager_user_id = user.id
-                    else:
-                        _logger.warning("No user found with email: %s", manager_email)
-                        ticket.line_manager_user_id = False
-                else:
-                    _logger.warning("Line manager has no email")
-                    ticket.line_manager_user_id = False
-            else:
-                _logger.info("No employee or parent (line manager) for ticket")
-                ticket.line_manager_user_id = False
+    @api.model
+    def _get_users_by_email(self, emails):
+        """
+        Return ``{lower(email): user_id}`` for the active users owning
+        ``emails``, resolved with one query on the lower(email) index of
+        res_partner (see res.partner init) and memoized on the cursor for the rest of the request.
+        """
+        memo = self.env.cr.cache.setdefault('ticketing_it.users_by_email', {})
+        missing = {email.lower() for email in emails if email} - memo.keys()
+        if missing:
+            self.env['res.partner'].flush_model(['email'])
+            self.env['res.users'].flush_model(['partner_id', 'active'])
+            self.env.cr.execute("""
+                SELECT lower(p.email), min(u.id)
+                  FROM res_users u
+                  JOIN res_partner p ON p.id = u.partner_id
+                 WHERE lower(p.email) IN %s
+                   AND u.active
+                 GROUP BY lower(p.email)
+            """, (tuple(missing),))
+            found = dict(self.env.cr.fetchall())
+            memo.update({email: found.get(email, False) for email in missing})
+        return memo
 
     @api.depends('line_manager_id')
     def _compute_user_roles(self):
-        for rec in self:
-            # 🔍 DEBUG LOG
-            _logger.info(
-                "line_manager_id.user_id: %s | self.env.user: %s | rec.line_manager_id: %s",
-                rec.line_manager_id.user_id,
-                self.env.user,
-                rec.line_manager_id,
-            )
-            rec.is_line_manager = (
-                rec.line_manager_id == self.env.user
-                if rec.line_manager_id
-                else False
-            )
-
-            rec.is_it_manager = self.env.user.has_group(
-                'ticketing_it.group_it_manager'
-            )
-
-            # 🔍 DEBUG LOG
-            _logger.info(
-                "Ticket: %s | User: %s | is_line_manager: %s | is_it_manager: %s",
-                rec.name,
-                self.env.user.name,
-                rec.is_line_manager,
-                rec.is_it_manager
-            )
+        user = self.env.user
+        is_it_manager = user.has_group('ticketing_it.group_it_manager')
+        debug = self._is_debug_compute()
 
-    @api.depends('state')
-    def _compute_show_to_it_manager(self):
-        for ticket in self:
-            ticket.show_it_manager = ticket.state not in ['draft', 'manager_approval']
-            # DEBUG LOGGING
-            _logger.info("Ticket ID: %s | State: %s | Visible to IT Manager: %s",
-                         ticket.id, ticket.state, ticket.show_it_manager)
+        for rec in self:
+            rec.is_line_manager = bool(rec.line_manager_id) and rec.line_manager_id == user
+            rec.is_it_manager = is_it_manager
 
-    @api.depends('state')
-    def _compute_show_to_it_team(self):
-        for ticket in self:
-            ticket.show_it_teams = ticket.state in ['assigned', 'done']
-            _logger.info("Ticket ID: %s | State: %s | Visible to IT team: %s",
-                         ticket.id, ticket.state, ticket.show_it_teams)
+            if debug:
+                _logger.info(
+                    "Ticket: %s | User: %s | is_line_manager: %s | is_it_manager: %s",
+                    rec.name, user.name, rec.is_line_manager, rec.is_it_manager
+                )
 
     @api.depends()
     def _compute_allowed_it_users(self):
-        it_team_group = self.env.ref("ticketing_it.group_it_team")
+        it_team_users = self.env['it.group.resolver']._get_it_team_users()
         for ticket in self:
-            ticket.allowed_it_users = it_team_group.user_ids
+            ticket.allowed_it_users = it_team_users
 
     def _get_from_email(self):
         """
@@ -477,9 +500,29 @@ class ITTicket(models.Model):
 
         return False
 
+    def _queue_ticket_mail(self, template):
+        """
+        Render ``template`` for all tickets in one batch into queued
+        mail.mail records instead of sending them inline; delivery happens
+        after commit in mail.mail._process_ticket_mail_queue.
+        """
+        if not self:
+            return []
+        with measure_mail():
+            mails = template.send_mail_batch(self.ids)
+        self._trigger_ticket_mail_queue()
+        return mails.ids
+
+    @api.model
+    def _trigger_ticket_mail_queue(self):
+        cron = self.env.ref('ticketing_it.ir_cron_ticket_mail_queue', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
     # =========================================================
     # HELPER: FIND IT MANAGER VIA SQL
-    # Uses raw SQL on res_groups_users_rel table.
+    # Uses raw SQL on res_groups_users_rel table, cached per registry
+    # by it.group.resolver.
     # This is the ONLY reliable method in all Odoo 17 versions.
     # groups_id domain search is broken in this Odoo build.
     # Admin assigns IT Manager in Settings → Users → Groups button.
@@ -488,47 +531,18 @@ class ITTicket(models.Model):
 
     def _find_it_manager(self):
         """
-        Find IT Manager user via direct SQL on the groups-users relation table.
-        Works in all Odoo 17 versions — avoids the broken groups_id domain search.
+        Find IT Manager user via the cached group resolver
+        (``it.group.resolver``), which reads res_groups_users_rel directly.
         """
-        it_manager_group = self.env.ref(
-            'ticketing_it.group_it_manager',
-            raise_if_not_found=False
-        )
-        if not it_manager_group:
-            _logger.error(
-                "IT Manager group 'ticketing_it.group_it_manager' not found. "
-                "Check security/security.xml in your module."
+        it_manager = self.env['it.group.resolver']._get_it_manager()
+        if not it_manager:
+            _logger.warning(
+                "No IT Manager found in group. "
+                "Go to Settings → Users → [your IT manager user] → "
+                "Groups button → Add 'IT Manager' group."
             )
             return False
-
-        # Direct SQL — bypasses the broken domain search entirely
-        self.env.cr.execute("""
-            SELECT ru.id
-            FROM res_users ru
-            JOIN res_groups_users_rel rel ON rel.uid = ru.id
-            WHERE rel.gid = %s
-              AND ru.active = true
-              AND ru.share = false
-            ORDER BY ru.id
-            LIMIT 1
-        """, (it_manager_group.id,))
-
-        row = self.env.cr.fetchone()
-        if row:
-            user = self.env['res.users'].sudo().browse(row[0])
-            _logger.info(
-                "IT Manager found via SQL: %s | Email: %s",
-                user.name, user.email
-            )
-            return user
-
-        _logger.warning(
-            "No IT Manager found in group. "
-            "Go to Settings → Users → [your IT manager user] → "
-            "Groups button → Add 'IT Manager' group."
-        )
-        return False
+        return it_manager
 
     # =========================================================
     # DISPLAY NAME
@@ -543,6 +557,59 @@ class ITTicket(models.Model):
             else:
                 record.display_name = name
 
+    # =========================================================
+    # PORTAL LISTING
+    # =========================================================
+
+    @api.model
+    def _portal_ticket_page(self, domain, sortby='date', after=None, limit=PORTAL_PAGE_SIZE):
+        """
+        Return ``(tickets, next_cursor)`` for one page of the portal listing.
+
+        Pages are keyset-paginated on ``(sort column, id)``: ``after`` is the
+        cursor of the last ticket of the previous page, so every page costs
+        one index range scan whatever its depth. ``next_cursor`` is None on
+        the last page.
+        """
+        column, direction = PORTAL_SORT_COLUMNS.get(sortby, PORTAL_SORT_COLUMNS['date'])
+        operator = '<' if direction == 'desc' else '>'
+
+        cursor = self._decode_portal_cursor(after, column)
+        if cursor:
+            value, last_id = cursor
+            domain = list(domain) + [
+                '|', (column, operator, value),
+                '&', (column, '=', value), ('id', operator, last_id),
+            ]
+
+        tickets = self.search(domain, order='%s %s, id %s' % (column, direction, direction), limit=limit + 1)
+        if len(tickets) <= limit:
+            return tickets, None
+
+        tickets = tickets[:limit]
+        last = tickets[-1]
+        value = last[column]
+        if column == 'create_date':
+            # Keep the microseconds: tickets created in one transaction share
+            # their create_date down to the second, and must not be skipped.
+            value = value.isoformat(sep=' ')
+        return tickets, '%s,%s' % (value, last.id)
+
+    @api.model
+    def _decode_portal_cursor(self, after, column='create_date'):
+        """Parse a ``value,id`` cursor; malformed cursors restart from the first page."""
+        if not after:
+            return None
+        value, _sep, last_id = after.rpartition(',')
+        if not value or not last_id.isdigit():
+            return None
+        if column == 'create_date':
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        return value, int(last_id)
+
     # =========================================================
     # DEFAULT EMPLOYEE
     # =========================================================
@@ -584,27 +651,42 @@ class ITTicket(models.Model):
     @api.model_create_multi
     def create(self, vals_list):
 
-        for vals in vals_list:
+        workflow_levels = self._get_workflow_levels(vals_list)
 
-            if vals.get('name', 'New') == 'New':
-                vals['name'] = self.env['ir.sequence'].next_by_code('it.ticket') or 'New'
+        # Lookups shared by the whole batch are resolved once per call
+        now = fields.Datetime.now()
+        names = iter(self._reserve_ticket_names(
+            sum(1 for vals in vals_list if vals.get('name', 'New') == 'New')
+        ))
+
+        assignees = iter(self.env['it.ticket.assignment']._pick_assignees([
+            vals.get('ticket_type_id')
+            for vals, workflow_level in zip(vals_list, workflow_levels)
+            if workflow_level == '0'
+        ]))
+
+        type_ids = {vals.get('ticket_type_id') for vals in vals_list} - {None, False}
+        type_codes = {
+            ticket_type.id: ticket_type.code
+            for ticket_type in self.env['it.ticket.type'].browse(type_ids)
+        }
+        social_media_duration = None
+        if 'social_media' in type_codes.values():
+            social_media_duration = self.env['ir.config_parameter'].sudo().get_param(
+                'it_ticket.social_media_duration', '3m'
+            )
 
-            ticket_type_id = vals.get('ticket_type_id')
-            workflow_level = self._get_workflow_level(ticket_type_id)
+        for vals, workflow_level in zip(vals_list, workflow_levels):
+
+            if vals.get('name', 'New') == 'New':
+                vals['name'] = next(names)
 
             # ✅ Workflow 0 → Direct assign
             if workflow_level == '0':
-
-                it_team = self.env.ref('ticketing_it.group_it_team')
-
-                first_user = False
-                if it_team and it_team.user_ids:
-                    first_user = it_team.user_ids[0]
-
                 vals.update({
                     'state': 'assigned',
-                    'assigned_to_id': first_user.id if first_user else False,
-                    'submitted_date': fields.Datetime.now(),
+                    'assigned_to_id': next(assignees).id,
+                    'submitted_date': now,
                 })
 
             # ✅ Workflow 1 → IT Manager
@@ -616,15 +698,12 @@ class ITTicket(models.Model):
                 vals['state'] = 'manager_approval'
 
             # Social media duration
-            ticket_type_record = self.env['it.ticket.type'].browse(vals.get('ticket_type_id'))
-
-            if ticket_type_record.code == 'social_media':
-                duration = self.env['ir.config_parameter'].sudo().get_param(
-                    'it_ticket.social_media_duration', '3m'
-                )
-                vals['duration'] = duration
+            if type_codes.get(vals.get('ticket_type_id')) == 'social_media':
+                vals['duration'] = social_media_duration
 
         records = super().create(vals_list)
+        self.env['it.ticket.assignee.load']._apply_load_deltas(records._get_open_load())
+        self.env['it.ticket.employee.count']._apply_count_deltas(records._get_employee_state_counts())
 
         # ❌ REMOVE THIS BLOCK (IMPORTANT)
         # It is breaking your workflow
@@ -639,17 +718,46 @@ class ITTicket(models.Model):
 
         return records
 
-    def _get_workflow_level(self, ticket_type_id):
+    @api.model
+    def _reserve_ticket_names(self, count):
+        """
+        Reserve ``count`` ticket numbers from the it.ticket sequence at once.
 
-        config = self.env['it.ticket.workflow.config'].search(
-            [('ticket_type_id', '=', ticket_type_id)],
-            limit=1
-        )
+        Standard sequences are backed by a PostgreSQL sequence, which is
+        advanced for the whole block with a single nextval() query; no-gap
+        or date-range sequences fall back to one next_by_id() per number.
+        """
+        if not count:
+            return []
+
+        sequence = self.env['ir.sequence'].sudo().search([
+            ('code', '=', 'it.ticket'),
+            ('company_id', 'in', [self.env.company.id, False]),
+        ], order='company_id', limit=1)
+        if not sequence:
+            return ['New'] * count
+
+        if sequence.implementation == 'standard' and not sequence.use_date_range:
+            self.env.cr.execute(
+                "SELECT nextval(%s) FROM generate_series(1, %s)",
+                ('ir_sequence_%03d' % sequence.id, count)
+            )
+            numbers = sorted(row[0] for row in self.env.cr.fetchall())
+            return [sequence.get_next_char(number) for number in numbers]
+
+        return [sequence.next_by_id() or 'New' for _i in range(count)]
 
-        if config:
-            return config.workflow_level
+    def _get_workflow_level(self, ticket_type_id):
+        return self.env['it.ticket.workflow.config']._get_workflow_level(ticket_type_id)
 
-        return '2'
+    @api.model
+    def _get_workflow_levels(self, vals_list):
+        """Resolve the workflow level of every vals dict from the cached config."""
+        levels = self.env['it.ticket.workflow.config']._get_workflow_level_map()
+        return [
+            levels.get(vals.get('ticket_type_id'), DEFAULT_WORKFLOW_LEVEL)
+            for vals in vals_list
+        ]
 
     # ===== NEW METHOD =====
     def action_submit_to_it_manager(self):
@@ -677,6 +785,7 @@ class ITTicket(models.Model):
                      % rec.it_manager_id.name
             )
 
+    @track_perf('assign_to_it_team')
     def action_assign_to_it_team(self):
         """Assign Hardware tickets directly to IT Team (skip approvals)"""
         for rec in self:
@@ -690,7 +799,7 @@ class ITTicket(models.Model):
                 raise_if_not_found=False
             )
             if template:
-                template.send_mail(rec.id, force_send=True)
+                rec._queue_ticket_mail(template)
 
             if rec.it_manager_id:
                 rec.activity_schedule(
@@ -707,29 +816,21 @@ class ITTicket(models.Model):
     # =========================================================
     # WORKFLOW METHODS - APPROVE/REJECT
     # =========================================================
+    @track_perf('submit')
     def action_submit(self):
 
         for rec in self:
 
-            config = self.env['it.ticket.workflow.config'].search(
-                [('ticket_type_id', '=', rec.ticket_type_id.id)],
-                limit=1
-            )
-
-            workflow = config.workflow_level if config else '2'
+            workflow = rec._get_workflow_level(rec.ticket_type_id.id)
 
             # Workflow 0 → Direct to IT team
             if workflow == '0':
 
-                it_team = self.env.ref('ticketing_it.group_it_team')
-
-                first_user = False
-                if it_team and it_team.user_ids:
-                    first_user = it_team.user_ids[0]
+                assignee = self.env['it.ticket.assignment']._pick_assignees([rec.ticket_type_id.id])[0]
 
                 rec.write({
                     'state': 'assigned',
-                    'assigned_to_id': first_user.id if first_user else False,
+                    'assigned_to_id': assignee.id,
                     'submitted_date': fields.Datetime.now()
                 })
                 return
@@ -930,55 +1031,254 @@ class ITTicket(models.Model):
             'context': {'default_ticket_id': self.id}
         }
 
-    def _check_reject_access(self):
-        """Verify the current user is allowed to reject this ticket."""
-        self.ensure_one()
+    def _check_approver_access(self, action):
+        """
+        Verify the current user may approve or reject every ticket in self.
+
+        The states and line managers of the whole set are read in one
+        prefetch query; ``action`` is the verb used in the error messages.
+        Tickets not pending approval raise a UserError, approvals by the
+        wrong user an AccessError.
+        """
         user = self.env.user
+        state_labels = dict(self._fields['state'].selection)
 
-        if self.state == 'manager_approval':
-            if user != self.line_manager_id:
-                raise UserError(
-                    _("Only the line manager (%s) can reject this ticket.")
-                    % (self.line_manager_id.name or _('unassigned'))
-                )
-        elif self.state == 'it_approval':
-            if not user.has_group('ticketing_it.group_it_manager'):
-                raise UserError(_("Only IT managers can reject this ticket."))
-        else:
+        not_pending = self.filtered(lambda t: t.state not in ('manager_approval', 'it_approval'))
+        if not_pending:
             raise UserError(
-                _("This ticket cannot be rejected in its current state (%s).")
-                % dict(self._fields['state'].selection).get(self.state, self.state)
+                _("Cannot %(action)s tickets that are not pending approval: %(tickets)s",
+                  action=action,
+                  tickets=', '.join('%s (%s)' % (t.name, state_labels.get(t.state, t.state)) for t in not_pending))
             )
 
-    def do_reject(self, reason):
-        """Actually reject the ticket (called from wizard)."""
-        for rec in self:
-            rec._check_reject_access()
+        not_line_manager = self.filtered(lambda t: t.state == 'manager_approval' and t.line_manager_id != user)
+        if not_line_manager:
+            raise AccessError(
+                _("Only the line manager can %(action)s these tickets: %(tickets)s",
+                  action=action, tickets=', '.join(not_line_manager.mapped('name')))
+            )
 
-            rec.sudo().write({
-                'state': 'rejected',
-                'rejection_reason': reason,
-                'rejected_by_id': self.env.user.id,
-                'rejected_date': fields.Datetime.now(),
+        if any(t.state == 'it_approval' for t in self) \
+                and not user.has_group('ticketing_it.group_it_manager'):
+            raise AccessError(_("Only IT managers can %s tickets pending IT approval.", action))
+
+    def _check_reject_access(self):
+        """Verify the current user is allowed to reject these tickets."""
+        self._check_approver_access(_("reject"))
+
+    def _queue_grouped_ticket_mail(self, template_xmlid, recipient, subject, intro, comment=None):
+        """
+        Notify each recipient once for all of their tickets in self.
+
+        ``recipient`` maps a ticket to a res.users record. Recipients with a
+        single ticket get the usual template, rendered for all of them in one
+        batch; several tickets are listed in one consolidated mail, followed
+        by ``comment`` when given. ``subject`` may use ``%(count)s`` for the
+        number of tickets of each recipient.
+        """
+        groups = defaultdict(list)
+        for ticket in self:
+            user = recipient(ticket)
+            if user.email:
+                groups[user].append(ticket.id)
+
+        template = self.env.ref(template_xmlid, raise_if_not_found=False)
+        from_email = self._get_from_email()
+        comment_html = "<p><b>Comment:</b> %s</p>" % html_escape(comment) if comment else ""
+        mail_vals_list = []
+        single_ids = []
+        for user, ids in groups.items():
+            tickets = self.browse(ids)
+            if len(tickets) == 1:
+                single_ids.extend(ids)
+                continue
+            ticket_list_html = "<ul>%s</ul>" % "".join(
+                "<li>%s — %s</li>" % (html_escape(ticket.name), html_escape(ticket.subject))
+                for ticket in tickets
+            )
+            mail_vals_list.append({
+                'subject': subject % {'count': len(tickets)},
+                'body_html': """
+                    <p>Dear %s,</p>
+                    <p>%s</p>
+                    %s
+                    %s
+                """ % (html_escape(user.name), html_escape(intro), ticket_list_html, comment_html),
+                'email_to': user.email,
+                'email_from': from_email,
+                'model': 'it.ticket',
             })
 
-            rec.activity_unlink(['mail.mail_activity_data_todo'])
+        if template and single_ids:
+            self.browse(single_ids)._queue_ticket_mail(template)
+        if mail_vals_list:
+            with measure_mail():
+                self.env['mail.mail'].sudo().create(mail_vals_list)
+            self._trigger_ticket_mail_queue()
 
-            template = self.env.ref(
-                'ticketing_it.email_template_rejection',
-                raise_if_not_found=False
+    @track_perf('approve')
+    def do_approve(self, comment=None):
+        """
+        Approve every ticket in self (called from the approve wizard, the
+        list action and the API).
+
+        Access is checked for the whole set up front; tickets then move on
+        with one write per target state (and per auto-assignee), activities
+        are created in one batch, notifications are consolidated per
+        recipient (with the approver's comment) and the chatter comments
+        are logged in one batch.
+        """
+        self._check_approver_access(_("approve"))
+        now = fields.Datetime.now()
+
+        to_it_manager = self.filtered(lambda t: t.state == 'manager_approval')
+        to_it_team = self - to_it_manager
+
+        bodies = {}
+        if to_it_manager:
+            bodies.update(to_it_manager._approve_as_line_manager(now, comment))
+        if to_it_team:
+            bodies.update(to_it_team._approve_as_it_manager(now, comment))
+
+        if comment:
+            comment_html = "<br/><b>Comment:</b> %s" % html_escape(comment)
+            bodies = {ticket_id: body + comment_html for ticket_id, body in bodies.items()}
+        self._log_ticket_comments(bodies)
+        return True
+
+    def _log_ticket_comments(self, bodies):
+        """
+        Log ``bodies`` (``{ticket_id: html}``) as public comments of the
+        current user in one batch, visible in the backend and portal chatter.
+
+        Unlike message_post, followers are not notified one ticket at a
+        time: the callers already notify the people concerned through
+        _queue_grouped_ticket_mail, one mail per recipient.
+        """
+        messages = self._message_log_batch(
+            bodies=bodies,
+            author_id=self.env.user.partner_id.id,
+            message_type='comment',
+        )
+        messages.sudo().write({
+            'subtype_id': self.env.ref('mail.mt_comment').id,
+            'is_internal': False,
+        })
+        return messages
+
+    def _approve_as_line_manager(self, now, comment=None):
+        """Move tickets pending the line manager to IT approval; return the chatter bodies."""
+        missing_it_manager = self.filtered(lambda t: not t.it_manager_id)
+        if missing_it_manager:
+            it_manager = self._find_it_manager()
+            if it_manager:
+                missing_it_manager.sudo().write({'it_manager_id': it_manager.id})
+
+        self.write({
+            'state': 'it_approval',
+            'manager_approval_date': now,
+        })
+        self.activity_unlink(['mail.mail_activity_data_todo'])
+
+        # One activity per ticket, all created in a single batch
+        activity_type = self.env.ref('mail.mail_activity_data_todo')
+        res_model_id = self.env['ir.model']._get_id(self._name)
+        self.env['mail.activity'].create([{
+            'activity_type_id': activity_type.id,
+            'res_model_id': res_model_id,
+            'res_id': ticket.id,
+            'user_id': ticket.it_manager_id.id,
+            'summary': _('IT Approval Required: %s', ticket.name),
+            'note': _('Ticket approved by line manager. Please review.'),
+        } for ticket in self.filtered('it_manager_id')])
+
+        self._queue_grouped_ticket_mail(
+            'ticketing_it.email_template_it_approval',
+            lambda ticket: ticket.it_manager_id,
+            _("IT Approval Required: %(count)s tickets"),
+            _("The following tickets were approved by their line manager and need your review:"),
+            comment=comment,
+        )
+
+        approver = html_escape(self.env.user.name)
+        return {
+            ticket.id: (
+                _("Approved by Line Manager: %s<br/>Sent to IT Manager: %s")
+                % (approver, html_escape(ticket.it_manager_id.name))
+                if ticket.it_manager_id else
+                _("Approved by Line Manager: %s<br/><b>WARNING:</b> No IT Manager found.") % approver
             )
-            if template:
-                template.send_mail(rec.id, force_send=True)
+            for ticket in self
+        }
 
-            rec.message_post(
-                body=_("Ticket rejected by %s<br/>Reason: %s") % (self.env.user.name, reason)
+    def _approve_as_it_manager(self, now, comment=None):
+        """Assign tickets pending IT approval; return the chatter bodies."""
+        unassigned = self.filtered(lambda t: not t.assigned_to_id)
+        by_assignee = defaultdict(list)
+        if unassigned:
+            assignees = self.env['it.ticket.assignment']._pick_assignees(
+                [ticket.ticket_type_id.id for ticket in unassigned]
             )
+            if not all(assignees):
+                raise ValidationError(_("No users found in IT Team to assign."))
+            for ticket, assignee in zip(unassigned, assignees):
+                by_assignee[assignee.id].append(ticket.id)
+
+        vals = {'state': 'assigned', 'it_approval_date': now}
+        for assignee_id, ids in by_assignee.items():
+            self.browse(ids).write(dict(vals, assigned_to_id=assignee_id))
+        already_assigned = self - unassigned
+        if already_assigned:
+            already_assigned.write(vals)
+        self.activity_unlink(['mail.mail_activity_data_todo'])
+
+        self._queue_grouped_ticket_mail(
+            'ticketing_it.email_template_it_assigned',
+            lambda ticket: ticket.employee_id.user_id,
+            _("Your tickets have been approved"),
+            _("The following tickets were approved and assigned to the IT team:"),
+            comment=comment,
+        )
+
+        approver = html_escape(self.env.user.name)
+        return {
+            ticket.id: _("Approved by IT Manager: %s<br/>Assigned to %s in IT Team.")
+            % (approver, html_escape(ticket.assigned_to_id.name))
+            for ticket in self
+        }
+
+    @track_perf('reject')
+    def do_reject(self, reason):
+        """
+        Reject every ticket in self (called from the reject wizard, the list
+        action and the API): one access check for the set, one write, one
+        consolidated mail per employee and one batch of chatter notes.
+        """
+        self._check_reject_access()
+
+        self.sudo().write({
+            'state': 'rejected',
+            'rejection_reason': reason,
+            'rejected_by_id': self.env.user.id,
+            'rejected_date': fields.Datetime.now(),
+        })
+        self.activity_unlink(['mail.mail_activity_data_todo'])
+
+        self._queue_grouped_ticket_mail(
+            'ticketing_it.email_template_rejection',
+            lambda ticket: ticket.employee_id.user_id,
+            _("Your tickets have been rejected"),
+            _("The following tickets were rejected. Reason: %s", reason),
+        )
+
+        body = _("Ticket rejected by %s<br/>Reason: %s") % (html_escape(self.env.user.name), html_escape(reason))
+        self._message_log_batch(bodies=dict.fromkeys(self.ids, body), author_id=self.env.user.partner_id.id)
 
     # =========================================================
     # IT TEAM WORKFLOW
     # =========================================================
 
+    @track_perf('start_work')
     def action_start_work(self):
         for rec in self:
             if rec.assigned_to_id != self.env.user:
@@ -989,6 +1289,7 @@ class ITTicket(models.Model):
                 body=_("Work started by %s") % self.env.user.name
             )
 
+    @track_perf('done')
     def action_done(self):
         """Mark ticket as done"""
 
@@ -1016,6 +1317,7 @@ class ITTicket(models.Model):
                     # rec.access_end_date = start_date + timedelta(minutes=12)
                     rec.access_finish_date = start_date + timedelta(minutes=12)
 
+                rec.access_expiry_processed = False
                 _logger.info("rec.access_finish_date: %s", rec.access_finish_date)
             template = self.env.ref(
                 'ticketing_it.email_template_done',
@@ -1023,7 +1325,7 @@ class ITTicket(models.Model):
             )
 
             if template:
-                template.send_mail(rec.id, force_send=True)
+                rec._queue_ticket_mail(template)
 
             rec.message_post(
                 body=_("Ticket completed by %s and employee notified") % self.env.user.name
@@ -1033,6 +1335,7 @@ class ITTicket(models.Model):
     # 24 HOUR MANAGER REMINDER (CALLED BY SCHEDULED ACTION)
     # =========================================================
 
+    @track_perf('cron_manager_reminder')
     def action_send_manager_reminder(self):
         """
         Called by scheduled action every 24 hours.
@@ -1066,9 +1369,9 @@ class ITTicket(models.Model):
                 )
 
                 if template:
-                    template.send_mail(ticket.id, force_send=True)
+                    ticket._queue_ticket_mail(template)
                     _logger.info(
-                        "24hr reminder sent → Ticket: %s | Manager: %s (%s)",
+                        "24hr reminder queued → Ticket: %s | Manager: %s (%s)",
                         ticket.name, manager.name, manager.email
                     )
                 else:
@@ -1095,8 +1398,11 @@ class ITTicket(models.Model):
                         'email_to': manager.email,
                         'email_from': from_email,
                     }
-                    mail = self.env['mail.mail'].sudo().create(mail_values)
-                    mail.send()
+                    with measure_mail():
+                        self.env['mail.mail'].sudo().create(dict(
+                            mail_values, model='it.ticket', res_id=ticket.id,
+                        ))
+                    self._trigger_ticket_mail_queue()
 
                 ticket.sudo().write({'last_reminder_sent': fields.Datetime.now()})
                 ticket.message_post(
@@ -1123,15 +1429,6 @@ class ITTicket(models.Model):
         for ticket in self:
             ticket.access_url = '/my/tickets/%s' % ticket.id
 
-    @api.depends('create_date', 'done_date')
-    def _compute_resolution_time(self):
-        for rec in self:
-            if rec.create_date and rec.done_date:
-                delta = rec.done_date - rec.create_date
-                rec.resolution_time = delta.total_seconds() / (60)  # convert seconds to days
-            else:
-                rec.resolution_time = 0
-
     @api.depends('done_date')
     def _compute_month_solved(self):
         for rec in self:
@@ -1140,6 +1437,87 @@ class ITTicket(models.Model):
             else:
                 rec.month_solved = 'N/A'
 
+    # =========================================================
+    # MAINTENANCE: SQL RECOMPUTE OF PROCESSING DURATIONS
+    # =========================================================
+
+    def action_recompute_processing_durations(self):
+        """Server action: recompute every stored duration field in SQL."""
+        updated = self._recompute_processing_durations_sql()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Processing Durations'),
+                'message': _('%s tickets updated.') % updated,
+                'type': 'success',
+                'sticky': False,
+            },
+        }
+
+    @api.model
+    def _recompute_processing_durations_sql(self, chunk_size=RECOMPUTE_CHUNK_SIZE):
+        """
+        Recompute PROCESSING_DURATION_FIELDS for all tickets with one
+        UPDATE per id chunk instead of the ORM compute loop.
+
+        Mirrors _compute_processing_durations and _compute_month_solved.
+        Only rows whose stored values drifted are rewritten, so it is safe
+        to run at any time. Returns the number of updated tickets.
+        """
+        self.flush_model()
+        cr = self.env.cr
+
+        cr.execute("SELECT min(id), max(id) FROM it_ticket")
+        min_id, max_id = cr.fetchone()
+        if min_id is None:
+            return 0
+
+        updated = 0
+        for chunk_start in range(min_id, max_id + 1, chunk_size):
+            cr.execute("""
+                UPDATE it_ticket t
+                   SET manager_processing_time = v.manager_seconds / 3600,
+                       it_processing_time = v.it_seconds / 3600,
+                       it_team_processing_time = v.it_team_seconds / 3600,
+                       total_resolution_time = v.total_seconds / 3600,
+                       resolution_time = v.resolution_seconds / 60,
+                       manager_processing_days = v.manager_seconds / 86400,
+                       it_processing_days = v.it_seconds / 86400,
+                       it_team_processing_days = v.it_team_seconds / 86400,
+                       month_solved = v.month_solved
+                  FROM (
+                        SELECT id,
+                               COALESCE(EXTRACT(EPOCH FROM manager_approval_date - submitted_date), 0)::float8
+                                   AS manager_seconds,
+                               COALESCE(EXTRACT(EPOCH FROM it_approval_date - manager_approval_date), 0)::float8
+                                   AS it_seconds,
+                               COALESCE(EXTRACT(EPOCH FROM done_date - it_approval_date), 0)::float8
+                                   AS it_team_seconds,
+                               COALESCE(EXTRACT(EPOCH FROM done_date - submitted_date), 0)::float8
+                                   AS total_seconds,
+                               COALESCE(EXTRACT(EPOCH FROM done_date - create_date), 0)::float8
+                                   AS resolution_seconds,
+                               COALESCE(to_char(done_date, 'FMMonth YYYY'), 'N/A')
+                                   AS month_solved
+                          FROM it_ticket
+                         WHERE id >= %(start)s AND id < %(stop)s
+                       ) v
+                 WHERE t.id = v.id
+                   AND (t.manager_processing_time, t.it_processing_time, t.it_team_processing_time,
+                        t.total_resolution_time, t.resolution_time, t.manager_processing_days,
+                        t.it_processing_days, t.it_team_processing_days, t.month_solved)
+                       IS DISTINCT FROM
+                       (v.manager_seconds / 3600, v.it_seconds / 3600, v.it_team_seconds / 3600,
+                        v.total_seconds / 3600, v.resolution_seconds / 60, v.manager_seconds / 86400,
+                        v.it_seconds / 86400, v.it_team_seconds / 86400, v.month_solved)
+            """, {'start': chunk_start, 'stop': chunk_start + chunk_size})
+            updated += cr.rowcount
+
+        self.invalidate_model(PROCESSING_DURATION_FIELDS)
+        _logger.info("Processing durations recomputed in SQL: %s tickets updated", updated)
+        return updated
+
     # @api.constrains('assigned_to_id')
     # def _check_assigned_to_access(self):
     #     for rec in self:
@@ -1175,7 +1553,53 @@ class ITTicket(models.Model):
                 if new_state == 'it_approval' and record.state != 'it_approval':
                     vals['it_approval_date'] = now
 
-        return super().write(vals)
+        # ----------------------------
+        # OPEN LOAD / EMPLOYEE COUNTERS
+        # ----------------------------
+        track_load = 'state' in vals or 'assigned_to_id' in vals
+        track_counts = 'state' in vals or 'employee_id' in vals
+        if not track_load and not track_counts:
+            return super().write(vals)
+
+        load_before = self._get_open_load() if track_load else {}
+        counts_before = self._get_employee_state_counts() if track_counts else {}
+        res = super().write(vals)
+
+        if track_load:
+            load_deltas = self._get_open_load()
+            for user_id, count in load_before.items():
+                load_deltas[user_id] -= count
+            self.env['it.ticket.assignee.load']._apply_load_deltas(load_deltas)
+        if track_counts:
+            count_deltas = self._get_employee_state_counts()
+            for key, count in counts_before.items():
+                count_deltas[key] -= count
+            self.env['it.ticket.employee.count']._apply_count_deltas(count_deltas)
+        return res
+
+    def unlink(self):
+        load_deltas = {user_id: -count for user_id, count in self._get_open_load().items()}
+        count_deltas = {key: -count for key, count in self._get_employee_state_counts().items()}
+        res = super().unlink()
+        self.env['it.ticket.assignee.load']._apply_load_deltas(load_deltas)
+        self.env['it.ticket.employee.count']._apply_count_deltas(count_deltas)
+        return res
+
+    def _get_employee_state_counts(self):
+        """Return ``{(employee_id, state): n}`` tickets in self."""
+        counts = defaultdict(int)
+        for rec in self:
+            if rec.employee_id and rec.state:
+                counts[(rec.employee_id.id, rec.state)] += 1
+        return counts
+
+    def _get_open_load(self):
+        """Return ``{user_id: n}`` open (assigned/in progress) tickets in self per assignee."""
+        load = defaultdict(int)
+        for rec in self:
+            if rec.assigned_to_id and rec.state in OPEN_STATES:
+                load[rec.assigned_to_id.id] += 1
+        return load
 
     def open_reminder_wizard(self):
         return {
@@ -1185,161 +1609,211 @@ class ITTicket(models.Model):
             'target': 'new',
         }
 
+    @track_perf('cron_dynamic_reminder')
     def action_send_dynamic_reminder(self):
+        """
+        Called by scheduled action every hour.
+        Sends one consolidated reminder per approver for every ticket that
+        has been waiting in manager_approval / it_approval longer than the
+        configured interval and has not been reminded within that interval.
+
+        Due tickets are selected and grouped per approver in SQL, mails are
+        queued (delivered by the mail queue cron, not inline) and every batch
+        of approvers is committed, so a crash mid-run resumes where it stopped
+        instead of re-sending.
+        """
         _logger.info("===== CRON STARTED: IT Ticket Reminder =====")
 
         ICP = self.env['ir.config_parameter'].sudo()
         reminder_minutes = int(ICP.get_param('ticketing_it.reminder_days', 1))
-        _logger.info("Reminder interval (minutes): %s", reminder_minutes)
-
         now = fields.Datetime.now()
-        _logger.info("Current time: %s", now)
-
-        tickets = self.search([
-            ('state', 'in', ['manager_approval', 'it_approval'])
-        ])
-        _logger.info("Total tickets found in approval states: %s", len(tickets))
-
-        user_ticket_map = defaultdict(list)
-
-        for ticket in tickets:
-            _logger.info("Checking Ticket: %s | State: %s", ticket.name, ticket.state)
 
-            if ticket.state == 'manager_approval':
-                _logger.info("Manager approval date %s", ticket.manager_approval_date)
-                state_date = ticket.manager_approval_date
-                user = ticket.line_manager_id
-                _logger.info("ticket.line_manager_id %s", ticket.line_manager_id)
-
-            elif ticket.state == 'it_approval':
-                _logger.info("IT Manager approval date %s", ticket.it_approval_date)
-                state_date = ticket.it_approval_date
-                user = ticket.it_manager_id
-
-            else:
-                continue
-
-            if not state_date or not user:
-                _logger.warning("Skipping ticket due to missing state_date or user")
-                continue
-
-            # Compute minutes only (ignore seconds)
-            minutes_in_state = int((now - state_date).total_seconds() / 60)
-            _logger.info("Minutes in state: %s", minutes_in_state)
-            _logger.info("reminder_minutes: %s", reminder_minutes)
-            # Check if reminder threshold is reached
-            if minutes_in_state < reminder_minutes:
-                _logger.info("Skipping - Not enough time passed")
-                continue
-            _logger.info("ticket.last_reminder_sent: %s", ticket.last_reminder_sent)
-            if ticket.last_reminder_sent:
-                minutes_since_last = int((now - ticket.last_reminder_sent).total_seconds() / 60)
-                _logger.info("Minutes since last reminder: %s", minutes_since_last)
+        groups = self._get_due_reminder_groups(reminder_minutes, now)
+        _logger.info(
+            "Reminder interval (minutes): %s | Users to notify: %s",
+            reminder_minutes, len(groups)
+        )
 
-                if minutes_since_last < reminder_minutes:
-                    _logger.info("Skipping - Reminder already sent recently")
-                    continue
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        from_email = self._get_from_email()
 
-            _logger.info("Adding ticket to user group: %s", user.name)
-            user_ticket_map[user].append(ticket)
+        for offset in range(0, len(groups), REMINDER_BATCH_SIZE):
+            batch = groups[offset:offset + REMINDER_BATCH_SIZE]
+            self._send_reminder_batch(batch, now, from_email)
+            if auto_commit:
+                self.env.cr.commit()
+            _logger.info(
+                "Reminder checkpoint: %s/%s users processed",
+                offset + len(batch), len(groups)
+            )
 
-        _logger.info("Users to notify: %s", len(user_ticket_map))
+        _logger.info("===== CRON FINISHED =====")
 
-        for user, user_tickets in user_ticket_map.items():
-            _logger.info("Preparing email for user: %s", user.name)
+    @api.model
+    def _get_due_reminder_groups(self, reminder_minutes, now):
+        """
+        Return one row per approver with at least one ticket due for a
+        reminder: (approver_id, approver_name, approver_email, ticket_ids,
+        ticket_names).
 
-            ticket_list_html = "<ul>"
-            for ticket in user_tickets:
-                ticket_list_html += f"<li>{ticket.name}</li>"
-            ticket_list_html += "</ul>"
+        The state-date and last-reminder thresholds are evaluated in the
+        WHERE clause so tickets that are not due are never loaded.
+        """
+        self.flush_model([
+            'state', 'name', 'line_manager_id', 'it_manager_id',
+            'manager_approval_date', 'it_approval_date', 'last_reminder_sent',
+        ])
+        threshold = now - timedelta(minutes=reminder_minutes)
 
-            body = f"""
-                    <p>Dear {user.name},</p>
-                    <p>You have pending tickets to approve:</p>
-                    {ticket_list_html}
-                """
+        self.env.cr.execute("""
+            SELECT due.approver_id,
+                   partner.name,
+                   partner.email,
+                   array_agg(due.id ORDER BY due.id),
+                   array_agg(due.name ORDER BY due.id)
+              FROM (
+                    SELECT t.id,
+                           t.name,
+                           CASE WHEN t.state = 'manager_approval'
+                                THEN t.line_manager_id
+                                ELSE t.it_manager_id
+                           END AS approver_id
+                      FROM it_ticket t
+                     WHERE (
+                             (t.state = 'manager_approval'
+                              AND t.line_manager_id IS NOT NULL
+                              AND t.manager_approval_date <= %(threshold)s)
+                          OR (t.state = 'it_approval'
+                              AND t.it_manager_id IS NOT NULL
+                              AND t.it_approval_date <= %(threshold)s)
+                           )
+                       AND (t.last_reminder_sent IS NULL
+                            OR t.last_reminder_sent <= %(threshold)s)
+                   ) due
+              JOIN res_users users ON users.id = due.approver_id
+              JOIN res_partner partner ON partner.id = users.partner_id
+          GROUP BY due.approver_id, partner.name, partner.email
+          ORDER BY due.approver_id
+        """, {'threshold': threshold})
+
+        return self.env.cr.fetchall()
+
+    def _send_reminder_batch(self, groups, now, from_email):
+        """
+        Queue one reminder mail per approver in ``groups`` and stamp all of
+        their tickets at once: a single mail.mail create, a single
+        last_reminder_sent UPDATE and one batched chatter log.
+        """
+        mail_vals_list = []
+        bodies = {}
+        ticket_ids = []
 
-            mail_values = {
+        for approver_id, approver_name, approver_email, ids, names in groups:
+            ticket_list_html = "<ul>%s</ul>" % "".join(
+                "<li>%s</li>" % html_escape(name) for name in names
+            )
+            mail_vals_list.append({
                 'subject': 'Pending Ticket Reminder',
-                'body_html': body,
-                'email_to': user.partner_id.email,
-            }
-
-            _logger.info("Creating email for: %s | Email: %s", user.name, user.partner_id.email)
-
-            mail = self.env['mail.mail'].sudo().create(mail_values)
-            mail.send()
-
-            _logger.info("Email sent to: %s", user.name)
+                'body_html': """
+                    <p>Dear %s,</p>
+                    <p>You have pending tickets to approve:</p>
+                    %s
+                """ % (html_escape(approver_name), ticket_list_html),
+                'email_to': approver_email,
+                'email_from': from_email,
+            })
 
-            for ticket in user_tickets:
-                ticket.sudo().write({
-                    'last_reminder_sent': now
-                })
+            note = _("Consolidated reminder sent to %s") % approver_name
+            bodies.update(dict.fromkeys(ids, note))
+            ticket_ids.extend(ids)
 
-                ticket.message_post(
-                    body=_("Consolidated reminder sent to %s") % user.name
-                )
+        with measure_mail():
+            self.env['mail.mail'].sudo().create(mail_vals_list)
 
-        _logger.info("===== CRON FINISHED =====")
+        tickets = self.browse(ticket_ids).sudo()
+        tickets.write({'last_reminder_sent': now})
+        tickets._message_log_batch(bodies=bodies)
 
+    @track_perf('cron_social_media_expiry')
     def check_social_media_expiry(self):
-        now = fields.Datetime.now()
-        one_minute_to_go = now - timedelta(minutes=1)
-
+        """
+        Called by scheduled action every minute.
+        Drains the queue of social media tickets whose access has expired and
+        notifies the assignee and the employee.
+
+        Every ticket with access_finish_date in the past that is not yet
+        processed is due, so a delayed run never skips expiries; rows are
+        claimed with FOR UPDATE SKIP LOCKED and flagged in the same
+        transaction, so overlapping runs never notify twice.
+        """
         _logger.info("CRON START: Checking social media expiry")
-        _logger.info(f"Time window: {one_minute_to_go} → {now}")
-
-        tickets = self.search([
-            ('access_finish_date', '>=', one_minute_to_go),
-            ('access_finish_date', '<=', now),
-        ])
 
-        _logger.info(f"Tickets found: {len(tickets)}")
-
-        _logger.info("Total tickets expiring in last minute: %s", len(tickets))
+        now = fields.Datetime.now()
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        processed = 0
+
+        while True:
+            self.flush_model(['access_finish_date', 'access_expiry_processed'])
+            self.env.cr.execute("""
+                SELECT id
+                  FROM it_ticket
+                 WHERE access_finish_date <= %s
+                   AND access_expiry_processed IS NOT TRUE
+              ORDER BY access_finish_date
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, (now, EXPIRY_BATCH_SIZE))
+            ticket_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not ticket_ids:
+                break
+
+            tickets = self.browse(ticket_ids).sudo()
+            mail_vals_list = tickets._prepare_expiry_mail_values()
+            if mail_vals_list:
+                with measure_mail():
+                    self.env['mail.mail'].sudo().create(mail_vals_list)
+            tickets.write({'access_expiry_processed': True})
+
+            if auto_commit:
+                self.env.cr.commit()
+            processed += len(ticket_ids)
+
+            if len(ticket_ids) < EXPIRY_BATCH_SIZE:
+                break
+
+        _logger.info("Expired social media tickets processed: %s", processed)
+        _logger.info("===== CRON FINISHED =====")
 
-        for ticket in tickets:
-            try:
-                _logger.info("Processing Ticket: %s", ticket.name)
-
-                # Assignee email
-                if ticket.assigned_to_id and ticket.assigned_to_id.email:
-                    assignee = ticket.assigned_to_id
-                    body = f"""
-                        <p>Dear {assignee.name},</p>
-                        <p>Access for ticket <b>{ticket.name}</b> has expired.</p>
+    def _prepare_expiry_mail_values(self):
+        """Build the queued access-expired mails for the assignee and employee."""
+        mail_vals_list = []
+        for ticket in self:
+            # Assignee email
+            if ticket.assigned_to_id and ticket.assigned_to_id.email:
+                assignee = ticket.assigned_to_id
+                mail_vals_list.append({
+                    'subject': f"Access Expired - {ticket.name}",
+                    'body_html': f"""
+                        <p>Dear {html_escape(assignee.name)},</p>
+                        <p>Access for ticket <b>{html_escape(ticket.name)}</b> has expired.</p>
                         <p>Please take necessary action.</p>
-                    """
-                    mail_values = {
-                        'subject': f"Access Expired - {ticket.name}",
-                        'body_html': body,
-                        'email_to': assignee.email,
-                    }
-                    _logger.info("Sending email to assignee: %s", assignee.email)
-                    self.env['mail.mail'].sudo().create(mail_values).send()
-
-                # Employee email
-                if ticket.employee_id and ticket.employee_id.user_id and ticket.employee_id.email:
-                    employee = ticket.employee_id
-                    body = f"""
-                        <p>Dear {employee.name},</p>
-                        <p>Your access for ticket <b>{ticket.name}</b> has expired.</p>
-                        <p>Please contact IT if needed.</p>
-                    """
-                    mail_values = {
-                        'subject': f"Your Access Has Expired - {ticket.name}",
-                        'body_html': body,
-                        'email_to': employee.email,
-                    }
-                    _logger.info("Sending email to employee: %s", employee.email)
-                    self.env['mail.mail'].sudo().create(mail_values).send()
-
-            except Exception as e:
-                _logger.error("Error processing ticket %s: %s", ticket.id, str(e))
-
-        _logger.info("===== CRON FINISHED =====")
+                    """,
+                    'email_to': assignee.email,
+                })
 
+            # Employee email
+            if ticket.employee_id and ticket.employee_id.user_id and ticket.employee_id.email:
+                employee = ticket.employee_id
+                mail_vals_list.append({
+                    'subject': f"Your Access Has Expired - {ticket.name}",
+                    'body_html': f"""
+                        <p>Dear {html_escape(employee.name)},</p>
+                        <p>Your access for ticket <b>{html_escape(ticket.name)}</b> has expired.</p>
+                        <p>Please contact IT if needed.</p>
+                    """,
+                    'email_to': employee.email,
+                })
+        return mail_vals_list
 
 
 class ITTicketWorkflowConfig(models.Model):
@@ -1370,6 +1844,12 @@ class ITTicketWorkflowConfig(models.Model):
         'it.ticket.type',
         compute='_compute_existing_ticket_types'
     )
+    technician_ids = fields.Many2many(
+        'res.users',
+        string='Technicians',
+        help="IT team members preferred for this ticket type by the "
+             "'Skill by Ticket Type' assignment strategy."
+    )
     _sql_constraints = [
         ('unique_ticket_type_id', 'unique(ticket_type_id)', 'Workflow already defined for this ticket type!')
     ]
@@ -1388,7 +1868,55 @@ class ITTicketWorkflowConfig(models.Model):
 
     @api.depends()
     def _compute_existing_ticket_types(self):
-        all_configs = self.search([]).mapped('ticket_type_id')
+        all_configs = self.env['it.ticket.type'].browse(list(self._get_workflow_level_map()))
 
         for rec in self:
             rec.existing_ticket_type_ids = all_configs
+
+    # =========================================================
+    # CACHED WORKFLOW RESOLUTION
+    # =========================================================
+
+    @api.model
+    @ormcache()
+    def _get_workflow_level_map(self):
+        """
+        Return ``{ticket_type_id: workflow_level}`` for every configured type.
+        Cached per registry and cleared on any change to the configuration.
+        """
+        self.flush_model(['ticket_type_id', 'workflow_level'])
+        self.env.cr.execute("SELECT ticket_type_id, workflow_level FROM it_ticket_workflow_config")
+        return frozendict(self.env.cr.fetchall())
+
+    @api.model
+    def _get_workflow_level(self, ticket_type_id):
+        return self._get_workflow_level_map().get(ticket_type_id, DEFAULT_WORKFLOW_LEVEL)
+
+    @api.model
+    @ormcache()
+    def _get_technician_map(self):
+        """Return ``{ticket_type_id: frozenset(user_ids)}`` of configured technicians."""
+        return frozendict({
+            config.ticket_type_id.id: frozenset(config.technician_ids.ids)
+            for config in self.sudo().search([('technician_ids', '!=', False)])
+        })
+
+    @api.model
+    def _get_type_technicians(self, ticket_type_id):
+        return self._get_technician_map().get(ticket_type_id, frozenset())
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+import logging
+
+from .it_ticket_metrics import track_perf
+
+_logger = logging.getLogger(__name__)
+
+# Ticket states that count towards a technician's open load
+OPEN_STATES = ('assigned', 'in_progress')
+
+ASSIGNMENT_STRATEGIES = [
+    ('least_loaded', 'Least Loaded'),
+    ('round_robin', 'Round Robin'),
+    ('skill', 'Skill by Ticket Type'),
+]
+DEFAULT_ASSIGNMENT_STRATEGY = 'least_loaded'
+
+
+class ITTicketAssigneeLoad(models.Model):
+    _name = 'it.ticket.assignee.load'
+    _description = 'IT Technician Open Ticket Load'
+    _rec_name = 'user_id'
+    _order = 'open_count, last_assigned, user_id'
+
+    user_id = fields.Many2one('res.users', required=True, readonly=True, ondelete='cascade')
+    open_count = fields.Integer(readonly=True, default=0)
+    last_assigned = fields.Datetime(readonly=True)
+
+    def init(self):
+        super().init()
+        # Target of the ON CONFLICT upserts in _apply_load_deltas
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS it_ticket_assignee_load_user_id_uniq
+                ON it_ticket_assignee_load (user_id)
+        """)
+
+    @api.model
+    def _apply_load_deltas(self, deltas, assigned_at=False):
+        """
+        Add ``deltas`` (``{user_id: +/-n}``) to the stored open counters.
+        Users whose load grew get ``last_assigned = assigned_at`` (now).
+        """
+        deltas = {uid: delta for uid, delta in deltas.items() if uid and delta}
+        if not deltas:
+            return
+
+        user_ids = list(deltas)
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_assignee_load (user_id, open_count)
+            SELECT unnest(%s::int[]), 0
+            ON CONFLICT (user_id) DO NOTHING
+        """, (user_ids,))
+        self.env.cr.execute("""
+            UPDATE it_ticket_assignee_load l
+               SET open_count = GREATEST(l.open_count + d.delta, 0),
+                   last_assigned = CASE WHEN d.delta > 0
+                                        THEN %(assigned_at)s::timestamp
+                                        ELSE l.last_assigned END
+              FROM unnest(%(user_ids)s::int[], %(deltas)s::int[]) AS d(user_id, delta)
+             WHERE l.user_id = d.user_id
+        """, {
+            'user_ids': user_ids,
+            'deltas': [deltas[uid] for uid in user_ids],
+            'assigned_at': assigned_at or fields.Datetime.now(),
+        })
+        self.invalidate_model(['open_count', 'last_assigned'])
+
+    @api.model
+    @track_perf('cron_rebuild_assignee_load')
+    def _rebuild_assignee_load(self):
+        """
+        Recount open tickets per assignee from it_ticket. Run on upgrade and
+        nightly to heal any drift from writes that bypassed the ORM.
+        """
+        self.env['it.ticket'].flush_model(['assigned_to_id', 'state'])
+        self.env.cr.execute("""
+            UPDATE it_ticket_assignee_load
+               SET open_count = 0
+             WHERE open_count <> 0
+        """)
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_assignee_load (user_id, open_count)
+            SELECT assigned_to_id, count(*)
+              FROM it_ticket
+             WHERE assigned_to_id IS NOT NULL
+               AND state IN %s
+             GROUP BY assigned_to_id
+            ON CONFLICT (user_id) DO UPDATE
+               SET open_count = EXCLUDED.open_count
+        """, (OPEN_STATES,))
+        self.invalidate_model(['open_count'])
+        _logger.info("IT assignee load counters rebuilt")
+
+
+class ITTicketAssignment(models.AbstractModel):
+    _name = 'it.ticket.assignment'
+    _description = 'IT Ticket Assignment Engine'
+
+    @api.model
+    def _get_strategy(self):
+        strategy = self.env['ir.config_parameter'].sudo().get_param(
+            'ticketing_it.assignment_strategy', DEFAULT_ASSIGNMENT_STRATEGY
+        )
+        if not hasattr(self, '_assign_%s' % strategy):
+            _logger.warning("Unknown assignment strategy %r, using %s", strategy, DEFAULT_ASSIGNMENT_STRATEGY)
+            strategy = DEFAULT_ASSIGNMENT_STRATEGY
+        return strategy
+
+    @api.model
+    def _pick_assignees(self, ticket_type_ids):
+        """
+        Return one res.users recordset (possibly empty) per entry of
+        ``ticket_type_ids``, chosen by the configured strategy.
+
+        The open load of every IT team member is read once from
+        it.ticket.assignee.load and updated locally while picking, so a
+        batch of tickets is spread over the team instead of piling onto
+        whoever was least loaded when the batch started.
+        """
+        team_ids = self.env['it.group.resolver']._get_it_team_users().ids
+        if not team_ids:
+            return [self.env['res.users']] * len(ticket_type_ids)
+
+        self.env['it.ticket.assignee.load'].flush_model(['open_count', 'last_assigned'])
+        self.env.cr.execute("""
+            SELECT user_id, open_count, last_assigned
+              FROM it_ticket_assignee_load
+             WHERE user_id = ANY(%s)
+        """, (team_ids,))
+        # load[uid] = [open_count, assignment order]; never-assigned users first
+        load = {uid: [0, None] for uid in team_ids}
+        for uid, open_count, last_assigned in self.env.cr.fetchall():
+            load[uid] = [open_count, last_assigned]
+        ordered = sorted(team_ids, key=lambda uid: (load[uid][1] is not None, load[uid][1] or 0, uid))
+        for position, uid in enumerate(ordered):
+            load[uid][1] = position
+
+        strategy = getattr(self, '_assign_%s' % self._get_strategy())
+        tick = len(team_ids)
+        result = []
+        for ticket_type_id in ticket_type_ids:
+            user_id = strategy(team_ids, load, ticket_type_id)
+            if user_id:
+                load[user_id][0] += 1
+                load[user_id][1] = tick
+                tick += 1
+            result.append(self.env['res.users'].browse(user_id or ()))
+        return result
+
+    # =========================================================
+    # STRATEGIES
+    # Each takes (candidate user ids, {uid: [open_count, order]},
+    # ticket_type_id) and returns the chosen user id.
+    # =========================================================
+
+    @api.model
+    def _assign_least_loaded(self, user_ids, load, ticket_type_id):
+        return min(user_ids, key=lambda uid: (load[uid][0], load[uid][1]))
+
+    @api.model
+    def _assign_round_robin(self, user_ids, load, ticket_type_id):
+        return min(user_ids, key=lambda uid: load[uid][1])
+
+    @api.model
+    def _assign_skill(self, user_ids, load, ticket_type_id):
+        """Least loaded among the technicians configured for the ticket type."""
+        skilled = self.env['it.ticket.workflow.config']._get_type_technicians(ticket_type_id)
+        candidates = [uid for uid in user_ids if uid in skilled] or user_ids
+        return self._assign_least_loaded(candidates, load, ticket_type_id)
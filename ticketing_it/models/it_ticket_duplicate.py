@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+import logging
+
+from .it_ticket_search import STRIP_HTML_REGEX
+
+_logger = logging.getLogger(__name__)
+
+# Tickets still being worked on; only these are offered as duplicates.
+DUPLICATE_OPEN_STATES = ('draft', 'manager_approval', 'it_approval', 'assigned', 'in_progress')
+# Maximum number of similar tickets returned per lookup.
+DUPLICATE_CANDIDATE_LIMIT = 5
+# Leading characters of the description compared; keeps scoring cheap on long texts.
+DUPLICATE_DESCRIPTION_CHARS = 2000
+
+
+class ITTicket(models.Model):
+    _inherit = 'it.ticket'
+
+    similar_ticket_ids = fields.Many2many(
+        'it.ticket',
+        'it_ticket_similar_rel',
+        'ticket_id',
+        'similar_id',
+        string='Similar Open Tickets',
+        readonly=True,
+        copy=False,
+        help="Open tickets of the same employee or department with a similar subject, found at submission."
+    )
+    duplicate_of_id = fields.Many2one(
+        'it.ticket',
+        string='Duplicate Of',
+        index='btree_not_null',
+        tracking=True,
+        copy=False,
+    )
+    duplicate_ids = fields.One2many('it.ticket', 'duplicate_of_id', string='Duplicates')
+
+    @api.model
+    def _find_similar_tickets(self, subject, description=None, employee_id=False, department_id=False,
+                              exclude_ids=(), limit=DUPLICATE_CANDIDATE_LIMIT):
+        """
+        Return up to ``limit`` open tickets of the employee or department
+        whose subject is similar to ``subject``, best match first.
+
+        Candidates are found with the pg_trgm ``%`` operator, served by the
+        trigram index on ``subject``; only those are re-scored against the
+        start of their HTML-stripped description.
+        """
+        if not subject or not (employee_id or department_id):
+            return self.browse()
+        if not self.env.registry.has_trigram:
+            _logger.warning("pg_trgm is not available, similar ticket detection is disabled")
+            return self.browse()
+
+        self.flush_model(['subject', 'description', 'state', 'employee_id', 'department_id'])
+        self.env.cr.execute("""
+            SELECT id
+              FROM it_ticket
+             WHERE subject %% %(subject)s
+               AND state IN %(states)s
+               AND (employee_id = %(employee_id)s OR department_id = %(department_id)s)
+               AND id != ALL(%(exclude_ids)s)
+          ORDER BY similarity(subject, %(subject)s) * 0.7
+                 + similarity(left(regexp_replace(coalesce(description, ''), %(strip)s, ' ', 'g'), %(chars)s),
+                              %(description)s) * 0.3 DESC,
+                   id DESC
+             LIMIT %(limit)s
+        """, {
+            'subject': subject,
+            'description': (description or '')[:DUPLICATE_DESCRIPTION_CHARS],
+            'states': DUPLICATE_OPEN_STATES,
+            'employee_id': employee_id or None,
+            'department_id': department_id or None,
+            'exclude_ids': list(exclude_ids),
+            'strip': STRIP_HTML_REGEX,
+            'chars': DUPLICATE_DESCRIPTION_CHARS,
+            'limit': limit,
+        })
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _detect_similar_tickets(self):
+        """Store the similar open tickets of each submitted ticket and note them in the chatter."""
+        bodies = {}
+        for rec in self:
+            similar = self._find_similar_tickets(
+                rec.subject,
+                rec.description,
+                employee_id=rec.employee_id.id,
+                department_id=rec.department_id.id,
+                exclude_ids=self.ids,
+            )
+            if similar:
+                rec.similar_ticket_ids = similar
+                bodies[rec.id] = _("Possible duplicate of %s", ', '.join(similar.mapped('name')))
+        if bodies:
+            self.browse(list(bodies))._message_log_batch(bodies=bodies)
+        return bodies
+
+    def write(self, vals):
+        res = super().write(vals)
+        if vals.get('duplicate_of_id'):
+            original = self.browse(vals['duplicate_of_id'])
+            original._message_log(body=_("Linked duplicates: %s", ', '.join(self.mapped('name'))))
+        return res
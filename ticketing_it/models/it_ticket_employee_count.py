@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from collections import defaultdict
+import logging
+
+from .it_ticket_metrics import track_perf
+
+_logger = logging.getLogger(__name__)
+
+
+class ITTicketEmployeeCount(models.Model):
+    _name = 'it.ticket.employee.count'
+    _description = 'IT Ticket Count per Employee and State'
+    _rec_name = 'employee_id'
+
+    employee_id = fields.Many2one('hr.employee', required=True, readonly=True, ondelete='cascade')
+    state = fields.Char(required=True, readonly=True)
+    ticket_count = fields.Integer(readonly=True, default=0)
+
+    def init(self):
+        super().init()
+        # Target of the ON CONFLICT upserts in _apply_count_deltas
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS it_ticket_employee_count_employee_state_uniq
+                ON it_ticket_employee_count (employee_id, state)
+        """)
+
+    @api.model
+    def _apply_count_deltas(self, deltas):
+        """Add ``deltas`` (``{(employee_id, state): +/-n}``) to the stored counters."""
+        deltas = {key: delta for key, delta in deltas.items() if key[0] and delta}
+        if not deltas:
+            return
+
+        keys = list(deltas)
+        params = {
+            'employee_ids': [key[0] for key in keys],
+            'states': [key[1] for key in keys],
+            'deltas': [deltas[key] for key in keys],
+        }
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_employee_count (employee_id, state, ticket_count)
+            SELECT employee_id, state, 0
+              FROM unnest(%(employee_ids)s::int[], %(states)s::varchar[]) AS d(employee_id, state)
+            ON CONFLICT (employee_id, state) DO NOTHING
+        """, params)
+        self.env.cr.execute("""
+            UPDATE it_ticket_employee_count c
+               SET ticket_count = GREATEST(c.ticket_count + d.delta, 0)
+              FROM unnest(%(employee_ids)s::int[], %(states)s::varchar[], %(deltas)s::int[])
+                   AS d(employee_id, state, delta)
+             WHERE c.employee_id = d.employee_id
+               AND c.state = d.state
+        """, params)
+        self.invalidate_model(['ticket_count'])
+
+    @api.model
+    def _get_counts(self, employee_id):
+        """Return ``{state: ticket_count}`` for one employee."""
+        self.flush_model(['ticket_count'])
+        self.env.cr.execute("""
+            SELECT state, ticket_count
+              FROM it_ticket_employee_count
+             WHERE employee_id = %s
+        """, (employee_id,))
+        return defaultdict(int, self.env.cr.fetchall())
+
+    @api.model
+    @track_perf('cron_rebuild_employee_counts')
+    def _rebuild_employee_counts(self):
+        """Recount tickets per employee and state from it_ticket."""
+        self.env['it.ticket'].flush_model(['employee_id', 'state'])
+        self.env.cr.execute("DELETE FROM it_ticket_employee_count")
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_employee_count (employee_id, state, ticket_count)
+            SELECT employee_id, state, count(*)
+              FROM it_ticket
+             WHERE employee_id IS NOT NULL
+               AND state IS NOT NULL
+             GROUP BY employee_id, state
+        """)
+        self.invalidate_model(['ticket_count'])
+        _logger.info("IT ticket employee counters rebuilt")
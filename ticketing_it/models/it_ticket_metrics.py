@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+import contextlib
+import functools
+import logging
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+# Per-worker aggregates: {operation: [calls, total_ms, max_ms, total_queries, total_mail_ms]}
+_perf_stats = defaultdict(lambda: [0, 0.0, 0.0, 0, 0.0])
+
+# Spans currently open in this thread, innermost last; each is a
+# one-item list accumulating the mail time measured while it is open.
+_active_spans = threading.local()
+
+
+def _open_spans():
+    if not hasattr(_active_spans, 'stack'):
+        _active_spans.stack = []
+    return _active_spans.stack
+
+
+@contextlib.contextmanager
+def measure_mail():
+    """
+    Context manager adding the enclosed time to the ``mail_ms`` of every
+    open track_perf span of this thread (rendering, queuing or sending).
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for span in _open_spans():
+            span[0] += elapsed_ms
+
+
+def track_perf(operation):
+    """
+    Decorator measuring a ticketing hot path: wall time, SQL queries run on
+    the record's cursor and time spent in measure_mail() blocks.
+
+    Each call is logged as one ``key=value`` line on the
+    ``odoo.addons.ticketing_it.models.it_ticket_metrics`` logger, folded
+    into the per-worker aggregates returned by get_perf_stats() and stored
+    as an it.ticket.perf.sample row when the call succeeds.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cr = self.env.cr
+            queries_before = getattr(cr, 'sql_log_count', 0)
+            span = [0.0]
+            spans = _open_spans()
+            spans.append(span)
+            failed = True
+            result = None
+            start = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                spans.pop()
+                queries = getattr(cr, 'sql_log_count', 0) - queries_before
+                mail_ms = span[0]
+                records = len(self)
+                if not records and getattr(result, '_name', None) == self._name:
+                    records = len(result)  # create() runs on the empty model
+
+                stats = _perf_stats[operation]
+                stats[0] += 1
+                stats[1] += elapsed_ms
+                stats[2] = max(stats[2], elapsed_ms)
+                stats[3] += queries
+                stats[4] += mail_ms
+                _logger.info(
+                    "perf operation=%s model=%s records=%s duration_ms=%.1f queries=%s mail_ms=%.1f failed=%s",
+                    operation, self._name, records, elapsed_ms, queries, mail_ms, failed
+                )
+                # A failed call may have aborted the transaction: only log it
+                if not failed and 'it.ticket.perf.sample' in self.env:
+                    self.env['it.ticket.perf.sample']._record_sample(
+                        operation, self._name, records, elapsed_ms, queries, mail_ms
+                    )
+        return wrapper
+    return decorator
+
+
+def get_perf_stats():
+    """Return ``{operation: {'calls', 'avg_ms', 'max_ms', 'avg_queries', 'avg_mail_ms'}}`` for this worker."""
+    return {
+        operation: {
+            'calls': calls,
+            'avg_ms': total_ms / calls if calls else 0.0,
+            'max_ms': max_ms,
+            'avg_queries': total_queries / calls if calls else 0.0,
+            'avg_mail_ms': total_mail_ms / calls if calls else 0.0,
+        }
+        for operation, (calls, total_ms, max_ms, total_queries, total_mail_ms) in _perf_stats.items()
+    }
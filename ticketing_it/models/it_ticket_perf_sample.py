@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from datetime import timedelta
+import logging
+import random
+
+from .it_ticket_metrics import track_perf
+
+_logger = logging.getLogger(__name__)
+
+# Share of instrumented calls stored as samples (ticketing_it.perf_sample_rate).
+DEFAULT_PERF_SAMPLE_RATE = 1.0
+# Samples older than this many days are purged (ticketing_it.perf_sample_retention_days).
+DEFAULT_PERF_RETENTION_DAYS = 30
+
+
+class ITTicketPerfSample(models.Model):
+    """
+    One measured call of an instrumented ticketing hot path (see
+    it_ticket_metrics.track_perf). Rows are inserted in SQL by the decorator
+    and purged by cron; the list, pivot and graph views aggregate them.
+    """
+    _name = 'it.ticket.perf.sample'
+    _description = 'IT Ticketing Performance Sample'
+    _order = 'recorded_at desc, id desc'
+    _rec_name = 'operation'
+    _log_access = False
+
+    operation = fields.Char(required=True, readonly=True, index=True)
+    model_name = fields.Char(string='Model', readonly=True)
+    record_count = fields.Integer(string='Records', readonly=True, aggregator='avg')
+    duration_ms = fields.Float(string='Duration (ms)', readonly=True, aggregator='avg')
+    query_count = fields.Integer(string='SQL Queries', readonly=True, aggregator='avg')
+    mail_ms = fields.Float(string='Mail Time (ms)', readonly=True, aggregator='avg')
+    user_id = fields.Many2one('res.users', readonly=True)
+    recorded_at = fields.Datetime(required=True, readonly=True, index=True)
+
+    @api.model
+    def _record_sample(self, operation, model_name, record_count, duration_ms, query_count, mail_ms):
+        """Store one sample, subject to ticketing_it.perf_sample_rate (0 disables sampling)."""
+        try:
+            rate = float(self.env['ir.config_parameter'].sudo().get_param(
+                'ticketing_it.perf_sample_rate', DEFAULT_PERF_SAMPLE_RATE
+            ))
+        except ValueError:
+            rate = DEFAULT_PERF_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return
+
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_perf_sample
+                   (operation, model_name, record_count, duration_ms, query_count, mail_ms, user_id, recorded_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, (operation, model_name, record_count, duration_ms, query_count, mail_ms,
+              self.env.uid, fields.Datetime.now()))
+
+    @api.model
+    def get_operation_stats(self, since=None):
+        """
+        Return per-operation call counts, duration percentiles (p50/p95/p99,
+        ms) and average query count and mail time, computed in SQL, over the
+        samples recorded since the datetime ``since`` (all when None).
+        """
+        self.check_access('read')
+        self.env.cr.execute("""
+            SELECT operation,
+                   count(*),
+                   percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY duration_ms),
+                   avg(query_count),
+                   avg(mail_ms)
+              FROM it_ticket_perf_sample
+             WHERE %(since)s::timestamp IS NULL OR recorded_at >= %(since)s::timestamp
+          GROUP BY operation
+          ORDER BY operation
+        """, {'since': since or None})
+        return [{
+            'operation': operation,
+            'calls': calls,
+            'p50_ms': percentiles[0],
+            'p95_ms': percentiles[1],
+            'p99_ms': percentiles[2],
+            'avg_queries': float(avg_queries),
+            'avg_mail_ms': avg_mail_ms,
+        } for operation, calls, percentiles, avg_queries, avg_mail_ms in self.env.cr.fetchall()]
+
+    @api.model
+    def _gc_perf_samples(self):
+        """Delete samples older than ticketing_it.perf_sample_retention_days."""
+        try:
+            days = int(self.env['ir.config_parameter'].sudo().get_param(
+                'ticketing_it.perf_sample_retention_days', DEFAULT_PERF_RETENTION_DAYS
+            ))
+        except ValueError:
+            days = DEFAULT_PERF_RETENTION_DAYS
+        self.env.cr.execute(
+            "DELETE FROM it_ticket_perf_sample WHERE recorded_at < %s",
+            (fields.Datetime.now() - timedelta(days=days),)
+        )
+        _logger.info("Performance samples purged: %s", self.env.cr.rowcount)
+
+
+class ITTicket(models.Model):
+    _inherit = 'it.ticket'
+
+    # Loaded after every other it.ticket extension, so the measured create
+    # covers numbering, SLA timers, search vectors and the state log.
+    @api.model_create_multi
+    @track_perf('create')
+    def create(self, vals_list):
+        return super().create(vals_list)
@@ -1,33 +1,115 @@
-from odoo import models
+from odoo import api, fields, models
+from odoo.tools import SQL
+import logging
 
+from .it_ticket_metrics import track_perf
 
-class ITTicketReportProcessing(models.Model):
-    _name = "it.ticket.report.processing"
-    _inherit = "it.ticket"
-    _table = "it_ticket"
-    _description = "IT Ticket Processing Report"
-    _rec_name = "name"
+_logger = logging.getLogger(__name__)
 
+# Averages stored per aggregated row; re-aggregated weighted by ticket_count.
+WEIGHTED_AVG_FIELDS = (
+    'manager_processing_days',
+    'it_processing_days',
+    'it_team_processing_days',
+    'total_resolution_time',
+)
 
-class ITTicketReportType(models.Model):
-    _name = "it.ticket.report.type"
-    _inherit = "it.ticket"
-    _table = "it_ticket"
-    _description = "IT Ticket Type Report"
-    _rec_name = "name"
 
+class ITTicketAnalytics(models.Model):
+    """
+    Read-only ticket analytics backed by a PostgreSQL materialized view.
 
-class ITTicketReportOpen(models.Model):
-    _name = "it.ticket.report.open"
-    _inherit = "it.ticket"
-    _table = "it_ticket"
-    _description = "IT Ticket Open Report"
-    _rec_name = "name"
+    Tickets are pre-aggregated by type, assignee, month and state, so the
+    reporting graphs and pivots read a handful of rows per group instead of
+    the live it.ticket table. The view is refreshed by cron.
+    """
+    _name = "it.ticket.analytics"
+    _description = "IT Ticket Analytics"
+    _auto = False
+    _rec_name = "ticket_type_id"
+    _order = "report_month desc"
 
+    ticket_type_id = fields.Many2one('it.ticket.type', string='Ticket Type', readonly=True)
+    assigned_to_id = fields.Many2one('res.users', string='Assigned To', readonly=True)
+    state = fields.Selection(
+        selection=lambda self: self.env['it.ticket']._fields['state'].selection,
+        string='Status',
+        readonly=True
+    )
+    status_category = fields.Selection(
+        [('open', 'Open'), ('closed', 'Closed')],
+        string='Status Category',
+        readonly=True
+    )
+    report_month = fields.Date(
+        string='Month',
+        readonly=True,
+        help="Month the ticket was completed, or created if it is not done yet."
+    )
+    ticket_count = fields.Integer(string='Tickets', readonly=True, aggregator='sum')
+    manager_processing_days = fields.Float(
+        string="Manager Processing (Days)", readonly=True, aggregator='avg'
+    )
+    it_processing_days = fields.Float(
+        string="IT Manager Processing (Days)", readonly=True, aggregator='avg'
+    )
+    it_team_processing_days = fields.Float(
+        string="IT Team Processing (Days)", readonly=True, aggregator='avg'
+    )
+    total_resolution_time = fields.Float(
+        string="Total Resolution Time (hours)", readonly=True, aggregator='avg'
+    )
 
-class ITTicketReportSolved(models.Model):
-    _name = "it.ticket.report.solved"
-    _inherit = "it.ticket"
-    _table = "it_ticket"
-    _description = "IT Ticket Solved Report"
-    _rec_name = "name"
\ No newline at end of file
+    def init(self):
+        self.env.cr.execute("DROP MATERIALIZED VIEW IF EXISTS %s" % self._table)
+        self.env.cr.execute("""
+            CREATE MATERIALIZED VIEW %s AS (
+                SELECT row_number() OVER (
+                           ORDER BY t.ticket_type_id, t.assigned_to_id, t.state,
+                                    date_trunc('month', COALESCE(t.done_date, t.create_date))
+                       ) AS id,
+                       t.ticket_type_id,
+                       t.assigned_to_id,
+                       t.state,
+                       t.status_category,
+                       date_trunc('month', COALESCE(t.done_date, t.create_date))::date AS report_month,
+                       count(*) AS ticket_count,
+                       avg(t.manager_processing_days) AS manager_processing_days,
+                       avg(t.it_processing_days) AS it_processing_days,
+                       avg(t.it_team_processing_days) AS it_team_processing_days,
+                       avg(t.total_resolution_time) AS total_resolution_time
+                  FROM it_ticket t
+              GROUP BY t.ticket_type_id,
+                       t.assigned_to_id,
+                       t.state,
+                       t.status_category,
+                       date_trunc('month', COALESCE(t.done_date, t.create_date))
+            )
+        """ % self._table)
+        # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+        self.env.cr.execute(
+            "CREATE UNIQUE INDEX %s_id_idx ON %s (id)" % (self._table, self._table)
+        )
+
+    @api.model
+    @track_perf('cron_refresh_analytics')
+    def _refresh_analytics(self):
+        """
+        Called by scheduled action.
+        Refresh the materialized view without blocking readers of the
+        reporting dashboards.
+        """
+        self.env['it.ticket'].flush_model()
+        self.env.cr.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY %s" % self._table)
+        self.invalidate_model()
+        _logger.info("IT ticket analytics refreshed")
+
+    def _read_group_select(self, aggregate_spec, query):
+        # Rows hold per-group averages: weight them by ticket_count so that
+        # re-grouping in graphs and pivots yields the true ticket average.
+        fname, __, func = aggregate_spec.partition(':')
+        if func == 'avg' and fname in WEIGHTED_AVG_FIELDS:
+            value = self._field_to_sql(self._table, fname, query)
+            count = self._field_to_sql(self._table, 'ticket_count', query)
+            return SQL("SUM(%s * %s) / NULLIF(SUM(%s), 0)", value, count, count)
+        return super()._read_group_select(aggregate_spec, query)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Text search configuration used to build and query it_ticket.search_vector.
+SEARCH_TS_CONFIG = 'english'
+# Number of ticket ids covered by one search vector rebuild UPDATE.
+SEARCH_REBUILD_CHUNK_SIZE = 50000
+# Ticket fields whose change requires the search vector to be rebuilt.
+SEARCH_FIELDS = ['name', 'subject', 'description', 'rejection_reason']
+
+# Tags and entities are replaced by spaces so HTML never reaches the lexer.
+STRIP_HTML_REGEX = r'<[^>]*>|&[#a-zA-Z0-9]+;'
+
+
+class ITTicket(models.Model):
+    _inherit = 'it.ticket'
+
+    search_text = fields.Char(
+        string='Full Text',
+        compute='_compute_search_text',
+        search='_search_search_text',
+        help="Searches the subject, description, rejection reason and chatter comments."
+    )
+
+    def init(self):
+        super().init()
+        # search_vector is maintained in SQL only (see _update_search_vector);
+        # the ORM has no tsvector field type.
+        self.env.cr.execute("ALTER TABLE it_ticket ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS it_ticket_search_vector_idx
+                ON it_ticket USING gin (search_vector)
+        """)
+
+    def _compute_search_text(self):
+        self.search_text = False
+
+    def _search_search_text(self, operator, value):
+        if operator not in ('=', 'ilike', 'like') or not isinstance(value, str):
+            raise UserError(_("Unsupported full text search operator %s.", operator))
+        if not value.strip():
+            return []
+        query = self.sudo()._search([])
+        query.add_where(SQL(
+            "%s @@ websearch_to_tsquery(%s::regconfig, %s)",
+            SQL.identifier(query.table, 'search_vector'), SEARCH_TS_CONFIG, value,
+        ))
+        return [('id', 'in', query)]
+
+    # =========================================================
+    # SEARCH VECTOR MAINTENANCE
+    # =========================================================
+
+    def _update_search_vector(self, where):
+        """
+        Rebuild search_vector for the tickets matched by ``where`` (an SQL
+        condition on alias ``t``) in one UPDATE.
+
+        Weights: A = number and subject, B = description, C = rejection
+        reason and chatter comments. HTML is stripped in SQL.
+        """
+        self.flush_model(SEARCH_FIELDS)
+        self.env['mail.message'].flush_model(['model', 'res_id', 'message_type', 'body'])
+        self.env.cr.execute(SQL("""
+            UPDATE it_ticket t
+               SET search_vector =
+                       setweight(to_tsvector(%(config)s::regconfig,
+                                 coalesce(t.name, '') || ' ' || coalesce(t.subject, '')), 'A')
+                    || setweight(to_tsvector(%(config)s::regconfig,
+                                 regexp_replace(coalesce(t.description, ''), %(strip)s, ' ', 'g')), 'B')
+                    || setweight(to_tsvector(%(config)s::regconfig,
+                                 coalesce(t.rejection_reason, '') || ' ' || coalesce((
+                                     SELECT string_agg(regexp_replace(m.body, %(strip)s, ' ', 'g'), ' ')
+                                       FROM mail_message m
+                                      WHERE m.model = 'it.ticket'
+                                        AND m.res_id = t.id
+                                        AND m.message_type = 'comment'
+                                 ), '')), 'C')
+             WHERE %(where)s
+        """, config=SEARCH_TS_CONFIG, strip=STRIP_HTML_REGEX, where=where))
+        return self.env.cr.rowcount
+
+    def _refresh_search_vector(self):
+        if self.ids:
+            self._update_search_vector(SQL("t.id = ANY(%s)", self.ids))
+
+    @api.model
+    def _rebuild_search_vectors(self, chunk_size=SEARCH_REBUILD_CHUNK_SIZE):
+        """Rebuild the search vector of every ticket, one UPDATE per id chunk."""
+        self.env.cr.execute("SELECT min(id), max(id) FROM it_ticket")
+        min_id, max_id = self.env.cr.fetchone()
+        if min_id is None:
+            return 0
+
+        updated = 0
+        for chunk_start in range(min_id, max_id + 1, chunk_size):
+            updated += self._update_search_vector(
+                SQL("t.id >= %s AND t.id < %s", chunk_start, chunk_start + chunk_size)
+            )
+        _logger.info("IT ticket search vectors rebuilt: %s tickets", updated)
+        return updated
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._refresh_search_vector()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if any(field in vals for field in SEARCH_FIELDS):
+            self._refresh_search_vector()
+        return res
+
+    def message_post(self, **kwargs):
+        message = super().message_post(**kwargs)
+        if message.message_type == 'comment':
+            self._refresh_search_vector()
+        return message
+
+    # =========================================================
+    # RANKED SEARCH
+    # =========================================================
+
+    @api.model
+    def _search_full_text(self, text, domain=None, limit=80, offset=0):
+        """
+        Return the tickets matching ``text`` (web search syntax: quoted
+        phrases, ``or``, ``-word``) within ``domain``, best ranked first.
+        Access rules apply.
+        """
+        if not text or not text.strip():
+            return self.browse()
+        query = self._search(list(domain or []))
+        vector = SQL.identifier(query.table, 'search_vector')
+        tsquery = SQL("websearch_to_tsquery(%s::regconfig, %s)", SEARCH_TS_CONFIG, text)
+        query.add_where(SQL("%s @@ %s", vector, tsquery))
+        query.order = SQL(
+            "ts_rank_cd(%s, %s) DESC, %s DESC",
+            vector, tsquery, SQL.identifier(query.table, 'id'),
+        )
+        query.limit = limit
+        query.offset = offset
+        self.env.cr.execute(query.select())
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
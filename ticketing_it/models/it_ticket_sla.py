@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
+from odoo.tools import frozendict, html_escape, ormcache
+from collections import defaultdict
+from datetime import timedelta
+import logging
+import threading
+
+from .it_ticket_metrics import measure_mail, track_perf
+
+_logger = logging.getLogger(__name__)
+
+# Number of breached tickets escalated per committed batch.
+SLA_BATCH_SIZE = 500
+
+# Ticket state → (policy hours field, ticket deadline field). Entering one of
+# these states starts the matching SLA timer; in_progress keeps running the
+# resolution timer started at assignment.
+SLA_STAGES = {
+    'manager_approval': ('manager_approval_hours', 'sla_manager_deadline'),
+    'it_approval': ('it_approval_hours', 'sla_it_deadline'),
+    'assigned': ('resolution_hours', 'sla_resolution_deadline'),
+}
+SLA_RUNNING_STATES = ('manager_approval', 'it_approval', 'assigned', 'in_progress')
+
+
+class ITTicketSlaPolicy(models.Model):
+    _name = 'it.ticket.sla.policy'
+    _description = 'IT Ticket SLA Policy'
+    _order = 'ticket_type_id, priority'
+
+    ticket_type_id = fields.Many2one(
+        'it.ticket.type',
+        string='Ticket Type',
+        help="Leave empty to apply to every ticket type."
+    )
+    priority = fields.Selection(
+        [('0', 'Low'), ('1', 'Normal'), ('2', 'High'), ('3', 'Urgent')],
+        help="Leave empty to apply to every priority."
+    )
+    manager_approval_hours = fields.Float(string='Line Manager Approval (hours)')
+    it_approval_hours = fields.Float(string='IT Manager Approval (hours)')
+    resolution_hours = fields.Float(string='Resolution (hours)')
+
+    @api.constrains('ticket_type_id', 'priority')
+    def _check_unique_scope(self):
+        for rec in self:
+            if self.search_count([
+                ('ticket_type_id', '=', rec.ticket_type_id.id),
+                ('priority', '=', rec.priority),
+                ('id', '!=', rec.id),
+            ]):
+                raise ValidationError(_("An SLA policy already exists for this ticket type and priority."))
+
+    @api.model
+    @ormcache()
+    def _get_policy_map(self):
+        """
+        Return ``{(ticket_type_id, priority): {hours field: hours}}``; empty
+        scope values are stored as False. Cached per registry and cleared on
+        any change to the policies.
+        """
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT ticket_type_id, priority,
+                   manager_approval_hours, it_approval_hours, resolution_hours
+              FROM it_ticket_sla_policy
+        """)
+        return frozendict({
+            (type_id or False, priority or False): frozendict({
+                'manager_approval_hours': manager_hours,
+                'it_approval_hours': it_hours,
+                'resolution_hours': resolution_hours,
+            })
+            for type_id, priority, manager_hours, it_hours, resolution_hours in self.env.cr.fetchall()
+        })
+
+    @api.model
+    def _get_stage_hours(self, ticket_type_id, priority, state):
+        """Hours allowed for ``state``, from the most specific matching policy (0 = no SLA)."""
+        if state not in SLA_STAGES:
+            return 0
+        policies = self._get_policy_map()
+        hours_field = SLA_STAGES[state][0]
+        for key in ((ticket_type_id, priority), (ticket_type_id, False), (False, priority), (False, False)):
+            policy = policies.get((key[0] or False, key[1] or False))
+            if policy:
+                return policy[hours_field] or 0
+        return 0
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+
+class ITTicket(models.Model):
+    _inherit = 'it.ticket'
+
+    sla_manager_deadline = fields.Datetime(string='Line Manager SLA Deadline', readonly=True, copy=False, index=True)
+    sla_it_deadline = fields.Datetime(string='IT Manager SLA Deadline', readonly=True, copy=False, index=True)
+    sla_resolution_deadline = fields.Datetime(string='Resolution SLA Deadline', readonly=True, copy=False, index=True)
+    sla_deadline = fields.Datetime(
+        string='SLA Deadline',
+        readonly=True,
+        copy=False,
+        help="Deadline of the SLA timer running in the current state."
+    )
+    sla_escalated = fields.Boolean(copy=False, readonly=True)
+    sla_breached = fields.Boolean(string='SLA Breached', copy=False, readonly=True)
+
+    def init(self):
+        super().init()
+        # Breach detection only scans running, not yet escalated timers, so
+        # the cron range query stays small whatever the ticket volume.
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS it_ticket_sla_pending_idx
+                ON it_ticket (sla_deadline)
+             WHERE sla_deadline IS NOT NULL
+               AND sla_escalated IS NOT TRUE
+        """)
+
+    # =========================================================
+    # SLA TIMERS
+    # =========================================================
+
+    @api.model
+    def _get_sla_vals(self, state, ticket_type_id, priority, now):
+        """Deadline values to write when a ticket enters ``state``."""
+        if state in SLA_STAGES:
+            hours = self.env['it.ticket.sla.policy']._get_stage_hours(ticket_type_id, priority, state)
+            deadline = now + timedelta(hours=hours) if hours else False
+            return {
+                SLA_STAGES[state][1]: deadline,
+                'sla_deadline': deadline,
+                'sla_escalated': False,
+            }
+        if state in SLA_RUNNING_STATES:
+            return {}
+        return {'sla_deadline': False, 'sla_escalated': False}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        now = fields.Datetime.now()
+        by_vals = defaultdict(list)
+        for rec in records:
+            sla_vals = self._get_sla_vals(rec.state, rec.ticket_type_id.id, rec.priority, now)
+            if any(sla_vals.values()):
+                by_vals[frozendict(sla_vals)].append(rec.id)
+        for sla_vals, ids in by_vals.items():
+            self.browse(ids).write(dict(sla_vals))
+        return records
+
+    def write(self, vals):
+        state_before = {rec.id: rec.state for rec in self} if 'state' in vals else {}
+        res = super().write(vals)
+        if state_before:
+            self._start_sla_timers(state_before)
+        return res
+
+    def _start_sla_timers(self, state_before):
+        """Start the timer of the new state on tickets whose state changed; one write per distinct deadline."""
+        now = fields.Datetime.now()
+        by_vals = defaultdict(list)
+        for rec in self:
+            if rec.state == state_before.get(rec.id):
+                continue
+            sla_vals = self._get_sla_vals(rec.state, rec.ticket_type_id.id, rec.priority, now)
+            if sla_vals:
+                by_vals[frozendict(sla_vals)].append(rec.id)
+        for sla_vals, ids in by_vals.items():
+            self.browse(ids).write(dict(sla_vals))
+
+    # =========================================================
+    # BREACH DETECTION (CALLED BY SCHEDULED ACTION)
+    # =========================================================
+
+    @api.model
+    @track_perf('cron_sla_breaches')
+    def check_sla_breaches(self):
+        """
+        Escalate every ticket whose running SLA timer has expired.
+
+        Breaches are found with one range scan on the partial
+        it_ticket_sla_pending_idx index, claimed with FOR UPDATE SKIP LOCKED
+        and escalated per batch: a single consolidated mail to the IT
+        managers, one chatter note per ticket and one flag write.
+        """
+        now = fields.Datetime.now()
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        escalated = 0
+
+        while True:
+            self.flush_model(['sla_deadline', 'sla_escalated'])
+            self.env.cr.execute("""
+                SELECT id
+                  FROM it_ticket
+                 WHERE sla_deadline <= %s
+                   AND sla_escalated IS NOT TRUE
+              ORDER BY sla_deadline
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, (now, SLA_BATCH_SIZE))
+            ticket_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not ticket_ids:
+                break
+
+            tickets = self.browse(ticket_ids).sudo()
+            tickets._escalate_sla_breaches()
+
+            if auto_commit:
+                self.env.cr.commit()
+            escalated += len(ticket_ids)
+
+            if len(ticket_ids) < SLA_BATCH_SIZE:
+                break
+
+        if escalated:
+            _logger.info("SLA breaches escalated: %s", escalated)
+
+    def _escalate_sla_breaches(self):
+        state_labels = dict(self._fields['state'].selection)
+        managers = self.env['it.group.resolver']._get_it_manager_users()
+        recipients = [manager.email for manager in managers if manager.email]
+
+        if recipients:
+            rows = ''.join(
+                f"<li><b>{html_escape(ticket.name)}</b> — {html_escape(state_labels.get(ticket.state, ticket.state))}"
+                f" (due {html_escape(fields.Datetime.to_string(ticket.sla_deadline))})</li>"
+                for ticket in self
+            )
+            with measure_mail():
+                self.env['mail.mail'].sudo().create({
+                    'subject': _("SLA breached on %s IT ticket(s)", len(self)),
+                    'body_html': f"<p>The following tickets have exceeded their SLA:</p><ul>{rows}</ul>",
+                    'email_to': ','.join(recipients),
+                    'email_from': self._get_from_email(),
+                })
+        else:
+            _logger.warning("SLA breaches found but no IT Manager with an email to escalate to")
+
+        self._message_log_batch(bodies={
+            ticket.id: _("SLA breached in state %s (deadline %s); escalated to IT managers.",
+                         state_labels.get(ticket.state, ticket.state),
+                         fields.Datetime.to_string(ticket.sla_deadline))
+            for ticket in self
+        })
+        self.write({'sla_escalated': True, 'sla_breached': True})
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+# Dimensions accepted by get_dwell_time_stats → snapshot column of the log.
+DWELL_GROUP_COLUMNS = {
+    'ticket_type': 'ticket_type_id',
+    'assignee': 'assigned_to_id',
+}
+
+
+class ITTicketStateLog(models.Model):
+    _name = 'it.ticket.state.log'
+    _description = 'IT Ticket State Transition'
+    _order = 'entered_at desc, id desc'
+    _rec_name = 'ticket_id'
+    _log_access = False
+
+    ticket_id = fields.Many2one('it.ticket', required=True, readonly=True, ondelete='cascade')
+    from_state = fields.Selection(selection='_get_state_selection', readonly=True)
+    to_state = fields.Selection(selection='_get_state_selection', required=True, readonly=True)
+    entered_at = fields.Datetime(required=True, readonly=True, index=True)
+    user_id = fields.Many2one('res.users', string='Changed By', readonly=True)
+    # Snapshots taken at the transition, so reports group by the values
+    # the ticket had while it sat in ``to_state``.
+    ticket_type_id = fields.Many2one('it.ticket.type', readonly=True)
+    assigned_to_id = fields.Many2one('res.users', string='Assigned To', readonly=True)
+
+    def init(self):
+        super().init()
+        # Ordered per-ticket scans for the dwell time window functions
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS it_ticket_state_log_ticket_entered_idx
+                ON it_ticket_state_log (ticket_id, entered_at, id)
+        """)
+
+    @api.model
+    def _get_state_selection(self):
+        return self.env['it.ticket']._fields['state'].selection
+
+    def write(self, vals):
+        raise UserError(_("The ticket state history is append-only."))
+
+    @api.model
+    def _log_transitions(self, tickets, from_states=None):
+        """
+        Append one row per ticket in ``tickets`` with one INSERT.
+
+        ``from_states`` maps ticket ids to their previous state (missing for
+        newly created tickets); the new state and the snapshots are read from
+        the tickets themselves.
+        """
+        if not tickets:
+            return
+        from_states = from_states or {}
+        self.env.cr.execute("""
+            INSERT INTO it_ticket_state_log
+                   (ticket_id, from_state, to_state, entered_at, user_id, ticket_type_id, assigned_to_id)
+            SELECT t.ticket_id, t.from_state, t.to_state, %(now)s, %(user_id)s,
+                   nullif(t.ticket_type_id, 0), nullif(t.assigned_to_id, 0)
+              FROM unnest(%(ticket_ids)s::int[], %(from_states)s::varchar[], %(to_states)s::varchar[],
+                          %(ticket_type_ids)s::int[], %(assigned_to_ids)s::int[])
+                   AS t(ticket_id, from_state, to_state, ticket_type_id, assigned_to_id)
+        """, {
+            'now': fields.Datetime.now(),
+            'user_id': self.env.uid,
+            'ticket_ids': tickets.ids,
+            'from_states': [from_states.get(ticket.id) for ticket in tickets],
+            'to_states': [ticket.state for ticket in tickets],
+            'ticket_type_ids': [ticket.ticket_type_id.id or 0 for ticket in tickets],
+            'assigned_to_ids': [ticket.assigned_to_id.id or 0 for ticket in tickets],
+        })
+        self.invalidate_model()
+
+    @api.model
+    def get_dwell_time_stats(self, group_by='ticket_type', date_from=None, date_to=None):
+        """
+        Time spent per state, in hours, grouped by ticket type or assignee.
+
+        Each log row is one stay in ``to_state`` that ends at the ticket's
+        next row; stays still in progress have no duration and are left
+        out of the percentiles. ``date_from``/``date_to`` (datetimes) bound
+        the time the stay started. Returns a list of dicts with keys ``state``,
+        ``group_id``, ``stays``, ``reentries``, ``p50``, ``p90``, ``p99``.
+        """
+        self.check_access('read')
+        if group_by not in DWELL_GROUP_COLUMNS:
+            raise UserError(_("Unsupported grouping %s.", group_by))
+        group_column = SQL.identifier('l', DWELL_GROUP_COLUMNS[group_by])
+
+        self.env.cr.execute(SQL("""
+            WITH stays AS (
+                SELECT l.to_state,
+                       %(group_column)s AS group_id,
+                       l.entered_at,
+                       EXTRACT(EPOCH FROM lead(l.entered_at) OVER (
+                           PARTITION BY l.ticket_id ORDER BY l.entered_at, l.id
+                       ) - l.entered_at) / 3600 AS hours,
+                       row_number() OVER (
+                           PARTITION BY l.ticket_id, l.to_state ORDER BY l.entered_at, l.id
+                       ) AS entry
+                  FROM it_ticket_state_log l
+                 WHERE %(date_from)s::timestamp IS NULL OR l.entered_at >= %(date_from)s::timestamp
+            )
+            SELECT to_state,
+                   group_id,
+                   count(hours) AS stays,
+                   count(*) FILTER (WHERE entry > 1) AS reentries,
+                   percentile_cont(ARRAY[0.5, 0.9, 0.99]) WITHIN GROUP (ORDER BY hours) AS percentiles
+              FROM stays
+             WHERE %(date_to)s::timestamp IS NULL OR entered_at < %(date_to)s::timestamp
+          GROUP BY to_state, group_id
+          ORDER BY to_state, group_id
+        """, group_column=group_column, date_from=date_from or None, date_to=date_to or None))
+
+        return [{
+            'state': state,
+            'group_id': group_id,
+            'stays': stays,
+            'reentries': reentries,
+            'p50': percentiles[0] if percentiles else None,
+            'p90': percentiles[1] if percentiles else None,
+            'p99': percentiles[2] if percentiles else None,
+        } for state, group_id, stays, reentries, percentiles in self.env.cr.fetchall()]
+
+
+class ITTicket(models.Model):
+    _inherit = 'it.ticket'
+
+    state_log_ids = fields.One2many('it.ticket.state.log', 'ticket_id', string='State History')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['it.ticket.state.log'].sudo()._log_transitions(records)
+        return records
+
+    def write(self, vals):
+        if 'state' not in vals:
+            return super().write(vals)
+        state_before = {rec.id: rec.state for rec in self}
+        res = super().write(vals)
+        changed = self.filtered(lambda rec: rec.state != state_before[rec.id])
+        self.env['it.ticket.state.log'].sudo()._log_transitions(changed, state_before)
+        return res
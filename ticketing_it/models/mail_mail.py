@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from datetime import timedelta
+import logging
+import threading
+
+from .it_ticket_metrics import measure_mail, track_perf
+
+_logger = logging.getLogger(__name__)
+
+# Ticket mails delivered per committed sender batch.
+TICKET_MAIL_BATCH_SIZE = 100
+# Delivery attempts after the first failure, and the base of the
+# exponential backoff between them (5, 10, 20 minutes).
+TICKET_MAIL_MAX_RETRIES = 3
+TICKET_MAIL_RETRY_MINUTES = 5
+# Failures a retry cannot fix (bad or missing recipient address).
+TICKET_MAIL_PERMANENT_FAILURES = ('mail_email_invalid', 'mail_email_missing')
+
+
+class MailMail(models.Model):
+    _inherit = 'mail.mail'
+
+    ticket_retry_count = fields.Integer(default=0, copy=False)
+
+    @api.model
+    @track_perf('cron_ticket_mail_queue')
+    def _process_ticket_mail_queue(self):
+        """
+        Dedicated sender for IT ticket notifications, triggered after the
+        transaction that queued them commits.
+
+        Mails are sent in batches through mail.mail.send(), which groups
+        them per mail server and reuses one SMTP connection per group.
+        Mails that failed on a transient error are re-queued with
+        exponential backoff up to TICKET_MAIL_MAX_RETRIES times.
+        """
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        cron = self.env.ref('ticketing_it.ir_cron_ticket_mail_queue', raise_if_not_found=False)
+        self._retry_failed_ticket_mails(cron)
+
+        domain = [
+            ('model', '=', 'it.ticket'),
+            ('state', '=', 'outgoing'),
+            '|', ('scheduled_date', '=', False), ('scheduled_date', '<=', fields.Datetime.now()),
+        ]
+        sent = 0
+        while True:
+            mails = self.sudo().search(domain, limit=TICKET_MAIL_BATCH_SIZE)
+            if not mails:
+                break
+            with measure_mail():
+                mails.send(auto_commit=auto_commit)
+            sent += len(mails)
+            if not auto_commit:
+                break
+            self.env.cr.commit()
+
+        if sent:
+            _logger.info("Ticket mail queue: %s mail(s) processed", sent)
+
+    @api.model
+    def _retry_failed_ticket_mails(self, cron=None):
+        failed = self.sudo().search([
+            ('model', '=', 'it.ticket'),
+            ('state', '=', 'exception'),
+            ('ticket_retry_count', '<', TICKET_MAIL_MAX_RETRIES),
+            ('failure_type', 'not in', TICKET_MAIL_PERMANENT_FAILURES),
+        ])
+        if not failed:
+            return
+
+        now = fields.Datetime.now()
+        for retry_count in set(failed.mapped('ticket_retry_count')):
+            mails = failed.filtered(lambda m: m.ticket_retry_count == retry_count)
+            retry_at = now + timedelta(minutes=TICKET_MAIL_RETRY_MINUTES * 2 ** retry_count)
+            mails.write({
+                'state': 'outgoing',
+                'failure_type': False,
+                'failure_reason': False,
+                'scheduled_date': retry_at,
+                'ticket_retry_count': retry_count + 1,
+            })
+            if cron:
+                cron._trigger(at=retry_at)
+
+        _logger.warning("Ticket mail queue: %s failed mail(s) re-queued", len(failed))
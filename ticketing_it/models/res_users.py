@@ -1,4 +1,5 @@
 from odoo import models, api, SUPERUSER_ID
+from .it_group_resolver import USER_GROUP_FIELDS
 import requests
 import logging
 
@@ -8,6 +9,27 @@ _logger = logging.getLogger(__name__)
 class ResUsers(models.Model):
     _inherit = 'res.users'
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        users = super().create(vals_list)
+        # Only new IT staff change the cached membership
+        if users.sudo().group_ids & self.env['it.group.resolver']._get_it_groups():
+            self.env['it.group.resolver']._invalidate_group_cache()
+        return users
+
+    def write(self, vals):
+        res = super().write(vals)
+        if USER_GROUP_FIELDS.intersection(vals):
+            self.env['it.group.resolver']._invalidate_group_cache()
+        return res
+
+    def unlink(self):
+        cached = self.env['it.group.resolver']._get_cached_user_ids().intersection(self.ids)
+        res = super().unlink()
+        if cached:
+            self.env['it.group.resolver']._invalidate_group_cache()
+        return res
+
     def _auth_oauth_validate(self, provider, access_token):
         headers = {'Authorization': f'Bearer {access_token}'}
         response = requests.get(
@@ -54,4 +76,19 @@ class ResUsers(models.Model):
             })
 
         _logger.info("Azure SSO: Existing user login success: %s", email)
-        return super()._auth_oauth_signin(provider, validation, params)
\ No newline at end of file
+        return super()._auth_oauth_signin(provider, validation, params)
+
+
+class ResGroups(models.Model):
+    _inherit = 'res.groups'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'user_ids' in vals or 'implied_ids' in vals:
+            self.env['it.group.resolver']._invalidate_group_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['it.group.resolver']._invalidate_group_cache()
+        return res
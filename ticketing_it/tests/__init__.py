@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+from . import test_portal_pagination
+from . import test_ticket_approval
+from . import test_benchmark_durations
+from . import test_benchmark_create
+from . import test_benchmark_search
+from . import test_mail_queue
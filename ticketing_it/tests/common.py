@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Helpers shared by the opt-in benchmarks (``--test-tags benchmark``)."""
+
+# Words the synthetic subjects and descriptions are drawn from
+SYNTHETIC_WORDS = [
+    'laptop', 'printer', 'network', 'vpn', 'password', 'email', 'outlook', 'monitor',
+    'keyboard', 'license', 'install', 'upgrade', 'crash', 'slow', 'access', 'wifi',
+    'server', 'backup', 'phone', 'teams', 'browser', 'account', 'locked', 'screen',
+]
+
+
+def seed_tickets(env, count, employee, ticket_type):
+    """
+    Insert ``count`` resolved tickets of ``employee`` in one INSERT ...
+    SELECT and return their ids.
+
+    The ORM is bypassed on purpose: only the columns the benchmarks read
+    are filled (stored computes, counters and search vectors are left to
+    the code under test). Dates are spread over the last three years.
+    """
+    env['it.ticket'].flush_model()
+    env.cr.execute("""
+        INSERT INTO it_ticket
+               (name, employee_id, ticket_type_id, priority, state, subject, description,
+                create_uid, write_uid, create_date, write_date,
+                submitted_date, manager_approval_date, it_approval_date, done_date)
+        SELECT 'BENCH/' || n, %(employee_id)s, %(type_id)s, '1', 'done',
+               'Ticket ' || w[1 + n %% cardinality(w)] || ' ' || w[1 + (n / 7) %% cardinality(w)],
+               '<p>The <b>' || w[1 + (n / 3) %% cardinality(w)] || '</b> does not work after the '
+                   || w[1 + (n / 11) %% cardinality(w)] || '.</p>',
+               %(uid)s, %(uid)s, c, c,
+               c + interval '10 minutes', c + interval '5 hours', c + interval '1 day', c + interval '3 days'
+          FROM generate_series(1, %(count)s) AS n,
+               LATERAL (SELECT now() at time zone 'UTC' - (n %% 1095) * interval '1 day' AS c) AS d,
+               LATERAL (SELECT %(words)s::varchar[] AS w) AS words
+     RETURNING id
+    """, {
+        'employee_id': employee.id,
+        'type_id': ticket_type.id,
+        'uid': env.uid,
+        'count': count,
+        'words': SYNTHETIC_WORDS,
+    })
+    ids = [row[0] for row in env.cr.fetchall()]
+    env['it.ticket'].invalidate_model()
+    return ids
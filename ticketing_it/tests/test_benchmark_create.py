@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+import logging
+import time
+
+_logger = logging.getLogger(__name__)
+
+# Batch sizes whose creation throughput is reported
+BENCHMARK_BATCH_SIZES = (1, 100, 10000)
+
+
+@tagged('-standard', 'benchmark')
+class TestTicketCreateBenchmark(TransactionCase):
+    """Ticket creation throughput per batch size; run with ``--test-tags benchmark``."""
+
+    def test_batch_create_throughput(self):
+        Ticket = self.env['it.ticket']
+        employee = self.env['hr.employee'].create({'name': 'Benchmark Employee'})
+        ticket_type = self.env.ref('ticketing_it.type_software')
+
+        def vals_list(size):
+            return [{
+                'employee_id': employee.id,
+                'ticket_type_id': ticket_type.id,
+                'subject': 'Benchmark ticket %s' % index,
+                'description': '<p>Benchmark ticket %s</p>' % index,
+            } for index in range(size)]
+
+        # Warm up the registry caches and the sequence
+        Ticket.create(vals_list(1))
+        self.env.flush_all()
+
+        for size in BENCHMARK_BATCH_SIZES:
+            batch = vals_list(size)
+            start = time.perf_counter()
+            tickets = Ticket.create(batch)
+            self.env.flush_all()
+            elapsed = time.perf_counter() - start
+
+            self.assertEqual(len(set(tickets.mapped('name'))), size)
+            _logger.info(
+                "Created %s ticket(s) in one batch in %.3fs: %.0f tickets/s",
+                size, elapsed, size / elapsed
+            )
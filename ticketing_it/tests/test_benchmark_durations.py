@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+import logging
+import time
+
+from odoo.addons.ticketing_it.models.it_ticket import PROCESSING_DURATION_FIELDS
+from .common import seed_tickets
+
+_logger = logging.getLogger(__name__)
+
+# Synthetic tickets recomputed by the benchmark
+BENCHMARK_TICKETS = 100000
+
+
+@tagged('-standard', 'benchmark')
+class TestDurationRecomputeBenchmark(TransactionCase):
+    """Wall time of the processing duration recompute; run with ``--test-tags benchmark``."""
+
+    def test_recompute_processing_durations(self):
+        employee = self.env['hr.employee'].create({'name': 'Benchmark Employee'})
+        ticket_ids = seed_tickets(self.env, BENCHMARK_TICKETS, employee, self.env.ref('ticketing_it.type_hardware'))
+        tickets = self.env['it.ticket'].browse(ticket_ids)
+
+        # ORM path: one batched compute pass over the prefetched date columns
+        start = time.perf_counter()
+        for name in PROCESSING_DURATION_FIELDS:
+            self.env.add_to_compute(tickets._fields[name], tickets)
+        tickets.flush_model(PROCESSING_DURATION_FIELDS)
+        orm_time = time.perf_counter() - start
+
+        # SQL path, from cleared columns so that every row is rewritten
+        self.env.cr.execute(
+            "UPDATE it_ticket SET %s WHERE id = ANY(%%s)"
+            % ', '.join('%s = NULL' % name for name in PROCESSING_DURATION_FIELDS),
+            (ticket_ids,)
+        )
+        self.env['it.ticket'].invalidate_model(PROCESSING_DURATION_FIELDS)
+        start = time.perf_counter()
+        updated = self.env['it.ticket']._recompute_processing_durations_sql()
+        sql_time = time.perf_counter() - start
+
+        self.assertGreaterEqual(updated, BENCHMARK_TICKETS)
+        self.assertAlmostEqual(tickets[0].it_team_processing_days, 2.0)
+        _logger.info(
+            "Processing durations of %s tickets recomputed: ORM %.2fs, SQL %.2fs",
+            BENCHMARK_TICKETS, orm_time, sql_time
+        )
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+import logging
+import time
+
+from .common import seed_tickets
+
+_logger = logging.getLogger(__name__)
+
+# Synthetic tickets searched by the benchmark
+BENCHMARK_TICKETS = 500000
+# Search terms timed with both strategies
+BENCHMARK_TERMS = ('printer', 'vpn', 'outlook crash')
+# Results fetched per search, as on the first page of the list view
+BENCHMARK_LIMIT = 80
+
+
+@tagged('-standard', 'benchmark')
+class TestTicketSearchBenchmark(TransactionCase):
+    """Ranked full text search vs ilike; run with ``--test-tags benchmark``."""
+
+    def test_full_text_vs_ilike(self):
+        Ticket = self.env['it.ticket']
+        employee = self.env['hr.employee'].create({'name': 'Benchmark Employee'})
+        seed_tickets(self.env, BENCHMARK_TICKETS, employee, self.env.ref('ticketing_it.type_software'))
+        Ticket._rebuild_search_vectors()
+        self.env.cr.execute("ANALYZE it_ticket")
+
+        def timed(search):
+            start = time.perf_counter()
+            tickets = search()
+            return tickets, time.perf_counter() - start
+
+        for term in BENCHMARK_TERMS:
+            ranked, ranked_time = timed(lambda: Ticket._search_full_text(term, limit=BENCHMARK_LIMIT))
+            words = [('|', ('subject', 'ilike', word), ('description', 'ilike', word)) for word in term.split()]
+            domain = [leaf for condition in words for leaf in condition]
+            domain = ['&'] * (len(words) - 1) + domain
+            plain, ilike_time = timed(lambda: Ticket.search(domain, limit=BENCHMARK_LIMIT))
+
+            self.assertTrue(ranked)
+            self.assertEqual(len(ranked), len(plain))
+            _logger.info(
+                "Search %r over %s tickets: ranked full text %.1fms, ilike %.1fms",
+                term, BENCHMARK_TICKETS, ranked_time * 1000, ilike_time * 1000
+            )
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestTicketMailQueue(TransactionCase):
+
+    def test_only_transient_failures_are_retried(self):
+        mails = self.env['mail.mail'].create([{
+            'subject': 'Ticket mail %s' % failure_type,
+            'body_html': '<p>Ticket mail</p>',
+            'email_to': 'employee@example.com',
+            'model': 'it.ticket',
+            'state': 'exception',
+            'failure_type': failure_type,
+        } for failure_type in ('mail_smtp', 'mail_email_invalid', 'mail_email_missing')])
+
+        self.env['mail.mail']._retry_failed_ticket_mails()
+
+        self.assertEqual(mails.mapped('state'), ['outgoing', 'exception', 'exception'])
+        self.assertEqual(mails.mapped('ticket_retry_count'), [1, 0, 0])
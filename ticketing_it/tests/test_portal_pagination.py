@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestPortalPagination(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env['hr.employee'].create({'name': 'Portal Employee'})
+        cls.ticket_type = cls.env.ref('ticketing_it.type_software')
+
+    def test_page_through_batch_created_tickets(self):
+        """Tickets created in one create() share their create_date and must all be listed."""
+        tickets = self.env['it.ticket'].create([{
+            'employee_id': self.employee.id,
+            'ticket_type_id': self.ticket_type.id,
+            'subject': 'Batch ticket %s' % index,
+            'description': '<p>Batch ticket</p>',
+        } for index in range(5)])
+        self.assertEqual(len(set(tickets.mapped('create_date'))), 1)
+
+        Ticket = self.env['it.ticket']
+        domain = [('employee_id', '=', self.employee.id)]
+        seen = Ticket
+        cursor = None
+        for _page in range(len(tickets) + 1):
+            page, cursor = Ticket._portal_ticket_page(domain, sortby='date', after=cursor, limit=1)
+            self.assertEqual(len(page), 1)
+            seen |= page
+            if not cursor:
+                break
+
+        self.assertIsNone(cursor)
+        self.assertEqual(seen, tickets)
+
+    def test_malformed_cursor_restarts(self):
+        self.assertIsNone(self.env['it.ticket']._decode_portal_cursor('not a date,12'))
+        self.assertIsNone(self.env['it.ticket']._decode_portal_cursor('garbage'))
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from odoo.exceptions import AccessError, UserError
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+# Tickets per batch compared against a single ticket
+BATCH_SIZE = 10
+
+
+@tagged('post_install', '-at_install')
+class TestTicketApproval(TransactionCase):
+    """
+    Approving or rejecting a batch must cost no more queries than handling
+    one ticket. Each ticket belongs to a different employee, so the employee
+    notifications go through the single-ticket template for every ticket.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.line_manager = new_test_user(
+            cls.env, 'ticket_line_manager', 'base.group_user,ticketing_it.group_line_manager',
+            email='line.manager@example.com',
+        )
+        cls.it_manager = new_test_user(
+            cls.env, 'ticket_it_manager', 'base.group_user,ticketing_it.group_it_manager',
+            email='it.manager@example.com',
+        )
+        cls.it_member = new_test_user(
+            cls.env, 'ticket_it_member', 'base.group_user,ticketing_it.group_it_team',
+            email='it.member@example.com',
+        )
+        manager_employee = cls.env['hr.employee'].create({
+            'name': 'Line Manager',
+            'user_id': cls.line_manager.id,
+            'work_email': cls.line_manager.email,
+        })
+        users = [
+            new_test_user(cls.env, 'ticket_employee_%s' % index, 'base.group_user',
+                          email='employee%s@example.com' % index)
+            for index in range(2 * (BATCH_SIZE + 2))
+        ]
+        cls.employees = cls.env['hr.employee'].create([{
+            'name': user.name,
+            'user_id': user.id,
+            'parent_id': manager_employee.id,
+        } for user in users])
+        cls.ticket_type = cls.env.ref('ticketing_it.type_software')
+        cls.next_employee = 0
+
+    def _create_tickets(self, count, state='manager_approval'):
+        employees = self.employees[self.next_employee:self.next_employee + count]
+        self.next_employee = (self.next_employee + count) % len(self.employees)
+        tickets = self.env['it.ticket'].create([{
+            'employee_id': employee.id,
+            'ticket_type_id': self.ticket_type.id,
+            'subject': 'Approval ticket of %s' % employee.name,
+            'description': '<p>Please approve</p>',
+            'it_manager_id': self.it_manager.id,
+        } for employee in employees])
+        if state != 'manager_approval':
+            tickets.write({'state': state})
+        return tickets
+
+    def _count_queries(self, func):
+        self.env.flush_all()
+        self.env.invalidate_all()
+        count = self.cr.sql_log_count
+        func()
+        self.env.flush_all()
+        return self.cr.sql_log_count - count
+
+    def _assert_constant_queries(self, user, state, action):
+        """Run ``action(tickets)`` as ``user`` on one ticket, then on a batch within the same query count."""
+        # Warm up the registry caches (group resolver, templates, ...)
+        action(self._create_tickets(1, state).with_user(user))
+        single = self._create_tickets(1, state).with_user(user)
+        batch = self._create_tickets(BATCH_SIZE, state).with_user(user)
+
+        queries = self._count_queries(lambda: action(single))
+        self.env.invalidate_all()
+        with self.assertQueryCount(queries):
+            action(batch)
+        return batch
+
+    def test_line_manager_approve_query_count(self):
+        tickets = self._assert_constant_queries(
+            self.line_manager, 'manager_approval', lambda tickets: tickets.do_approve("Fine by me"))
+        self.assertEqual(set(tickets.mapped('state')), {'it_approval'})
+        activities = self.env['mail.activity'].search([('res_model', '=', 'it.ticket'), ('res_id', 'in', tickets.ids)])
+        self.assertEqual(len(activities), BATCH_SIZE)
+        self.assertEqual(set(activities.mapped('user_id')), {self.it_manager})
+        self.assertIn(tickets[0].name, tickets[0].activity_ids.summary)
+
+    def test_it_manager_approve_query_count(self):
+        tickets = self._assert_constant_queries(
+            self.it_manager, 'it_approval', lambda tickets: tickets.do_approve())
+        self.assertEqual(set(tickets.mapped('state')), {'assigned'})
+        self.assertEqual(tickets.assigned_to_id, self.it_member)
+
+    def test_reject_query_count(self):
+        tickets = self._assert_constant_queries(
+            self.line_manager, 'manager_approval', lambda tickets: tickets.do_reject("Not needed"))
+        self.assertEqual(set(tickets.mapped('state')), {'rejected'})
+        self.assertEqual(tickets.rejected_by_id, self.line_manager)
+
+    def test_approval_comment_is_public(self):
+        ticket = self._create_tickets(1)
+        ticket.with_user(self.line_manager).do_approve("Looks good")
+        message = ticket.message_ids.filtered(lambda m: 'Looks good' in (m.body or ''))
+        self.assertEqual(len(message), 1)
+        self.assertEqual(message.message_type, 'comment')
+        self.assertEqual(message.subtype_id, self.env.ref('mail.mt_comment'))
+        self.assertFalse(message.is_internal)
+
+    def test_approval_errors(self):
+        """Approvals by the wrong user are access errors; tickets in the wrong state are workflow errors."""
+        ticket = self._create_tickets(1)
+        with self.assertRaises(AccessError):
+            ticket.with_user(self.it_member).do_approve()
+        ticket.with_user(self.line_manager).do_reject("Not needed")
+        with self.assertRaises(UserError) as error:
+            ticket.with_user(self.line_manager).do_approve()
+        self.assertNotIsInstance(error.exception, AccessError)
+
+    def test_grouped_mail_subject_counts_recipient_tickets(self):
+        other_it_manager = new_test_user(
+            self.env, 'ticket_it_manager_2', 'base.group_user,ticketing_it.group_it_manager',
+            email='it.manager2@example.com',
+        )
+        tickets = self._create_tickets(6)
+        tickets[3:].write({'it_manager_id': other_it_manager.id})
+        tickets.with_user(self.line_manager).do_approve()
+
+        mails = self.env['mail.mail'].search([
+            ('email_to', 'in', [self.it_manager.email, other_it_manager.email]),
+            ('subject', 'like', 'IT Approval Required'),
+        ])
+        self.assertEqual(len(mails), 2)
+        self.assertEqual(set(mails.mapped('subject')), {'IT Approval Required: 3 tickets'})
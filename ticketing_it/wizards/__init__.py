@@ -1,4 +1,5 @@
 from . import reject_wizard
 from . import approve_wizard
 from . import it_reminder_config_wizard
-from . import duration_config_wizard
\ No newline at end of file
+from . import duration_config_wizard
+from . import assignment_config_wizard
\ No newline at end of file
@@ -0,0 +1,31 @@
+from odoo import models, fields, api
+
+from ..models.it_ticket_assignment import ASSIGNMENT_STRATEGIES, DEFAULT_ASSIGNMENT_STRATEGY
+
+
+class ITAssignmentConfigWizard(models.TransientModel):
+    _name = 'it.assignment.config.wizard'
+    _description = 'IT Ticket Assignment Configuration'
+
+    strategy = fields.Selection(
+        ASSIGNMENT_STRATEGIES,
+        string="Assignment Strategy",
+        default=DEFAULT_ASSIGNMENT_STRATEGY,
+        required=True,
+        help="How directly-routed (workflow level 0) tickets are assigned to the IT team.\n"
+             "Least Loaded: member with the fewest assigned/in progress tickets.\n"
+             "Round Robin: member who received a ticket the longest time ago.\n"
+             "Skill by Ticket Type: least loaded among the technicians set on the ticket type."
+    )
+
+    @api.model
+    def default_get(self, fields_list):
+        res = super().default_get(fields_list)
+        res['strategy'] = self.env['it.ticket.assignment']._get_strategy()
+        return res
+
+    def action_save(self):
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('ticketing_it.assignment_strategy', self.strategy)
+
+        return {'type': 'ir.actions.act_window_close'}
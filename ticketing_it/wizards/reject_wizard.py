@@ -1,13 +1,20 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields
+from odoo import models, fields, _
+from odoo.exceptions import UserError
 
 
 class ITTicketRejectWizard(models.TransientModel):
     _name = 'it.ticket.reject.wizard'
     _description = 'Reject Ticket Wizard'
 
-    ticket_id = fields.Many2one('it.ticket', 'Ticket', required=True)
+    def _default_ticket_ids(self):
+        if self.env.context.get('active_model') == 'it.ticket':
+            return self.env['it.ticket'].browse(self.env.context.get('active_ids', []))
+        return self.env['it.ticket']
+
+    ticket_id = fields.Many2one('it.ticket', 'Ticket')
+    ticket_ids = fields.Many2many('it.ticket', string='Tickets', default=_default_ticket_ids)
     rejection_reason = fields.Text('Rejection Reason', required=True)
 
     def action_reject(self):
@@ -15,5 +22,8 @@ class ITTicketRejectWizard(models.TransientModel):
         # calling user (e.g. line manager) only has limited ACL rights on
         # it.ticket.  Security is enforced inside do_reject() via
         # _check_reject_access(), so sudo() here does not bypass any checks.
-        self.ticket_id.sudo().do_reject(self.rejection_reason)
-        return {'type': 'ir.actions.act_window_close'}
\ No newline at end of file
+        tickets = self.ticket_ids | self.ticket_id
+        if not tickets:
+            raise UserError(_("Select at least one ticket to reject."))
+        tickets.sudo().do_reject(self.rejection_reason)
+        return {'type': 'ir.actions.act_window_close'}